@@ -1,6 +1,9 @@
 from django.contrib import admin
-from .models import Profile, PendingUser
+from .models import Profile, PendingUser, EmailOutbox, OtpChallenge, ImageVariantTask
 
 # Register your models here.
 admin.site.register(Profile)
 admin.site.register(PendingUser)
+admin.site.register(EmailOutbox)
+admin.site.register(OtpChallenge)
+admin.site.register(ImageVariantTask)
@@ -0,0 +1,23 @@
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import CLAIMS, VERSION_CLAIM, ClaimsUser, claims_version
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that trusts the role / profile claims of a token while
+    its claims_version is current, instead of loading User on every request.
+    Tokens without claims or with an outdated version take the stock path, as
+    does every token unless settings.TOKEN_CLAIMS_CACHE is set.
+    """
+
+    def get_user(self, validated_token):
+        if settings.TOKEN_CLAIMS_CACHE and all(claim in validated_token for claim in CLAIMS):
+            user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+            if user_id is not None and validated_token[VERSION_CLAIM] == claims_version(user_id):
+                # the row as it is, so a lazily read is_active reports the truth instead of raising
+                return ClaimsUser(validated_token, lambda: self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id}))
+
+        return super().get_user(validated_token)
@@ -1,26 +1,53 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
 
 User = get_user_model()
 
 
+def login_candidates(username):
+    """
+    Users whose username or email equals `username`, ignoring case, as one
+    query on the LOWER() indexes of auth_user (accounts migration 0011).
+    Emails always contain "@", so username-shaped input only reads the
+    username index.
+    """
+    value = Lower(Value(username))
+    match = Q(username_lower=value)
+    if "@" in username:
+        match |= Q(email_lower=value)
+    return (
+        User.objects
+        .alias(username_lower=Lower("username"), email_lower=Lower("email"))
+        .filter(match)
+    )
+
+
 class UsernameOrEmailBackend(ModelBackend):
     """
     Authenticate using either username or email.
+
+    The only backend in AUTHENTICATION_BACKENDS, so every attempt is one
+    lookup and one password hash, found or not.
     """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
         if username is None or password is None:
             return None
 
-        try:
-            user = User.objects.get(
-                Q(username__iexact=username) | Q(email__iexact=username)
-            )
-        except User.DoesNotExist:
+        candidates = list(login_candidates(username).order_by("pk")[:2])
+        if not candidates:
+            # same hashing cost as a wrong password, so timing does not reveal accounts
+            User().set_password(password)
             return None
 
+        # a username match wins over another account's email
+        lowered = username.lower()
+        user = next((u for u in candidates if u.username.lower() == lowered), candidates[0])
+
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
 
@@ -0,0 +1,115 @@
+"""
+Refresh-token blacklist: cache front and pruning.
+
+With ROTATE_REFRESH_TOKENS and BLACKLIST_AFTER_ROTATION every refresh adds
+an OutstandingToken and a BlacklistedToken row, and every refresh token is
+checked against the blacklist before use. CachedBlacklistMixin records each
+refresh token's state in the cache when it is issued or revoked, so the
+check is a cache read and only tokens the cache does not know about (issued
+before it was enabled, or evicted) are looked up in the database. The
+database stays the record of revocations; the cache is only trusted when it
+is shared by all workers (settings.TOKEN_BLACKLIST_CACHE).
+
+Expired rows are useless, since an expired token fails verification anyway;
+prune_expired_tokens deletes them in batches:
+
+    python manage.py prune_token_blacklist
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+ACTIVE = "active"
+REVOKED = "revoked"
+
+
+def _state_key(jti):
+    return f"auth:refresh:{jti}"
+
+
+def _remaining(exp):
+    return max(1, int(exp - timezone.now().timestamp()))
+
+
+def remember_state(jti, exp, state):
+    if not settings.TOKEN_BLACKLIST_CACHE:
+        return
+    if state == REVOKED:
+        cache.set(_state_key(jti), REVOKED, timeout=_remaining(exp))
+    else:
+        # never overwrites a revocation that raced ahead
+        cache.add(_state_key(jti), ACTIVE, timeout=_remaining(exp))
+
+
+def cached_state(jti):
+    if not settings.TOKEN_BLACKLIST_CACHE:
+        return None
+    return cache.get(_state_key(jti))
+
+
+class CachedBlacklistMixin:
+    """
+    For RefreshToken subclasses: blacklist checks answered from the cache,
+    and blacklist() / outstand() without the User lookup of the stock
+    versions (the user id is in the token).
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        state = cached_state(jti)
+        if state == REVOKED:
+            raise TokenError("Token is blacklisted")
+        if state == ACTIVE:
+            return
+        super().check_blacklist()
+        remember_state(jti, self.payload["exp"], ACTIVE)
+
+    def _outstanding(self):
+        return OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults={
+                "user_id": self.payload.get(api_settings.USER_ID_CLAIM),
+                "created_at": self.current_time,
+                "token": str(self),
+                "expires_at": datetime_from_epoch(self.payload["exp"]),
+            },
+        )
+
+    def outstand(self):
+        outstanding = self._outstanding()
+        remember_state(self.payload[api_settings.JTI_CLAIM], self.payload["exp"], ACTIVE)
+        return outstanding
+
+    def blacklist(self):
+        blacklisted = BlacklistedToken.objects.get_or_create(token=self._outstanding()[0])
+        remember_state(self.payload[api_settings.JTI_CLAIM], self.payload["exp"], REVOKED)
+        return blacklisted
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        remember_state(token[api_settings.JTI_CLAIM], token["exp"], ACTIVE)
+        return token
+
+
+def prune_expired_tokens(batch_size=5000):
+    """
+    Delete expired outstanding tokens (and their blacklist entries) in batches
+    by expires_at. Yields the outstanding tokens deleted per batch.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+
+    while True:
+        pks = list(expired.order_by('expires_at').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=pks).delete()
+            deleted, _ = OutstandingToken.objects.filter(pk__in=pks).delete()
+        yield deleted
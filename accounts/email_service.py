@@ -1,7 +1,9 @@
+import html
 import logging
-import requests
+import re
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from joblane import http
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +37,10 @@ def send_email_brevo(email, name, subject, text_content, html_content):
         "content-type": "application/json",
     }
 
-    response = requests.post(
+    response = http.post(
         "https://api.brevo.com/v3/smtp/email",
         json=payload,
         headers=headers,
-        timeout=5,
     )
 
     if response.status_code >= 400:
@@ -70,3 +71,93 @@ def send_email(
         )
 
     raise RuntimeError(f"Unknown EMAIL_PROVIDER: {provider}")
+
+
+# ===== Batch sending =====
+# Brevo caps the number of messageVersions per request
+BREVO_BATCH_SIZE = 500
+PARAM_RE = re.compile(r"\{\{\s*params\.(\w+)\s*\}\}")
+
+
+def render_params(content, params, escape=False):
+    """Local stand-in for Brevo's `{{ params.x }}` substitution."""
+    return PARAM_RE.sub(
+        lambda match: (html.escape if escape else str)(str(params.get(match.group(1), ""))),
+        content,
+    )
+
+
+def send_batch_console(subject, text_content, html_content, recipients):
+    messages = []
+    for recipient in recipients:
+        params = recipient.get("params", {})
+        msg = EmailMultiAlternatives(
+            subject=render_params(subject, params),
+            body=render_params(text_content, params),
+            to=[recipient["email"]],
+        )
+        msg.attach_alternative(render_params(html_content, params, escape=True), "text/html")
+        messages.append(msg)
+    # one connection for the whole batch
+    get_connection().send_messages(messages)
+    return [True] * len(recipients)
+
+
+def send_batch_brevo(subject, text_content, html_content, recipients):
+    headers = {
+        "accept": "application/json",
+        "api-key": settings.BREVO_API_KEY,
+        "content-type": "application/json",
+    }
+    results = []
+    for start in range(0, len(recipients), BREVO_BATCH_SIZE):
+        chunk = recipients[start:start + BREVO_BATCH_SIZE]
+        payload = {
+            "sender": {
+                "name": "Joblane",
+                "email": settings.DEFAULT_FROM_EMAIL,
+            },
+            "subject": subject,
+            "htmlContent": html_content,
+            "textContent": text_content,
+            "messageVersions": [
+                {
+                    "to": [{"email": recipient["email"], "name": recipient.get("name", "")}],
+                    "params": recipient.get("params", {}),
+                }
+                for recipient in chunk
+            ],
+        }
+        try:
+            response = http.post("https://api.brevo.com/v3/smtp/email", json=payload, headers=headers)
+            ok = response.status_code < 400
+            if not ok:
+                logger.error(f"Brevo batch email failed: {response.text}")
+        except Exception:
+            logger.exception("Brevo batch email failed")
+            ok = False
+        results.extend([ok] * len(chunk))
+    return results
+
+
+def send_batch_email(
+    *,
+    subject: str,
+    text_content: str,
+    html_content: str,
+    recipients: list,
+):
+    """
+    Send one template to many recipients, each {"email", "name", "params"};
+    `{{ params.x }}` placeholders are filled per recipient. Returns one
+    sent flag per recipient.
+    """
+    provider = settings.EMAIL_PROVIDER
+
+    if provider == "console":
+        return send_batch_console(subject, text_content, html_content, recipients)
+
+    if provider == "brevo":
+        return send_batch_brevo(subject, text_content, html_content, recipients)
+
+    raise RuntimeError(f"Unknown EMAIL_PROVIDER: {provider}")
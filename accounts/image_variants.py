@@ -0,0 +1,216 @@
+"""
+Resized variants of uploaded images (company logos, profile pictures).
+
+Originals are stored at upload size (up to 2 MB) while lists render them as
+48px avatars. Saving a new upload queues an ImageVariantTask; `manage.py
+generate_image_variants` claims it, resizes the original with Pillow to each
+of VARIANT_WIDTHS as WebP and JPEG, stores the files next to the original and
+records their names in `<field>_variants` on the row:
+
+    {"source": "profiles/me.png",
+     "sizes": {"96": {"webp": "profiles/me_96.webp", "jpeg": "profiles/me_96.jpg"}, ...}}
+
+The queue is ImageVariantQueue (joblane.queues). An upload that cannot be
+processed is retried with the outbox's backoff, then left Failed for
+FAILED_RETENTION so the error can be looked at, and deleted.
+
+Serializers pick a width per endpoint (joblane.media.VariantImageField) and
+serve the original until the variants of the current upload exist. Recording
+them is a plain UPDATE (it also advances the row's updated_at, if it has one)
+followed by the `variants_recorded` signal, so caches of serialized output can
+be invalidated the way post_save would.
+"""
+import io
+import logging
+import os
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from accounts.models import ImageVariantTask
+from accounts.outbox import backoff
+from joblane.queues import TaskQueue
+
+logger = logging.getLogger(__name__)
+
+# 48px list avatars at 2x, and detail / profile pages
+VARIANT_WIDTHS = (96, 256)
+# format -> (Pillow format, extension, save options); JPEG for clients without WebP
+FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+MAX_ATTEMPTS = 4
+FAILED_RETENTION = timedelta(days=7)
+
+# sent with `instance` and `field` once new variants are stored on a row
+variants_recorded = Signal()
+
+
+def variants_attname(field_name):
+    return f"{field_name}_variants"
+
+
+def variant_name(file, width, image_format="webp"):
+    """
+    Stored name of the `width` variant of `file` (a FieldFile), or None while
+    the variants of its current upload have not been generated.
+    """
+    variants = getattr(file.instance, variants_attname(file.field.name), None) or {}
+    if variants.get("source") != file.name:
+        return None
+    return variants.get("sizes", {}).get(str(width), {}).get(image_format)
+
+
+def track_uploads(instance, fields, update_fields=None):
+    """For pre_save: remember which of `fields` get a new file in this save."""
+    instance._image_uploads = [
+        name for name in fields
+        if (update_fields is None or name in update_fields)
+        and getattr(instance, name)
+        and not getattr(instance, name)._committed
+    ]
+
+
+def queue_uploads(instance):
+    """For post_save: queue variants of the uploads track_uploads found."""
+    uploads, instance._image_uploads = getattr(instance, "_image_uploads", []), []
+    return ImageVariantTask.objects.bulk_create([
+        ImageVariantTask(
+            model=instance._meta.label_lower,
+            object_id=instance.pk,
+            field=name,
+            source=getattr(instance, name).name,
+        )
+        for name in uploads
+    ])
+
+
+def open_image(file):
+    with file.open("rb"):
+        image = Image.open(file)
+        # JPEG sources decode straight at a reduced scale
+        image.draft("RGB", (max(VARIANT_WIDTHS), max(VARIANT_WIDTHS)))
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def render_variant(image, width, image_format):
+    """Encoded `image` fitted into a `width` square; never upscaled."""
+    pil_format, _, options = FORMATS[image_format]
+    variant = image.copy()
+    variant.thumbnail((width, width), Image.Resampling.LANCZOS)
+    if pil_format == "JPEG" and variant.mode == "RGBA":
+        background = Image.new("RGB", variant.size, "white")
+        background.paste(variant, mask=variant.getchannel("A"))
+        variant = background
+
+    buffer = io.BytesIO()
+    variant.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def generate_variants(task):
+    """
+    Store the variants of a claimed task's upload and record them on its row.
+    Returns the task if the upload could not be processed (Pending again for
+    a retry, or Failed once out of attempts), or None when it is done (or
+    superseded by a newer upload) and deleted.
+    """
+    model = apps.get_model(task.model)
+    instance = model.objects.filter(pk=task.object_id).first()
+    file = getattr(instance, task.field) if instance is not None else None
+    if not file or file.name != task.source:
+        # deleted or replaced since; a newer upload has its own task
+        task.delete()
+        return None
+
+    storage = file.storage
+    root, _ = os.path.splitext(file.name)
+    sizes = {}
+    saved = []
+    try:
+        image = open_image(file)
+        for width in VARIANT_WIDTHS:
+            for image_format, (_, extension, _) in FORMATS.items():
+                content = ContentFile(render_variant(image, width, image_format))
+                name = storage.save(f"{root}_{width}.{extension}", content)
+                saved.append(name)
+                sizes.setdefault(str(width), {})[image_format] = name
+    except Exception as exc:
+        logger.exception("Image variants for %s failed", task)
+        for name in saved:
+            storage.delete(name)
+        task.attempts += 1
+        task.error = str(exc)[:1000]
+        if task.attempts >= MAX_ATTEMPTS:
+            task.status = ImageVariantTask.Status.FAILED
+        else:
+            task.status = ImageVariantTask.Status.PENDING
+            task.next_attempt_at = timezone.now() + backoff(task.attempts)
+        # a no-op if the task was requeued as stale meanwhile
+        variant_queue.claimed(task).update(
+            status=task.status, attempts=task.attempts, error=task.error, next_attempt_at=task.next_attempt_at
+        )
+        return task
+
+    attname = variants_attname(task.field)
+    previous = getattr(instance, attname) or {}
+    changes = {attname: {"source": task.source, "sizes": sizes}}
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        # auto_now is not applied by update(); validators built on it must move
+        changes["updated_at"] = timezone.now()
+    # only if the upload is still current; a plain update skips the save signals
+    recorded = model.objects.filter(pk=instance.pk, **{task.field: task.source}).update(**changes)
+    if recorded:
+        variants_recorded.send(sender=model, instance=instance, field=task.field)
+        stale = {name for formats in previous.get("sizes", {}).values() for name in formats.values()} - set(saved)
+    else:
+        stale = saved
+    for name in stale:
+        storage.delete(name)
+
+    task.delete()
+    return None
+
+
+def purge_failed_tasks(older_than=FAILED_RETENTION, batch_size=1000):
+    """Delete up to `batch_size` Failed tasks created more than `older_than` ago."""
+    expired = ImageVariantTask.objects.filter(
+        status=ImageVariantTask.Status.FAILED, created_at__lt=timezone.now() - older_than
+    )
+    pks = list(expired.order_by('created_at').values_list('pk', flat=True)[:batch_size])
+    if not pks:
+        return 0
+    deleted, _ = expired.filter(pk__in=pks).delete()
+    return deleted
+
+
+class ImageVariantQueue(TaskQueue):
+    """ImageVariantTask rows, run by `manage.py generate_image_variants`."""
+    model = ImageVariantTask
+    pending = ImageVariantTask.Status.PENDING
+    running = ImageVariantTask.Status.RUNNING
+
+    def due(self, now):
+        return super().due(now) & Q(next_attempt_at__lte=now)
+
+    def housekeeping(self):
+        purge_failed_tasks()
+
+    def run(self, task):
+        label = str(task)
+        task = generate_variants(task)
+        if task is None:
+            return f"{label}: done"
+        return f"{label}: {'failed' if task.status == ImageVariantTask.Status.FAILED else 'will retry'}"
+
+
+variant_queue = ImageVariantQueue()
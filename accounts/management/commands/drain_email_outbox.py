@@ -0,0 +1,19 @@
+from datetime import timedelta
+
+from accounts.outbox import OutboxQueue
+from joblane.queues import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "Deliver queued EmailOutbox rows with retries. Runs until stopped unless --once is given."
+    queue_class = OutboxQueue
+    sleep = 1
+    stale_after_help = "Seconds before mail left Sending by a dead worker is retried."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--concurrency", type=int, default=8, help="Parallel provider requests.")
+
+    def get_queue(self, options):
+        return self.queue_class(stale_after=timedelta(seconds=options["stale_after"]), concurrency=options["concurrency"])
@@ -0,0 +1,7 @@
+from accounts.image_variants import ImageVariantQueue
+from joblane.queues import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "Resize queued logo and profile picture uploads. Runs until stopped unless --once is given."
+    queue_class = ImageVariantQueue
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.blacklist import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding / blacklisted refresh tokens in batches. Run daily (cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        pruned = 0
+
+        for deleted in prune_expired_tokens(batch_size=options["batch_size"]):
+            pruned += deleted
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} expired refresh tokens."))
@@ -0,0 +1,25 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from accounts.outbox import OUTBOX_RETENTION, purge_outbox
+
+
+class Command(BaseCommand):
+    help = "Delete sent and failed outbox rows in batches. Run daily (cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=OUTBOX_RETENTION.days, help="Purge rows older than this.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        purged = 0
+
+        for deleted in purge_outbox(older_than=timedelta(days=options["days"]), batch_size=options["batch_size"]):
+            purged += deleted
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} sent or failed outbox emails."))
@@ -0,0 +1,30 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from accounts.purge import PENDING_USER_TTL, purge_pending_users
+
+
+class Command(BaseCommand):
+    help = "Delete pending registrations that were never verified, in batches. Run daily (cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=PENDING_USER_TTL.days, help="Purge registrations older than this.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        purged = 0
+        start = time.perf_counter()
+
+        for deleted in purge_pending_users(older_than=timedelta(days=options["days"]), batch_size=options["batch_size"]):
+            purged += deleted
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        elapsed = time.perf_counter() - start
+        rate = purged / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Purged {purged} pending registrations in {elapsed:.1f}s ({rate:.0f} rows/s)."
+        ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 01:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='claims_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
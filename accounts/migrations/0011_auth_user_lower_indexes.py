@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-18 01:40
+
+from django.db import migrations
+
+
+# Expressions match what Lower("username") / Lower("email") generate, so the
+# login lookup in accounts.backends can use them (auth_user belongs to
+# django.contrib.auth, hence raw SQL instead of Meta.indexes).
+LOWER_INDEXES = {
+    "auth_user_username_lower_idx": "LOWER(username)",
+    "auth_user_email_lower_idx": "LOWER(email)",
+}
+
+
+def create_lower_indexes(apps, schema_editor):
+    for name, expression in LOWER_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON auth_user ({expression})"
+        )
+
+
+def drop_lower_indexes(apps, schema_editor):
+    for name in LOWER_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_profile_claims_version'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_lower_indexes, drop_lower_indexes),
+    ]
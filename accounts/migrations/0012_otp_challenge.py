@@ -0,0 +1,70 @@
+# Generated by Django 5.2.3 on 2026-10-18 01:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_auth_user_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='pendinguser',
+            name='last_otp_sent_at',
+        ),
+        migrations.RemoveField(
+            model_name='pendinguser',
+            name='otp_attempts',
+        ),
+        migrations.RemoveField(
+            model_name='pendinguser',
+            name='otp_created_at',
+        ),
+        migrations.RemoveField(
+            model_name='pendinguser',
+            name='otp_hash',
+        ),
+        migrations.RemoveField(
+            model_name='pendinguser',
+            name='otp_resend_count',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='last_otp_sent_at',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='otp_attempts',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='otp_created_at',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='otp_hash',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='otp_resend_count',
+        ),
+        migrations.CreateModel(
+            name='OtpChallenge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('purpose', models.CharField(choices=[('registration', 'account verification'), ('password_reset', 'password reset')], max_length=20)),
+                ('subject', models.CharField(max_length=254)),
+                ('otp_hash', models.CharField(blank=True, max_length=64)),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_sent_at', models.DateTimeField(blank=True, null=True)),
+                ('sent_on', models.DateField(blank=True, null=True)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('purpose', 'subject'), name='otp_challenge_subject_uniq')],
+            },
+        ),
+    ]
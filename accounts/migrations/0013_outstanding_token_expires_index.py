@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:10
+
+from django.db import migrations
+
+
+# token_blacklist_outstandingtoken belongs to simplejwt's token_blacklist
+# app; accounts.blacklist.prune_expired_tokens walks it by expires_at
+INDEX_NAME = "token_outstanding_expires_idx"
+
+
+def create_expires_index(apps, schema_editor):
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON token_blacklist_outstandingtoken (expires_at)"
+    )
+
+
+def drop_expires_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_otp_challenge'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_expires_index, drop_expires_index),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:22
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagevarianttask',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='imagevarianttask',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,9 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
+from django.utils import timezone
 
-from cloudinary_storage.storage import MediaCloudinaryStorage 
-from .storages import RawMediaCloudinaryStorage
+from .storages import RawMediaCloudinaryStorage, media_storage
 
 class Profile(models.Model):
     ROLE_CHOICES = (
@@ -13,13 +13,6 @@ class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     is_verified = models.BooleanField(default=False)
 
-    # OTP fields
-    otp_hash = models.CharField(max_length=64, blank=True, null=True)
-    otp_created_at = models.DateTimeField(blank=True, null=True)
-    otp_attempts = models.IntegerField(default=0)      
-    last_otp_sent_at = models.DateTimeField(blank=True, null=True)
-    otp_resend_count = models.IntegerField(default=0) 
-
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='jobseeker')
     name = models.CharField(max_length=100)
     
@@ -30,7 +23,12 @@ class Profile(models.Model):
     gender = models.CharField(max_length=10, blank=True)
     skills = models.JSONField(default=list, blank=True)
     resume = models.FileField(upload_to='resumes/', null=True, blank=True, storage=RawMediaCloudinaryStorage())
-    profile_pic = models.ImageField(upload_to='profiles/', null=True, blank=True,storage=MediaCloudinaryStorage())
+    profile_pic = models.ImageField(upload_to='profiles/', null=True, blank=True, storage=media_storage)
+    # resized copies of profile_pic, written by accounts.image_variants
+    profile_pic_variants = models.JSONField(default=dict, blank=True, editable=False)
+
+    # bumped when role or account status changes; tokens carrying an older value fall back to the database
+    claims_version = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name or self.user.email
@@ -48,13 +46,6 @@ class PendingUser(models.Model):
     name = models.CharField(max_length=100)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='jobseeker')
 
-    # OTP fields
-    otp_hash = models.CharField(max_length=64, blank=True, null=True)
-    otp_created_at = models.DateTimeField(blank=True, null=True)
-    otp_attempts = models.IntegerField(default=0)
-    otp_resend_count = models.IntegerField(default=0)
-    last_otp_sent_at = models.DateTimeField(blank=True, null=True)
-
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def set_password(self, raw_password):
@@ -63,3 +54,108 @@ class PendingUser(models.Model):
 
     def __str__(self):
         return self.email
+
+
+class OtpChallenge(models.Model):
+    """
+    One-time code for a registration or password reset, with its attempt and
+    resend counters. Written only by the database store in accounts.otp
+    (settings.OTP_STORE = "db"); the cache store keeps the same state in cache keys.
+    """
+    class Purpose(models.TextChoices):
+        REGISTRATION = 'registration', 'account verification'
+        PASSWORD_RESET = 'password_reset', 'password reset'
+
+    purpose = models.CharField(max_length=20, choices=Purpose.choices)
+    # the email the code was sent to
+    subject = models.CharField(max_length=254)
+
+    otp_hash = models.CharField(max_length=64, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+
+    last_sent_at = models.DateTimeField(null=True, blank=True)
+    sent_on = models.DateField(null=True, blank=True)
+    sent_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['purpose', 'subject'], name='otp_challenge_subject_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_purpose_display()} -> {self.subject}"
+
+
+class EmailOutbox(models.Model):
+    """
+    Transactional email waiting for delivery. Rows are written in the same
+    transaction as the change that triggers them (see accounts.outbox) and sent
+    by `manage.py drain_email_outbox`.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        SENDING = 'Sending', 'Sending'
+        SENT = 'Sent', 'Sent'
+        FAILED = 'Failed', 'Failed'
+
+    to_email = models.EmailField()
+    to_name = models.CharField(max_length=100, blank=True)
+    subject = models.CharField(max_length=255)
+    # cleared once sent: OTP mails carry the raw code
+    text_content = models.TextField(blank=True)
+    html_content = models.TextField(blank=True)
+
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # undelivered mail is pointless after this, e.g. once the OTP has expired
+    expires_at = models.DateTimeField(null=True, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
+
+
+class ImageVariantTask(models.Model):
+    """
+    An uploaded image waiting for its resized variants. Queued when the upload
+    is saved and processed by `manage.py generate_image_variants` (see
+    accounts.image_variants); finished tasks are deleted, failed ones are
+    retried with backoff and deleted some days after they give up.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        RUNNING = 'Running', 'Running'
+        FAILED = 'Failed', 'Failed'
+
+    # "app_label.model_name" of the row holding the image
+    model = models.CharField(max_length=100)
+    object_id = models.PositiveBigIntegerField()
+    field = models.CharField(max_length=50)
+    # the upload the variants are made from; a newer upload supersedes it
+    source = models.CharField(max_length=255)
+
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='variant_task_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.model}:{self.object_id}.{self.field} ({self.status})"
@@ -0,0 +1,172 @@
+"""
+OTP challenges for registration and password reset.
+
+A challenge is the hashed code with its expiry and attempt counter, plus the
+resend cooldown and daily counter of its (purpose, email). Both stores update
+these with atomic counters and conditional writes instead of locking a user
+row for the whole request:
+
+- CacheOtpStore keeps everything in cache keys with TTLs (cache.add for the
+  cooldown, cache.incr for the counters). Use it with a shared cache (Redis).
+- DatabaseOtpStore keeps one OtpChallenge row per (purpose, email) and
+  changes it with single conditional UPDATEs.
+
+settings.OTP_STORE picks one; see otp_store().
+"""
+import hmac
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from .models import OtpChallenge
+from .utils import (
+    DAILY_RESEND_LIMIT, MAX_OTP_ATTEMPTS, OTP_EXPIRY_MINUTES, RESEND_COOLDOWN_SECONDS,
+    generate_otp, hash_otp,
+)
+
+Purpose = OtpChallenge.Purpose
+
+# verify() results
+VERIFIED = "verified"
+INVALID = "invalid"
+EXPIRED = "expired"
+MISSING = "missing"
+LOCKED = "locked"
+
+COOLDOWN_MESSAGE = "OTP recently sent. Please wait before requesting again."
+DAILY_LIMIT_MESSAGE = "Daily OTP limit reached. Try again tomorrow."
+
+
+class CacheOtpStore:
+    DAY = 24 * 60 * 60
+    # kept past expiry so a late code is reported as expired, not missing
+    CHALLENGE_TIMEOUT = 2 * OTP_EXPIRY_MINUTES * 60
+
+    def _key(self, purpose, subject, part):
+        return f"otp:{purpose}:{subject}:{part}"
+
+    def _incr(self, key, timeout):
+        cache.add(key, 0, timeout=timeout)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # expired between add() and incr()
+            cache.set(key, 1, timeout=timeout)
+            return 1
+
+    def issue(self, purpose, subject):
+        """(raw OTP, None), or (None, reason) when the cooldown or daily limit applies."""
+        now = timezone.now()
+        if not cache.add(self._key(purpose, subject, "cooldown"), 1, timeout=RESEND_COOLDOWN_SECONDS):
+            return None, COOLDOWN_MESSAGE
+        if self._incr(self._key(purpose, subject, f"sent:{now.date()}"), self.DAY) > DAILY_RESEND_LIMIT:
+            return None, DAILY_LIMIT_MESSAGE
+
+        raw_otp = generate_otp()
+        cache.set_many({
+            self._key(purpose, subject, "challenge"): {
+                "hash": hash_otp(raw_otp),
+                "expires_at": now + timedelta(minutes=OTP_EXPIRY_MINUTES),
+            },
+            self._key(purpose, subject, "attempts"): 0,
+        }, timeout=self.CHALLENGE_TIMEOUT)
+        return raw_otp, None
+
+    def verify(self, purpose, subject, otp):
+        challenge_key = self._key(purpose, subject, "challenge")
+        attempts_key = self._key(purpose, subject, "attempts")
+
+        challenge = cache.get(challenge_key)
+        if challenge is None:
+            return MISSING
+        if timezone.now() > challenge["expires_at"]:
+            return EXPIRED
+        if self._incr(attempts_key, self.CHALLENGE_TIMEOUT) > MAX_OTP_ATTEMPTS:
+            return LOCKED
+        if not hmac.compare_digest(hash_otp(otp), challenge["hash"]):
+            return INVALID
+        # single use: only the request that deletes the key wins
+        if not cache.delete(challenge_key):
+            return MISSING
+        cache.delete(attempts_key)
+        return VERIFIED
+
+    def reset(self, purpose, subject):
+        """Drop the challenge and the daily counter (the cooldown stays)."""
+        cache.delete_many([
+            self._key(purpose, subject, "challenge"),
+            self._key(purpose, subject, "attempts"),
+            self._key(purpose, subject, f"sent:{timezone.now().date()}"),
+        ])
+
+
+class DatabaseOtpStore:
+
+    def issue(self, purpose, subject):
+        now = timezone.now()
+        today = now.date()
+        challenge, _ = OtpChallenge.objects.get_or_create(purpose=purpose, subject=subject)
+
+        raw_otp = generate_otp()
+        issued = (
+            OtpChallenge.objects
+            .filter(pk=challenge.pk)
+            .filter(Q(last_sent_at__isnull=True) | Q(last_sent_at__lte=now - timedelta(seconds=RESEND_COOLDOWN_SECONDS)))
+            .exclude(sent_on=today, sent_count__gte=DAILY_RESEND_LIMIT)
+            .update(
+                otp_hash=hash_otp(raw_otp),
+                expires_at=now + timedelta(minutes=OTP_EXPIRY_MINUTES),
+                attempts=0,
+                last_sent_at=now,
+                sent_count=Case(When(sent_on=today, then=F("sent_count") + 1), default=Value(1)),
+                sent_on=today,
+            )
+        )
+        if issued:
+            return raw_otp, None
+
+        challenge.refresh_from_db(fields=["last_sent_at"])
+        if challenge.last_sent_at and (now - challenge.last_sent_at).total_seconds() < RESEND_COOLDOWN_SECONDS:
+            return None, COOLDOWN_MESSAGE
+        return None, DAILY_LIMIT_MESSAGE
+
+    def verify(self, purpose, subject, otp):
+        challenge = (
+            OtpChallenge.objects
+            .filter(purpose=purpose, subject=subject)
+            .exclude(otp_hash="")
+            .values("pk", "otp_hash", "expires_at")
+            .first()
+        )
+        if challenge is None:
+            return MISSING
+        if timezone.now() > challenge["expires_at"]:
+            return EXPIRED
+
+        rows = OtpChallenge.objects.filter(pk=challenge["pk"])
+        if not rows.filter(attempts__lt=MAX_OTP_ATTEMPTS).update(attempts=F("attempts") + 1):
+            return LOCKED
+        if not hmac.compare_digest(hash_otp(otp), challenge["otp_hash"]):
+            return INVALID
+        # single use, and only if no newer code replaced this one meanwhile
+        if not rows.filter(otp_hash=challenge["otp_hash"]).update(otp_hash="", expires_at=None, attempts=0):
+            return MISSING
+        return VERIFIED
+
+    def reset(self, purpose, subject):
+        OtpChallenge.objects.filter(purpose=purpose, subject=subject).update(
+            otp_hash="", expires_at=None, attempts=0, sent_count=0
+        )
+
+
+STORES = {
+    "cache": CacheOtpStore,
+    "db": DatabaseOtpStore,
+}
+
+
+def otp_store():
+    return STORES[settings.OTP_STORE]()
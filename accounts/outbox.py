@@ -0,0 +1,186 @@
+"""
+Transactional email outbox.
+
+Request handlers call enqueue_email() inside their transaction, so a mail is
+queued exactly when the change that triggers it commits and the request never
+waits on the email provider. `manage.py drain_email_outbox` claims due rows,
+sends them concurrently through accounts.email_service and retries failures
+with exponential backoff. Finished rows keep no content and are deleted after
+OUTBOX_RETENTION by `manage.py purge_email_outbox`.
+"""
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from accounts.email_service import send_email
+from accounts.models import EmailOutbox
+from joblane.queues import TaskQueue
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+# a worker that died mid-send leaves rows in Sending; retry them after this
+SENDING_TIMEOUT = timedelta(minutes=5)
+# Sent and Failed rows are kept this long for delivery questions, then purged
+OUTBOX_RETENTION = timedelta(days=30)
+
+
+def enqueue_email(*, email, name, subject, text_content, html_content, expires_at=None):
+    return EmailOutbox.objects.create(
+        to_email=email,
+        to_name=name or "",
+        subject=subject,
+        text_content=text_content,
+        html_content=html_content,
+        expires_at=expires_at,
+    )
+
+
+def enqueue_emails(messages, batch_size=1000):
+    """Bulk enqueue_email(): `messages` are dicts of its keyword arguments."""
+    return EmailOutbox.objects.bulk_create(
+        [
+            EmailOutbox(
+                to_email=message["email"],
+                to_name=message.get("name") or "",
+                subject=message["subject"],
+                text_content=message["text_content"],
+                html_content=message["html_content"],
+                expires_at=message.get("expires_at"),
+            )
+            for message in messages
+        ],
+        batch_size=batch_size,
+    )
+
+
+def backoff(attempts):
+    """Delay before retry number `attempts`: 30s, 60s, 120s ... capped at 1h, with jitter."""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def _send(message):
+    try:
+        return send_email(
+            email=message.to_email,
+            name=message.to_name,
+            subject=message.subject,
+            text_content=message.text_content,
+            html_content=message.html_content,
+        ), ""
+    except Exception as exc:
+        logger.exception("Sending outbox email %s failed", message.pk)
+        return False, str(exc)
+
+
+def _record(message, sent, error, now):
+    message.attempts += 1
+    message.locked_at = None
+
+    if sent:
+        message.status = EmailOutbox.Status.SENT
+        message.sent_at = now
+        message.text_content = message.html_content = ""
+        message.last_error = ""
+    elif message.attempts >= MAX_ATTEMPTS or (message.expires_at and message.expires_at <= now):
+        message.status = EmailOutbox.Status.FAILED
+        message.text_content = message.html_content = ""
+        message.last_error = error or "Provider rejected the message"
+    else:
+        message.status = EmailOutbox.Status.PENDING
+        message.next_attempt_at = now + backoff(message.attempts)
+        message.last_error = error or "Provider rejected the message"
+
+    message.save(update_fields=[
+        'status', 'attempts', 'locked_at', 'sent_at', 'next_attempt_at',
+        'last_error', 'text_content', 'html_content',
+    ])
+
+
+def expire_stale_emails():
+    """Give up on queued mail that is no longer useful (e.g. its OTP expired)."""
+    return EmailOutbox.objects.filter(
+        status=EmailOutbox.Status.PENDING, expires_at__lte=timezone.now()
+    ).update(status=EmailOutbox.Status.FAILED, last_error="Expired before delivery", text_content="", html_content="")
+
+
+class OutboxQueue(TaskQueue):
+    """
+    EmailOutbox rows, sent by `manage.py drain_email_outbox`. Rows are claimed
+    in batches and the provider calls of a batch run in a thread pool;
+    database writes stay on the worker's thread.
+    """
+    model = EmailOutbox
+    pending = EmailOutbox.Status.PENDING
+    running = EmailOutbox.Status.SENDING
+    claimed_at_field = 'locked_at'
+    ordering = ('next_attempt_at', 'id')
+    stale_after = SENDING_TIMEOUT
+
+    def __init__(self, stale_after=None, concurrency=8):
+        super().__init__(stale_after)
+        self.concurrency = concurrency
+
+    def due(self, now):
+        return super().due(now) & Q(next_attempt_at__lte=now)
+
+    def housekeeping(self):
+        expire_stale_emails()
+
+    def send(self, messages):
+        """
+        Send claimed messages; returns (sent, unsent) counts, where unsent rows
+        are either rescheduled or, out of attempts, marked Failed.
+        """
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(messages))) as pool:
+            results = list(pool.map(_send, messages))
+
+        now = timezone.now()
+        sent = 0
+        for message, (ok, error) in zip(messages, results):
+            _record(message, ok, error, now)
+            sent += ok
+        return sent, len(messages) - sent
+
+    def process(self, messages):
+        sent, unsent = self.send(messages)
+        return [f"Sent {sent}, deferred or failed {unsent}."]
+
+
+def drain_outbox(batch_size=50, concurrency=8):
+    """Send one batch of due emails; returns (sent, unsent) as OutboxQueue.send()."""
+    queue = OutboxQueue(concurrency=concurrency)
+    queue.requeue_stale()
+    queue.housekeeping()
+    messages = queue.claim(batch_size)
+    if not messages:
+        return 0, 0
+    return queue.send(messages)
+
+
+def purge_outbox(older_than=OUTBOX_RETENTION, batch_size=5000):
+    """
+    Delete Sent rows sent, and Failed rows created, more than `older_than`
+    ago, oldest first in short transactions. Yields the rows deleted per batch.
+    """
+    cutoff = timezone.now() - older_than
+    finished = EmailOutbox.objects.filter(
+        Q(status=EmailOutbox.Status.SENT, sent_at__lt=cutoff)
+        | Q(status=EmailOutbox.Status.FAILED, created_at__lt=cutoff)
+    )
+
+    while True:
+        pks = list(finished.order_by('id').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        with transaction.atomic():
+            deleted, _ = finished.filter(pk__in=pks).delete()
+        yield deleted
@@ -0,0 +1,42 @@
+"""
+Purge of abandoned registrations.
+
+A PendingUser row only goes away when its OTP is verified, so every signup
+that is never finished would stay forever. purge_pending_users deletes the
+expired ones oldest first, in small batches found through the created_at
+index, each in its own short transaction.
+
+    python manage.py purge_pending_users
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OtpChallenge, PendingUser
+
+# RegisterView restarts the clock when someone registers again
+PENDING_USER_TTL = timedelta(days=7)
+
+
+def purge_pending_users(older_than=PENDING_USER_TTL, batch_size=5000):
+    """
+    Delete pending registrations created more than `older_than` ago, with
+    their registration OTP challenges. Yields the rows deleted per batch.
+    """
+    cutoff = timezone.now() - older_than
+    expired = PendingUser.objects.filter(created_at__lt=cutoff)
+
+    while True:
+        batch = list(expired.order_by('created_at').values_list('pk', 'email')[:batch_size])
+        if not batch:
+            return
+
+        pks, emails = zip(*batch)
+        with transaction.atomic():
+            # re-checked: a row registered again meanwhile has a new created_at and stays
+            deleted, _ = expired.filter(pk__in=pks).delete()
+            OtpChallenge.objects.filter(
+                purpose=OtpChallenge.Purpose.REGISTRATION, subject__in=emails, last_sent_at__lt=cutoff
+            ).delete()
+        yield deleted
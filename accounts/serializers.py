@@ -1,12 +1,11 @@
-import hashlib
-from datetime import timedelta
-from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth.password_validation import validate_password
 
 from .models import Profile, PendingUser
+from .tokens import ClaimsRefreshToken
+from joblane.media import MEDIA_FIELD_MAPPING, VariantImageField
 
 User = get_user_model()
 
@@ -73,29 +72,11 @@ class VerifyOtpSerializer(serializers.Serializer):
     email = serializers.EmailField()
     otp = serializers.CharField(max_length=6)
 
-    def validate(self, data):
-        try:
-            pending_user = PendingUser.objects.get(email=data["email"])
-        except PendingUser.DoesNotExist:
-            raise serializers.ValidationError("No pending user found with this email.")
-
-        if not pending_user.otp_created_at:
-            raise serializers.ValidationError("OTP not requested.")
-
-        if timezone.now() - pending_user.otp_created_at > timedelta(minutes=10):
-            raise serializers.ValidationError("OTP expired.")
-
-        otp_hash = hashlib.sha256(data["otp"].encode()).hexdigest()
-        if pending_user.otp_hash != otp_hash:
-            pending_user.otp_attempts += 1
-            pending_user.save(update_fields=["otp_attempts"])
-            raise serializers.ValidationError("Invalid OTP.")
-
-        return data
-
 
 # ===== Login =====
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
     def validate(self, attrs):
         data = super().validate(attrs)
         profile = self.user.profile
@@ -110,30 +91,32 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         }
 
 
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = ClaimsRefreshToken
+
+
 # ===== Profile =====
 class ProfileSerializer(serializers.ModelSerializer):
+    # profile_pic / resume URLs memoized per (storage, name), see joblane.media
+    serializer_field_mapping = {**serializers.ModelSerializer.serializer_field_mapping, **MEDIA_FIELD_MAPPING}
     email = serializers.EmailField(source='user.email', read_only=True)
+    profile_pic_thumbnail = VariantImageField(source='profile_pic', width=256)
 
     class Meta:
         model = Profile
         fields = [
             'id', 'user', 'role', 'name', 'email', 'phone', 'education', 'location',
-            'dob', 'gender', 'skills', 'profile_pic', 'resume'
+            'dob', 'gender', 'skills', 'profile_pic', 'profile_pic_thumbnail', 'resume'
         ]
         read_only_fields = ['user', 'role', 'email']
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        request = self.context.get("request")
 
-        if instance.profile_pic and request:
-            data["profile_pic"] = request.build_absolute_uri(instance.profile_pic.url)
-        else:
+        # file URLs are only exposed with a request to make them absolute
+        if self.context.get("request") is None:
             data["profile_pic"] = None
-
-        if instance.resume and request:
-            data["resume"] = request.build_absolute_uri(instance.resume.url)
-        else:
+            data["profile_pic_thumbnail"] = None
             data["resume"] = None
 
         return data
@@ -1,10 +1,46 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
+from joblane.changes import changed, track_changes
+from .image_variants import queue_uploads, track_uploads
 from .models import Profile
+from .tokens import bump_claims_version, store_claims_version
+
+track_changes(Profile, "role")
+track_changes(User, "is_active")
 
 
 @receiver(post_save, sender=User)
 def create_or_update_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.update_or_create(user=instance)
+
+
+@receiver(pre_save, sender=Profile)
+def invalidate_role_claims(sender, instance, raw=False, update_fields=None, **kwargs):
+    # tokens issued with the old role must not be trusted any more (accounts.tokens)
+    if not raw and changed(instance, "role"):
+        if update_fields is None:
+            # saved together with the role
+            instance.claims_version += 1
+            store_claims_version(instance.user_id)
+        else:
+            bump_claims_version(instance.user_id)
+
+
+@receiver(pre_save, sender=User)
+def invalidate_inactive_user_claims(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw and changed(instance, "is_active"):
+        bump_claims_version(instance.pk)
+
+
+@receiver(pre_save, sender=Profile)
+def track_profile_pic_upload(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:
+        track_uploads(instance, ["profile_pic"], update_fields)
+
+
+@receiver(post_save, sender=Profile)
+def queue_profile_pic_variants(sender, instance, raw=False, **kwargs):
+    if not raw:
+        queue_uploads(instance)
@@ -1,4 +1,12 @@
 from cloudinary_storage.storage import MediaCloudinaryStorage
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def media_storage():
+    """Storage of company logos and profile pictures, from settings.MEDIA_STORAGE."""
+    return import_string(settings.MEDIA_STORAGE["BACKEND"])(**settings.MEDIA_STORAGE.get("OPTIONS", {}))
+
 
 class RawMediaCloudinaryStorage(MediaCloudinaryStorage):
     """
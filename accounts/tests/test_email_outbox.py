@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import EmailOutbox
+from accounts.outbox import MAX_ATTEMPTS, drain_outbox, enqueue_email
+
+
+@override_settings(EMAIL_PROVIDER="console")
+class EmailOutboxTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="Test@1234"
+        )
+
+    def queue(self, **kwargs):
+        return enqueue_email(
+            email="test@example.com",
+            name="Test",
+            subject="Hello",
+            text_content="text",
+            html_content="<p>html</p>",
+            **kwargs,
+        )
+
+    def test_otp_is_queued_not_sent_inline(self):
+        response = self.client.post(reverse("forgot-password"), {"email": "test@example.com"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        message = EmailOutbox.objects.get()
+        self.assertEqual(message.status, EmailOutbox.Status.PENDING)
+        self.assertIn("password reset", message.subject.lower())
+
+        out = StringIO()
+        call_command("drain_email_outbox", once=True, stdout=out)
+        self.assertIn("Sent 1, deferred or failed 0.", out.getvalue())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["test@example.com"])
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutbox.Status.SENT)
+        self.assertEqual((message.text_content, message.html_content), ("", ""))
+
+    def test_blocked_otp_queues_nothing(self):
+        self.client.post(reverse("forgot-password"), {"email": "test@example.com"})
+        response = self.client.post(reverse("forgot-password"), {"email": "test@example.com"})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(EmailOutbox.objects.count(), 1)
+
+    @patch("accounts.outbox.send_email")
+    def test_retries_with_backoff_then_fails(self, mock_send):
+        mock_send.side_effect = ConnectionError("provider down")
+        message = self.queue()
+
+        with self.assertLogs("accounts.outbox", "ERROR"):
+            self.assertEqual(drain_outbox(), (0, 1))
+        message.refresh_from_db()
+        self.assertEqual((message.status, message.attempts), (EmailOutbox.Status.PENDING, 1))
+        self.assertGreater(message.next_attempt_at, timezone.now())
+        self.assertEqual(message.last_error, "provider down")
+
+        # not due yet
+        self.assertEqual(drain_outbox(), (0, 0))
+
+        with self.assertLogs("accounts.outbox", "ERROR"):
+            for _ in range(MAX_ATTEMPTS - 1):
+                EmailOutbox.objects.filter(pk=message.pk).update(next_attempt_at=timezone.now())
+                drain_outbox()
+        message.refresh_from_db()
+        self.assertEqual((message.status, message.attempts), (EmailOutbox.Status.FAILED, MAX_ATTEMPTS))
+        self.assertEqual((message.text_content, message.html_content), ("", ""))
+
+    def test_expired_and_abandoned_rows(self):
+        expired = self.queue(expires_at=timezone.now() - timedelta(seconds=1))
+        abandoned = self.queue()
+        EmailOutbox.objects.filter(pk=abandoned.pk).update(
+            status=EmailOutbox.Status.SENDING, locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(drain_outbox(), (1, 0))
+
+        expired.refresh_from_db()
+        abandoned.refresh_from_db()
+        self.assertEqual(expired.status, EmailOutbox.Status.FAILED)
+        self.assertEqual(abandoned.status, EmailOutbox.Status.SENT)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_purge_of_finished_rows(self):
+        old = timezone.now() - timedelta(days=31)
+        sent, recent, failed, pending = (self.queue() for _ in range(4))
+        EmailOutbox.objects.filter(pk=sent.pk).update(status=EmailOutbox.Status.SENT, sent_at=old)
+        EmailOutbox.objects.filter(pk=recent.pk).update(status=EmailOutbox.Status.SENT, sent_at=timezone.now())
+        EmailOutbox.objects.filter(pk__in=[failed.pk, pending.pk]).update(created_at=old)
+        EmailOutbox.objects.filter(pk=failed.pk).update(status=EmailOutbox.Status.FAILED)
+
+        out = StringIO()
+        call_command("purge_email_outbox", batch_size=1, stdout=out)
+
+        self.assertIn("Purged 2 sent or failed outbox emails.", out.getvalue())
+        self.assertCountEqual(EmailOutbox.objects.values_list("pk", flat=True), [recent.pk, pending.pk])
@@ -0,0 +1,116 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from joblane import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def _reply(self, code, body=b"{}", headers=()):
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Type", "application/json")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.hits.append(("GET", self.path))
+        if self.path == "/certs":
+            self._reply(200, b'{"kid": "cert"}', [("Cache-Control", "public, max-age=300")])
+        elif self.path == "/flaky" and self.hits.count(("GET", "/flaky")) == 1:
+            self._reply(503)
+        else:
+            self._reply(200)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.hits.append(("POST", self.path))
+        self._reply(503 if self.path == "/flaky" else 200)
+
+    def log_message(self, *args):
+        pass
+
+
+class OutboundHttpTest(APITestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        _Handler.hits = []
+        http._sessions.clear()
+        self.host = self.base.split("://")[1]
+
+    def test_requests_reuse_one_pooled_connection(self):
+        for _ in range(5):
+            self.assertEqual(http.get(self.base + "/ping").status_code, 200)
+        http.post(self.base + "/ping", json={"a": 1})
+
+        stats = http.http_stats()[self.host]
+        self.assertEqual(stats["requests"], 6)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["errors"], 0)
+        self.assertAlmostEqual(stats["reuse_ratio"], 0.8333, places=3)
+
+    @patch.object(http.RETRY, "backoff_factor", 0)
+    def test_idempotent_requests_retry_but_posts_do_not(self):
+        self.assertEqual(http.get(self.base + "/flaky").status_code, 200)
+        self.assertEqual(_Handler.hits.count(("GET", "/flaky")), 2)
+
+        self.assertEqual(http.post(self.base + "/flaky").status_code, 503)
+        self.assertEqual(_Handler.hits.count(("POST", "/flaky")), 1)
+
+    def test_connection_errors_are_counted(self):
+        with self.assertRaises(Exception):
+            http.get("http://127.0.0.1:9/unreachable", timeout=0.5)
+        self.assertEqual(http.http_stats()["127.0.0.1:9"]["errors"], 1)
+
+    def test_google_certs_cached_for_max_age(self):
+        request = http.google_request()
+        first = request(self.base + "/certs")
+        second = request(self.base + "/certs")
+
+        self.assertEqual(first.status, 200)
+        self.assertEqual(second.data, b'{"kid": "cert"}')
+        self.assertEqual(_Handler.hits, [("GET", "/certs")])
+
+    def test_google_responses_without_max_age_are_not_cached(self):
+        request = http.google_request()
+        request(self.base + "/ping")
+        request(self.base + "/ping")
+        self.assertEqual(len(_Handler.hits), 2)
+
+    def test_stats_endpoint_is_admin_only(self):
+        user = User.objects.create_user(username="u", email="u@example.com", password="Test@1234")
+        self.client.force_authenticate(user)
+        self.assertEqual(self.client.get(reverse("http-stats")).status_code, status.HTTP_403_FORBIDDEN)
+
+        http.get(self.base + "/ping")
+        admin = User.objects.create_superuser(username="admin", email="a@example.com", password="Test@1234")
+        self.client.force_authenticate(admin)
+        response = self.client.get(reverse("http-stats"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[self.host]["requests"], 1)
@@ -0,0 +1,182 @@
+from io import BytesIO, StringIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import localdate, timedelta
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from accounts.image_variants import MAX_ATTEMPTS, generate_variants, variant_queue
+from accounts.models import ImageVariantTask
+from jobs.models import Job
+from jobs.tests.utils import create_recruiter_with_company, create_user
+from joblane.media import clear_media_urls
+
+
+def image_bytes(size=(600, 400), mode="RGBA", image_format="PNG"):
+    buffer = BytesIO()
+    Image.new(mode, size, (200, 30, 30, 128) if mode == "RGBA" else "red").save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def upload(name="me.png", **kwargs):
+    return SimpleUploadedFile(name, image_bytes(**kwargs), content_type="image/png")
+
+
+def run_worker():
+    out = StringIO()
+    call_command("generate_image_variants", "--once", stdout=out)
+    return out.getvalue()
+
+
+class ImageVariantsTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        clear_media_urls()
+        self.user = create_user("seeker@test.com", "jobseeker")
+        self.client.force_authenticate(self.user)
+
+    def upload_profile_pic(self, file):
+        response = self.client.patch(reverse("user-profile"), {"profile_pic": file}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_profile_pic_upload_is_resized_off_request(self):
+        response = self.upload_profile_pic(upload())
+
+        # served as uploaded until the worker has run
+        self.assertEqual(response.data["profile_pic_thumbnail"], response.data["profile_pic"])
+        task = ImageVariantTask.objects.get()
+        self.assertEqual((task.model, task.field, task.status), ("accounts.profile", "profile_pic", "Pending"))
+
+        self.assertIn("done", run_worker())
+        self.assertFalse(ImageVariantTask.objects.exists())
+
+        profile = self.user.profile
+        profile.refresh_from_db()
+        storage = profile.profile_pic.storage
+        sizes = profile.profile_pic_variants["sizes"]
+        self.assertEqual(profile.profile_pic_variants["source"], profile.profile_pic.name)
+        self.assertEqual(sorted(sizes), ["256", "96"])
+
+        with storage.open(sizes["256"]["webp"]) as f:
+            webp = Image.open(f)
+            self.assertEqual((webp.format, webp.size, webp.mode), ("WEBP", (256, 171), "RGBA"))
+        with storage.open(sizes["96"]["jpeg"]) as f:
+            jpeg = Image.open(f)
+            self.assertEqual((jpeg.format, jpeg.size, jpeg.mode), ("JPEG", (96, 64), "RGB"))
+
+        response = self.client.get(reverse("user-profile"))
+        self.assertEqual(response.data["profile_pic_thumbnail"], f"http://testserver/media/{sizes['256']['webp']}")
+        self.assertTrue(response.data["profile_pic"].endswith(profile.profile_pic.name))
+
+    def test_small_images_are_not_upscaled(self):
+        self.upload_profile_pic(upload(size=(50, 40), mode="RGB"))
+        run_worker()
+
+        profile = self.user.profile
+        profile.refresh_from_db()
+        with profile.profile_pic.storage.open(profile.profile_pic_variants["sizes"]["256"]["webp"]) as f:
+            self.assertEqual(Image.open(f).size, (50, 40))
+
+    def test_new_upload_supersedes_pending_variants(self):
+        self.upload_profile_pic(upload("first.png"))
+        run_worker()
+        profile = self.user.profile
+        profile.refresh_from_db()
+        storage = profile.profile_pic.storage
+        first = profile.profile_pic_variants["sizes"]["96"]["webp"]
+
+        self.upload_profile_pic(upload("second.png"))
+        # a task left over for the replaced upload is dropped
+        ImageVariantTask.objects.create(model="accounts.profile", object_id=profile.pk, field="profile_pic", source="profiles/first.png")
+        self.assertIn("done", run_worker())
+
+        profile.refresh_from_db()
+        self.assertIn("second", profile.profile_pic_variants["source"])
+        self.assertTrue(storage.exists(profile.profile_pic_variants["sizes"]["96"]["webp"]))
+        # variants of the replaced upload are removed
+        self.assertFalse(storage.exists(first))
+        self.assertFalse(ImageVariantTask.objects.exists())
+
+    def test_unreadable_image_is_retried_then_fails(self):
+        profile = self.user.profile
+        profile.profile_pic = ContentFile(b"not an image", name="broken.png")
+        profile.save()
+
+        with self.assertLogs("accounts.image_variants", "ERROR"):
+            self.assertIn("will retry", run_worker())
+        task = ImageVariantTask.objects.get()
+        self.assertEqual((task.status, task.attempts), (ImageVariantTask.Status.PENDING, 1))
+        self.assertGreater(task.next_attempt_at, timezone.now())
+        # not due yet
+        self.assertEqual(run_worker(), "")
+
+        with self.assertLogs("accounts.image_variants", "ERROR"):
+            for _ in range(MAX_ATTEMPTS - 1):
+                ImageVariantTask.objects.update(next_attempt_at=timezone.now())
+                output = run_worker()
+        self.assertIn("failed", output)
+        task = ImageVariantTask.objects.get()
+        self.assertEqual((task.status, task.attempts), (ImageVariantTask.Status.FAILED, MAX_ATTEMPTS))
+        self.assertTrue(task.error)
+        profile.refresh_from_db()
+        self.assertEqual(profile.profile_pic_variants, {})
+
+        # kept for a while to be looked at, then purged by the worker
+        run_worker()
+        self.assertTrue(ImageVariantTask.objects.exists())
+        ImageVariantTask.objects.update(created_at=timezone.now() - timedelta(days=8))
+        run_worker()
+        self.assertFalse(ImageVariantTask.objects.exists())
+
+    def test_saves_without_upload_queue_nothing(self):
+        self.upload_profile_pic(upload())
+        run_worker()
+
+        response = self.client.patch(reverse("user-profile"), {"name": "Seeker"}, format="multipart")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ImageVariantTask.objects.exists())
+        self.assertIsNone(variant_queue.claim_next())
+
+    def test_job_endpoints_pick_variant_per_size(self):
+        recruiter = create_recruiter_with_company()
+        company = recruiter.company
+        company.logo = ContentFile(image_bytes(mode="RGB", image_format="JPEG"), name="acme.jpg")
+        company.save()
+        job = Job.objects.create(
+            title="Backend Engineer",
+            company=company,
+            location="Remote",
+            deadline=localdate() + timedelta(days=5),
+            job_type="Full-time",
+            description="Test job",
+            created_by=recruiter,
+        )
+        detail_etag = self.client.get(reverse("job-detail", args=[job.pk]))["ETag"]
+        self.client.force_authenticate(None)
+        before = self.client.get(reverse("job-list"))
+        self.assertEqual(before["X-Cache"], "MISS")
+        updated_at = company.updated_at
+
+        with self.captureOnCommitCallbacks(execute=True):
+            generate_variants(variant_queue.claim_next())
+        company.refresh_from_db()
+        sizes = company.logo_variants["sizes"]
+        self.assertGreater(company.updated_at, updated_at)
+
+        # the cached anonymous page and the old validators no longer apply
+        listed = self.client.get(reverse("job-list"), HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual((listed.status_code, listed["X-Cache"]), (200, "MISS"))
+        self.client.force_authenticate(self.user)
+        detail = self.client.get(reverse("job-detail", args=[job.pk]), HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(detail.status_code, 200)
+
+        self.assertEqual(listed.data["results"][0]["company_logo"], f"http://testserver/media/{sizes['96']['webp']}")
+        self.assertEqual(detail.data["company_logo"], f"http://testserver/media/{sizes['256']['webp']}")
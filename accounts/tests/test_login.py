@@ -3,7 +3,12 @@ from rest_framework import status
 from django.urls import reverse
 from django.core.cache import cache
 
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+from accounts.backends import login_candidates
 
 User = get_user_model()
 
@@ -90,3 +95,31 @@ class LoginViewTest(APITestCase):
         response = self.client.post(self.url, payload)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # ✅ CASE-INSENSITIVE
+    def test_login_ignores_case(self):
+        for username in ("TestUser", "Test@Example.COM"):
+            response = self.client.post(self.url, {"username": username, "password": "StrongPass123"})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_username_match_wins_over_email(self):
+        other = User.objects.create_user(
+            username="test@example.com", email="other@example.com", password="OtherPass123"
+        )
+        self.assertEqual(
+            list(login_candidates("TEST@example.com").order_by("pk")), [self.user, other]
+        )
+
+        response = self.client.post(self.url, {"username": "test@example.com", "password": "OtherPass123"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], "other@example.com")
+
+    # ❌ FAILED LOGINS HASH ONCE
+    def test_failed_login_costs_one_hash(self):
+        for username in ("testuser", "nouser", "nouser@example.com"):
+            cache.clear()  # login throttle
+            with patch.object(PBKDF2PasswordHasher, "encode", autospec=True,
+                              side_effect=PBKDF2PasswordHasher.encode) as encode:
+                response = self.client.post(self.url, {"username": username, "password": "WrongPassword123"})
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+            self.assertEqual(encode.call_count, 1, username)
@@ -0,0 +1,103 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.otp import (
+    EXPIRED, INVALID, LOCKED, MISSING, VERIFIED, CacheOtpStore, DatabaseOtpStore, Purpose,
+)
+from accounts.utils import DAILY_RESEND_LIMIT, MAX_OTP_ATTEMPTS, OTP_EXPIRY_MINUTES, RESEND_COOLDOWN_SECONDS
+
+EMAIL = "otp@example.com"
+
+
+class OtpStoreTests:
+    store_class = None
+
+    def setUp(self):
+        cache.clear()
+        self.store = self.store_class()
+
+    def issue(self):
+        return self.store.issue(Purpose.REGISTRATION, EMAIL)
+
+    def verify(self, otp):
+        return self.store.verify(Purpose.REGISTRATION, EMAIL, otp)
+
+    def wrong(self, otp):
+        return "000000" if otp != "000000" else "111111"
+
+    def at(self, delta):
+        return patch("accounts.otp.timezone.now", return_value=timezone.now() + delta)
+
+    def test_verify_is_single_use(self):
+        otp, error = self.issue()
+        self.assertIsNone(error)
+        self.assertEqual(self.verify(otp), VERIFIED)
+        self.assertEqual(self.verify(otp), MISSING)
+
+    def test_purposes_are_separate(self):
+        otp, _ = self.issue()
+        self.assertEqual(self.store.verify(Purpose.PASSWORD_RESET, EMAIL, otp), MISSING)
+        self.assertEqual(self.store.issue(Purpose.PASSWORD_RESET, EMAIL)[1], None)
+
+    def test_missing_and_expired(self):
+        self.assertEqual(self.verify("123456"), MISSING)
+        otp, _ = self.issue()
+        with self.at(timedelta(minutes=OTP_EXPIRY_MINUTES, seconds=1)):
+            self.assertEqual(self.verify(otp), EXPIRED)
+
+    def test_locks_after_max_attempts(self):
+        otp, _ = self.issue()
+        for _ in range(MAX_OTP_ATTEMPTS):
+            self.assertEqual(self.verify(self.wrong(otp)), INVALID)
+        self.assertEqual(self.verify(otp), LOCKED)
+
+    def test_new_otp_resets_attempts(self):
+        otp, _ = self.issue()
+        for _ in range(MAX_OTP_ATTEMPTS):
+            self.verify(self.wrong(otp))
+
+        with self.at(timedelta(seconds=RESEND_COOLDOWN_SECONDS + 1)):
+            otp, _ = self.issue()
+            self.assertEqual(self.verify(otp), VERIFIED)
+
+    def test_cooldown(self):
+        self.issue()
+        self.assertIsNotNone(self.issue()[1])
+
+    def test_daily_limit(self):
+        for i in range(DAILY_RESEND_LIMIT):
+            with self.at(timedelta(seconds=i * (RESEND_COOLDOWN_SECONDS + 1))):
+                self.assertIsNone(self.issue()[1])
+        with self.at(timedelta(seconds=DAILY_RESEND_LIMIT * (RESEND_COOLDOWN_SECONDS + 1))):
+            otp, error = self.issue()
+        self.assertIsNone(otp)
+        self.assertIn("Daily", error)
+
+    def test_reset_clears_challenge_and_daily_count(self):
+        otp, _ = self.issue()
+        self.store.reset(Purpose.REGISTRATION, EMAIL)
+        self.assertEqual(self.verify(otp), MISSING)
+
+
+class CacheOtpStoreTest(OtpStoreTests, TestCase):
+    store_class = CacheOtpStore
+
+    # LocMemCache stands in for the shared cache; cooldown keys expire on
+    # real time, so step past them by clearing the key instead
+    def at(self, delta):
+        cache.delete_many([self.store._key(p, EMAIL, "cooldown") for p in Purpose])
+        return super().at(delta)
+
+
+class DatabaseOtpStoreTest(OtpStoreTests, TestCase):
+    store_class = DatabaseOtpStore
+
+    def test_verify_takes_no_row_locks(self):
+        otp, _ = self.issue()
+        with self.assertNumQueries(3), patch("django.db.models.QuerySet.select_for_update") as lock:
+            self.assertEqual(self.verify(otp), VERIFIED)
+        lock.assert_not_called()
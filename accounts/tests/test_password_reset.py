@@ -2,23 +2,24 @@ from rest_framework.test import APITestCase
 from django.test import override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
-from accounts.models import Profile
+from accounts.models import OtpChallenge
+from accounts.otp import otp_store, Purpose
 from unittest.mock import patch
 
 RESET_TOKEN_SALT = "password-reset"
 RESET_TOKEN_MAX_AGE_SECONDS = 15 * 60 
-DAILY_RESEND_LIMIT = 5
 
 from django.core.cache import cache
 import time
 from django.utils import timezone
 from datetime import timedelta
 from django.core import signing
-from accounts.utils import generate_otp, hash_otp
+from accounts.utils import DAILY_RESEND_LIMIT
 
 class ForgotPasswordViewTest(APITestCase):
 
     def setUp(self):
+        cache.clear()
         self.url = reverse("forgot-password")
         self.user = User.objects.create_user(
             username="testuser",
@@ -30,8 +31,8 @@ class ForgotPasswordViewTest(APITestCase):
         response = self.client.post(self.url, {"email": "test@example.com"})
 
         self.assertEqual(response.status_code, 200)
-        profile = Profile.objects.get(user=self.user)
-        self.assertIsNotNone(profile.otp_hash)
+        challenge = OtpChallenge.objects.get(purpose=Purpose.PASSWORD_RESET, subject="test@example.com")
+        self.assertTrue(challenge.otp_hash)
 
     @patch("accounts.views.send_otp_email")
     def test_forgot_password_non_existing_user(self, mock_send):
@@ -41,10 +42,20 @@ class ForgotPasswordViewTest(APITestCase):
         mock_send.assert_not_called()
 
     def test_forgot_password_resend_rate_limited(self):
-        profile = Profile.objects.get(user=self.user)
-        profile.otp_resend_count = DAILY_RESEND_LIMIT
-        profile.last_otp_sent_at = timezone.now()
-        profile.save()
+        otp_store().issue(Purpose.PASSWORD_RESET, "test@example.com")
+
+        response = self.client.post(self.url, {"email": "test@example.com"})
+
+        self.assertEqual(response.status_code, 429)
+
+    def test_forgot_password_daily_limit(self):
+        OtpChallenge.objects.create(
+            purpose=Purpose.PASSWORD_RESET,
+            subject="test@example.com",
+            last_sent_at=timezone.now() - timedelta(hours=1),
+            sent_on=timezone.now().date(),
+            sent_count=DAILY_RESEND_LIMIT,
+        )
 
         response = self.client.post(self.url, {"email": "test@example.com"})
 
@@ -67,12 +78,7 @@ class VerifyForgotOtpViewTest(APITestCase):
             email="test@example.com",
             password="Test@1234"
         )
-        self.profile = Profile.objects.get(user=self.user)
-
-        self.otp = generate_otp()
-        self.profile.otp_hash = hash_otp(self.otp)
-        self.profile.otp_created_at = timezone.now()
-        self.profile.save()
+        self.otp, _ = otp_store().issue(Purpose.PASSWORD_RESET, "test@example.com")
 
 
     def test_verify_valid_otp(self):
@@ -87,19 +93,18 @@ class VerifyForgotOtpViewTest(APITestCase):
     def test_verify_invalid_otp(self):
         response = self.client.post(self.url, {
             "email": "test@example.com",
-            "otp": "000000"
+            "otp": "000000" if self.otp != "000000" else "111111"
         })
 
         self.assertEqual(response.status_code, 400)
 
     def test_expired_otp(self):
-        self.profile.otp_created_at = timezone.now() - timedelta(minutes=20)
-        self.profile.save()
-
-        response = self.client.post(self.url, {
-            "email": "test@example.com",
-            "otp": self.otp
-        })
+        later = timezone.now() + timedelta(minutes=20)
+        with patch("accounts.otp.timezone.now", return_value=later):
+            response = self.client.post(self.url, {
+                "email": "test@example.com",
+                "otp": self.otp
+            })
 
         self.assertEqual(response.status_code, 400)
     
@@ -109,8 +114,11 @@ class VerifyForgotOtpViewTest(APITestCase):
             "otp": self.otp
         })
 
-        self.profile.refresh_from_db()
-        self.assertIsNone(self.profile.otp_hash)
+        response = self.client.post(self.url, {
+            "email": "test@example.com",
+            "otp": self.otp
+        })
+        self.assertEqual(response.status_code, 400)
 
 
 @override_settings(
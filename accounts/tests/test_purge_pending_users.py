@@ -0,0 +1,52 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import OtpChallenge, PendingUser
+from accounts.purge import PENDING_USER_TTL, purge_pending_users
+
+
+class PurgePendingUsersTest(TestCase):
+
+    def create(self, email, age):
+        pending = PendingUser.objects.create(email=email, username=email.split("@")[0])
+        # auto_now_add stamps now(); age the row afterwards
+        PendingUser.objects.filter(pk=pending.pk).update(created_at=timezone.now() - age)
+        OtpChallenge.objects.create(
+            purpose=OtpChallenge.Purpose.REGISTRATION,
+            subject=email,
+            last_sent_at=timezone.now() - age,
+        )
+        return pending
+
+    def test_purges_only_expired_in_batches(self):
+        for i in range(5):
+            self.create(f"old{i}@example.com", PENDING_USER_TTL + timedelta(hours=i + 1))
+        self.create("new@example.com", timedelta(days=1))
+
+        self.assertEqual(list(purge_pending_users(batch_size=2)), [2, 2, 1])
+
+        self.assertEqual(list(PendingUser.objects.values_list("email", flat=True)), ["new@example.com"])
+        self.assertEqual(list(OtpChallenge.objects.values_list("subject", flat=True)), ["new@example.com"])
+
+    def test_recent_otp_challenge_survives(self):
+        self.create("old@example.com", PENDING_USER_TTL + timedelta(days=1))
+        OtpChallenge.objects.update(last_sent_at=timezone.now())
+
+        self.assertEqual(sum(purge_pending_users()), 1)
+        self.assertTrue(OtpChallenge.objects.exists())
+
+    def test_command_reports_rate(self):
+        self.create("old@example.com", timedelta(days=3))
+
+        call_command("purge_pending_users", "--days", "7", stdout=StringIO())
+        self.assertTrue(PendingUser.objects.exists())
+
+        out = StringIO()
+        call_command("purge_pending_users", "--days", "2", stdout=out)
+        self.assertFalse(PendingUser.objects.exists())
+        self.assertIn("Purged 1 pending registrations", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
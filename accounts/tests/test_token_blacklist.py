@@ -0,0 +1,98 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+
+from accounts.blacklist import prune_expired_tokens
+from jobs.tests.utils import create_user
+
+
+class TokenBlacklistTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user("seeker@test.com", "jobseeker")
+        response = self.client.post(reverse("login"), {"username": "seeker@test.com", "password": "testpass123"})
+        self.access, self.refresh = response.data["access"], response.data["refresh"]
+
+    def refresh_token(self, refresh):
+        return self.client.post(reverse("token-refresh"), {"refresh": refresh})
+
+    def logout(self, refresh):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access}")
+        return self.client.post(reverse("logout"), {"refresh": refresh})
+
+    def test_logout_revokes_refresh_token(self):
+        self.assertEqual(self.logout(self.refresh).status_code, 200)
+        jti = RefreshToken(self.refresh, verify=False)["jti"]
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=jti).exists())
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+
+    def test_logout_requires_own_valid_token(self):
+        self.assertEqual(self.logout("").status_code, 400)
+        self.assertEqual(self.logout("not-a-token").status_code, 400)
+
+        create_user("other@test.com", "jobseeker")
+        other = self.client.post(reverse("login"), {"username": "other@test.com", "password": "testpass123"})
+        self.assertEqual(self.logout(other.data["refresh"]).status_code, 400)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_rotated_token_cannot_be_reused(self):
+        response = self.refresh_token(self.refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+        self.assertEqual(self.refresh_token(response.data["refresh"]).status_code, 200)
+
+    @override_settings(TOKEN_BLACKLIST_CACHE=True)
+    def test_cache_answers_blacklist_checks(self):
+        cache.clear()
+        response = self.client.post(reverse("login"), {"username": "seeker@test.com", "password": "testpass123"})
+        refresh = response.data["refresh"]
+
+        with patch.object(BlacklistMixin, "check_blacklist") as database_check:
+            rotated = self.refresh_token(refresh)
+            self.assertEqual(rotated.status_code, 200)
+            self.assertEqual(self.refresh_token(refresh).status_code, 401)
+            self.assertEqual(self.logout(rotated.data["refresh"]).status_code, 200)
+            self.assertEqual(self.refresh_token(rotated.data["refresh"]).status_code, 401)
+        database_check.assert_not_called()
+
+    @override_settings(TOKEN_BLACKLIST_CACHE=True)
+    def test_unknown_token_falls_back_to_database(self):
+        # issued before the cache was enabled
+        self.assertEqual(self.logout(self.refresh).status_code, 200)
+        cache.clear()
+        self.assertEqual(self.refresh_token(self.refresh).status_code, 401)
+
+
+class PruneTokenBlacklistTest(APITestCase):
+
+    def create_token(self, jti, expires_in, blacklisted=False):
+        token = OutstandingToken.objects.create(
+            jti=jti, token=jti, created_at=timezone.now(), expires_at=timezone.now() + expires_in
+        )
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+
+    def test_prunes_only_expired_tokens_in_batches(self):
+        for i in range(3):
+            self.create_token(f"old-{i}", timedelta(hours=-1 - i), blacklisted=i % 2 == 0)
+        self.create_token("live", timedelta(hours=1), blacklisted=True)
+
+        self.assertEqual(list(prune_expired_tokens(batch_size=2)), [2, 1])
+        self.assertEqual(list(OutstandingToken.objects.values_list("jti", flat=True)), ["live"])
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+    def test_command(self):
+        self.create_token("old", timedelta(hours=-1))
+        out = StringIO()
+        call_command("prune_token_blacklist", stdout=out)
+        self.assertIn("Pruned 1 expired refresh tokens", out.getvalue())
@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts import tokens
+from accounts.models import Profile
+from jobs.tests.utils import create_user
+
+
+@override_settings(TOKEN_CLAIMS_CACHE=True)
+class TokenClaimsTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user("seeker@test.com", "jobseeker")
+
+    def login(self):
+        response = self.client.post(reverse("login"), {"username": "seeker@test.com", "password": "testpass123"})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def get_applied(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.get(reverse("applied-jobs"))
+
+    def test_login_token_carries_claims(self):
+        token = AccessToken(self.login()["access"])
+        self.assertEqual(token["role"], "jobseeker")
+        self.assertEqual(token["profile_id"], self.user.profile.pk)
+        self.assertEqual(token["claims_version"], self.user.profile.claims_version)
+
+    def test_authorized_read_skips_user_and_profile(self):
+        access = self.login()["access"]
+        self.assertEqual(self.get_applied(access).status_code, 200)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_applied(access).status_code, 200)
+
+        tables = " ".join(query["sql"] for query in queries.captured_queries)
+        self.assertNotIn('"auth_user"', tables)
+        self.assertNotIn('"accounts_profile"', tables)
+
+    @override_settings(TOKEN_CLAIMS_CACHE=False)
+    def test_claims_ignored_without_shared_cache(self):
+        access = self.login()["access"]
+        self.assertEqual(self.get_applied(access).status_code, 200)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get_applied(access).status_code, 200)
+
+        self.assertIn('"auth_user"', " ".join(query["sql"] for query in queries.captured_queries))
+
+    def test_claims_user_is_active_comes_from_the_user_row(self):
+        access = self.login()["access"]
+        self.get_applied(access)
+        # deactivated behind the signals' back: is_active is not taken on trust
+        type(self.user).objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        request = self.client.get(reverse("applied-jobs")).renderer_context["request"]
+        self.assertFalse(request.user.is_active)
+
+    def test_role_change_invalidates_claims(self):
+        access = self.login()["access"]
+        profile = Profile.objects.get(user=self.user)
+        profile.role = "recruiter"
+        profile.save()
+
+        self.assertEqual(self.get_applied(access).status_code, 403)
+
+    def test_partial_save_role_change_invalidates_claims(self):
+        access = self.login()["access"]
+        profile = Profile.objects.get(user=self.user)
+        profile.role = "recruiter"
+        profile.save(update_fields=["role"])
+
+        self.assertEqual(self.get_applied(access).status_code, 403)
+
+    def test_deactivation_invalidates_claims(self):
+        access = self.login()["access"]
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.get_applied(access).status_code, 401)
+
+    def test_bump_caches_the_new_version_after_commit(self):
+        key = tokens._version_key(self.user.pk)
+        old = tokens.claims_version(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tokens.bump_claims_version(self.user.pk)
+            self.assertEqual(cache.get(key), old)
+        self.assertEqual(cache.get(key), old + 1)
+
+    def test_stale_fill_does_not_outlive_a_bump(self):
+        key = tokens._version_key(self.user.pk)
+        read = tokens._stored_version
+        bumped = []
+
+        def read_then_bump(user_id):
+            # the row is read, then a bump commits before this request caches it
+            version = read(user_id)
+            if not bumped:
+                bumped.append(version)
+                with self.captureOnCommitCallbacks(execute=True):
+                    tokens.bump_claims_version(user_id)
+            return version
+
+        with patch("accounts.tokens._stored_version", side_effect=read_then_bump):
+            old = tokens.claims_version(self.user.pk)
+
+        self.assertEqual(cache.get(key), old + 1)
+        self.assertEqual(tokens.claims_version(self.user.pk), old + 1)
+
+    def test_refresh_restamps_role(self):
+        refresh = self.login()["refresh"]
+        profile = Profile.objects.get(user=self.user)
+        profile.role = "recruiter"
+        profile.save()
+
+        response = self.client.post(reverse("token-refresh"), {"refresh": refresh})
+        self.assertEqual(response.status_code, 200)
+        token = AccessToken(response.data["access"])
+        self.assertEqual(token["role"], "recruiter")
+        self.assertEqual(token["claims_version"], Profile.objects.get(user=self.user).claims_version)
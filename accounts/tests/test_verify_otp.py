@@ -4,10 +4,12 @@ from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 from django.core.cache import cache
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from accounts.models import PendingUser
-from accounts.utils import hash_otp, OTP_EXPIRY_MINUTES
+from accounts.models import OtpChallenge, PendingUser
+from accounts.otp import otp_store, Purpose
+from accounts.utils import OTP_EXPIRY_MINUTES
 
 User = get_user_model()
 
@@ -27,52 +29,44 @@ class VerifyOtpViewTest(APITestCase):
             name="Test User",
             role="jobseeker",
             password="StrongPass123",
-            otp_hash=hash_otp("123456"),
-            otp_created_at=timezone.now(),
-            otp_attempts=0,
         )
+        self.otp, _ = otp_store().issue(Purpose.REGISTRATION, "test@example.com")
 
-    def test_verify_otp_success(self):
-        response = self.client.post(self.url, {
+    def verify(self, otp):
+        return self.client.post(self.url, {
             "email": "test@example.com",
-            "otp": "123456",
+            "otp": otp,
         })
 
+    def test_verify_otp_success(self):
+        response = self.verify(self.otp)
+
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(User.objects.filter(email="test@example.com").exists())
         self.assertFalse(PendingUser.objects.filter(email="test@example.com").exists())
 
+    def test_otp_is_single_use(self):
+        self.assertEqual(self.verify(self.otp).status_code, status.HTTP_200_OK)
+        cache.clear()  # verify_otp throttle
+        self.assertEqual(self.verify(self.otp).status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_invalid_otp_increments_attempts(self):
-        response = self.client.post(self.url, {
-            "email": "test@example.com",
-            "otp": "000000",
-        })
+        response = self.verify("000000" if self.otp != "000000" else "111111")
 
-        self.pending_user.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(self.pending_user.otp_attempts, 1)
+        self.assertEqual(OtpChallenge.objects.get(subject="test@example.com").attempts, 1)
 
     def test_otp_expired(self):
-        self.pending_user.otp_created_at = timezone.now() - timedelta(
-            minutes=OTP_EXPIRY_MINUTES + 1
-        )
-        self.pending_user.save()
-
-        response = self.client.post(self.url, {
-            "email": "test@example.com",
-            "otp": "123456",
-        })
+        later = timezone.now() + timedelta(minutes=OTP_EXPIRY_MINUTES + 1)
+        with patch("accounts.otp.timezone.now", return_value=later):
+            response = self.verify(self.otp)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_too_many_attempts_blocked(self):
-        self.pending_user.otp_attempts = 5
-        self.pending_user.save()
+        OtpChallenge.objects.filter(subject="test@example.com").update(attempts=5)
 
-        response = self.client.post(self.url, {
-            "email": "test@example.com",
-            "otp": "123456",
-        })
+        response = self.verify(self.otp)
 
         self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
 
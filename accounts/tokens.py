@@ -0,0 +1,170 @@
+"""
+JWT claims for the common authorization checks.
+
+Tokens carry the user's role, profile id and the profile's claims_version, so
+ClaimsJWTAuthentication can answer "who is this and what role" without
+loading User or Profile. Profile.claims_version is bumped when the role or
+the account's active flag changes; a token whose version no longer matches
+(checked against the cache, see claims_version) is handled the stock way,
+from the database, until the client refreshes it. Once the bump commits, the
+new version is written to the cache, which reaches every worker only through
+a shared cache, so the fast path is off unless settings.TOKEN_CLAIMS_CACHE is
+set.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .blacklist import CachedBlacklistMixin
+from .models import Profile
+
+ROLE_CLAIM = "role"
+PROFILE_CLAIM = "profile_id"
+VERSION_CLAIM = "claims_version"
+CLAIMS = (ROLE_CLAIM, PROFILE_CLAIM, VERSION_CLAIM)
+
+
+def _version_key(user_id):
+    return f"auth:claims-version:{user_id}"
+
+
+def _version_timeout():
+    # tokens older than this have expired anyway
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+def _stored_version(user_id):
+    return Profile.objects.filter(user_id=user_id).values_list("claims_version", flat=True).first()
+
+
+def claims_version(user_id):
+    """Current claims_version of the user's profile; cached, read from the database on a miss."""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = _stored_version(user_id)
+        if version is None:
+            return None
+        # add, not set: a request that read the row just before a bump committed
+        # must not replace the version the bump cached (store_claims_version)
+        cache.add(key, version, timeout=_version_timeout())
+    return version
+
+
+def bump_claims_version(user_id):
+    """Invalidate the claims of every token issued to the user so far."""
+    Profile.objects.filter(user_id=user_id).update(claims_version=F("claims_version") + 1)
+    store_claims_version(user_id)
+
+
+def store_claims_version(user_id):
+    """Once the transaction commits, cache the user's new claims_version over the old one."""
+    def store():
+        version = _stored_version(user_id)
+        if version is None:
+            cache.delete(_version_key(user_id))
+        else:
+            cache.set(_version_key(user_id), version, timeout=_version_timeout())
+
+    # after commit: before it, the row still holds the old version for everyone else
+    transaction.on_commit(store)
+
+
+def stamp_claims(token, profile):
+    """Write the profile's claims into `token`, or drop them if there is no profile."""
+    if profile is None:
+        for claim in CLAIMS:
+            token.payload.pop(claim, None)
+        return token
+    token[ROLE_CLAIM] = profile["role"]
+    token[PROFILE_CLAIM] = profile["pk"]
+    token[VERSION_CLAIM] = profile["claims_version"]
+    return token
+
+
+def _profile_claims(user_id):
+    return Profile.objects.filter(user_id=user_id).values("pk", "role", "claims_version").first()
+
+
+class ClaimsRefreshToken(CachedBlacklistMixin, RefreshToken):
+    """RefreshToken whose pairs carry the role / profile claims (blacklist checks: accounts.blacklist)."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        return stamp_claims(token, _profile_claims(user.pk))
+
+    @property
+    def access_token(self):
+        if self.token is not None:
+            # a refresh: re-read the claims so the new pair (and a rotated
+            # refresh token) never carries a stale role
+            stamp_claims(self, _profile_claims(self[api_settings.USER_ID_CLAIM]))
+        return super().access_token
+
+
+class ClaimsUser(SimpleLazyObject):
+    """
+    request.user built from current token claims. id, role and profile_id
+    come from the token; it passes for a User in ORM filters
+    (`filter(user=request.user)`) without a query, and anything else
+    (is_active included) loads the User row on first access.
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token, load_user):
+        self.__dict__["token"] = token
+        super().__init__(load_user)
+
+    @property
+    def __class__(self):
+        return get_user_model()
+
+    @property
+    def _meta(self):
+        return get_user_model()._meta
+
+    @property
+    def pk(self):
+        return self.token[api_settings.USER_ID_CLAIM]
+
+    id = pk
+
+    @property
+    def role(self):
+        return self.token[ROLE_CLAIM]
+
+    @property
+    def profile_id(self):
+        return self.token[PROFILE_CLAIM]
+
+    def __bool__(self):
+        return True
+
+
+def user_role(user):
+    """Role from the token claims when present, else from the profile row."""
+    if isinstance(user, ClaimsUser):
+        return user.role
+    profile = getattr(user, "profile", None)
+    return profile.role if profile else None
+
+
+def user_profile_id(user):
+    if isinstance(user, ClaimsUser):
+        return user.profile_id
+    profile = getattr(user, "profile", None)
+    return profile.pk if profile else None
+
+
+def user_profile(user):
+    """The user's Profile, without loading the User row for a claims user."""
+    if isinstance(user, ClaimsUser):
+        return Profile.objects.get(pk=user.profile_id)
+    return user.profile
@@ -1,6 +1,6 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import RegisterView, SendOtpView, VerifyOtpView, CustomTokenObtainPairView, GoogleLoginView, ProfileAPIView, LogoutView, ForgotPasswordView, VerifyForgotOtpView, ResetPasswordView
+from .views import RegisterView, SendOtpView, VerifyOtpView, CustomTokenObtainPairView, GoogleLoginView, ProfileAPIView, LogoutView, ForgotPasswordView, VerifyForgotOtpView, ResetPasswordView, OutboundHttpStatsView
 
 urlpatterns = [
     path('refresh/', TokenRefreshView.as_view(), name='token-refresh'),
@@ -19,5 +19,7 @@ urlpatterns = [
     path("forgot-password/verify-otp/", VerifyForgotOtpView.as_view(), name="verify-forgot-otp"),
     path("forgot-password/reset/", ResetPasswordView.as_view(), name="reset-password"),
 
+    path("http-stats/", OutboundHttpStatsView.as_view(), name="http-stats"),
+
 ]
 
@@ -3,8 +3,8 @@ import logging
 import secrets
 from django.utils import timezone
 from django.db import transaction
-from threading import Thread
-from accounts.email_service import send_email
+from datetime import timedelta
+from accounts.outbox import enqueue_email
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,7 @@ OTP_LENGTH = 6
 OTP_EXPIRY_MINUTES = 5
 RESEND_COOLDOWN_SECONDS = 30
 DAILY_RESEND_LIMIT = 10
+MAX_OTP_ATTEMPTS = 5
 
 def generate_otp():
     """Generate a random numeric OTP."""
@@ -24,7 +25,8 @@ def hash_otp(otp: str) -> str:
     return hashlib.sha256(otp.encode()).hexdigest()
 
 
-def send_otp_email_via_provider(email, name, raw_otp, purpose):
+def otp_email_content(name, raw_otp, purpose):
+    """(subject, text, html) of the OTP email."""
     subject = f"JobLane - Your OTP for {purpose.capitalize()}"
 
     text_content = f"""
@@ -103,53 +105,31 @@ If you didn’t request this, you can safely ignore this email.
 </html>
 """.strip()
 
-    return send_email(
-        email=email,
-        name=name,
-        subject=subject,
-        text_content=text_content,
-        html_content=html_content,
-    )
+    return subject, text_content, html_content
 
 
-def send_otp_email(obj, email: str, name: str, purpose: str = "verify"):
+def send_otp_email(email: str, name: str, purpose):
     """
-    Works for both User.profile and PendingUser, as long as fields exist.
-    - obj must have: otp_hash, otp_created_at, last_otp_sent_at, otp_resend_count, otp_attempts
-    - email is recipient's email
-    - name is recipient's name
+    Issue a new OTP challenge for `email` (see accounts.otp) and queue the
+    email carrying it. `purpose` is an OtpChallenge.Purpose.
+    Returns (sent, message); not sent while the cooldown or daily limit applies.
     """
-    now = timezone.now()
+    from accounts.otp import otp_store
 
     with transaction.atomic():
-      obj = obj.__class__.objects.select_for_update().get(pk=obj.pk)
-      # === Cooldown check ===
-      if obj.last_otp_sent_at and (now - obj.last_otp_sent_at).total_seconds() < RESEND_COOLDOWN_SECONDS:
-          return False, "OTP recently sent. Please wait before requesting again."
-
-      # === Daily resend limit ===
-      if obj.otp_resend_count >= DAILY_RESEND_LIMIT:
-          if obj.last_otp_sent_at and obj.last_otp_sent_at.date() < now.date():
-              obj.otp_resend_count = 0
-
-          else:
-              return False, "Daily OTP limit reached. Try again tomorrow."
-
-      # === Generate new OTP ===
-      raw_otp = generate_otp()
-      obj.otp_hash = hash_otp(raw_otp)
-      obj.otp_created_at = now
-      obj.last_otp_sent_at = now
-      obj.otp_resend_count += 1
-      obj.otp_attempts = 0
-      obj.save()
-
-    success = send_otp_email_via_provider(email, name, raw_otp, purpose)
-
-    if not success:
-            # optional rollback / mark failure
-        logger.error("OTP email failed")
+        raw_otp, error = otp_store().issue(purpose, email)
+        if raw_otp is None:
+            return False, error
+
+        # delivered by `manage.py drain_email_outbox`
+        subject, text_content, html_content = otp_email_content(name, raw_otp, purpose.label)
+        enqueue_email(
+            email=email,
+            name=name,
+            subject=subject,
+            text_content=text_content,
+            html_content=html_content,
+            expires_at=timezone.now() + timedelta(minutes=OTP_EXPIRY_MINUTES),
+        )
 
     return True, "OTP sent"
-
-
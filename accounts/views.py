@@ -1,7 +1,4 @@
 # Third-party libraries
-import hmac
-import requests
-from datetime import timedelta
 from django.core import signing
 from django.conf import settings
 from django.utils import timezone
@@ -11,24 +8,22 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.generics import RetrieveUpdateAPIView,CreateAPIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.parsers import MultiPartParser, FormParser
 from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+from joblane import http
 
 
 # Local imports
 from .throttles import RegisterThrottle, SendOtpThrottle, VerifyOtpThrottle,ForgetPasswordThrottle,VerifyForgetOtpThrottle,ResetPasswordThrottle,LoginThrottle, GoogleLoginThrottle
 from .serializers import RegisterSerializer, VerifyOtpSerializer, SendOtpSerializer,CustomTokenObtainPairSerializer, ProfileSerializer, ForgotPasswordSerializer, VerifyForgotOtpSerializer, ResetPasswordSerializer
 from .models import Profile, PendingUser
-from .utils import hash_otp, OTP_EXPIRY_MINUTES, send_otp_email
-
-MAX_OTP_ATTEMPTS = 5
-MAX_OTP_RESENDS = 5
-RESEND_COOLDOWN_SECONDS = 30
-
+from .otp import otp_store, Purpose, VERIFIED, LOCKED, EXPIRED, MISSING
+from .utils import send_otp_email
+from .tokens import ClaimsRefreshToken
 
 User = get_user_model()
 
@@ -60,14 +55,15 @@ class RegisterView(CreateAPIView):
 
             raw_password = serializer.validated_data["password"]
             pending_user.set_password(raw_password)
+            # registering again restarts the expiry (accounts.purge)
+            pending_user.created_at = timezone.now()
             pending_user.save()
 
         # 🔥 SINGLE SOURCE OF TRUTH FOR OTP
         success, msg = send_otp_email(
-            obj=pending_user,
             email=pending_user.email,
             name=pending_user.name,
-            purpose="account verification",
+            purpose=Purpose.REGISTRATION,
         )
 
         if not success:
@@ -95,19 +91,17 @@ class SendOtpView(APIView):
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data["email"]
 
-        try:
-            pending_user = PendingUser.objects.get(email=email)
-        except PendingUser.DoesNotExist:
+        pending_user = PendingUser.objects.only("email", "name").filter(email=email).first()
+        if pending_user is None:
             return Response(
                 {"error": "Invalid email or OTP."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         success, msg = send_otp_email(
-            obj=pending_user,
             email=pending_user.email,
             name=pending_user.name,
-            purpose="account verification",
+            purpose=Purpose.REGISTRATION,
         )
 
         if not success:
@@ -128,43 +122,23 @@ class VerifyOtpView(APIView):
         email = serializer.validated_data["email"]
         otp = serializer.validated_data["otp"]
 
+        # Expiry, brute-force limit and single use (accounts.otp)
+        result = otp_store().verify(Purpose.REGISTRATION, email, otp)
+        if result == LOCKED:
+            return Response(
+                {"error": "Too many invalid OTP attempts. Please request a new OTP."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+        if result != VERIFIED:
+            return Response(
+                {"error": "Invalid email or OTP."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         try:
+            # the OTP was consumed above, so no other request gets this far for the email
             with transaction.atomic():
-                pending_user = (
-                    PendingUser.objects
-                    .select_for_update()
-                    .get(email=email)
-                )
-
-                #  Brute-force protection
-                if pending_user.otp_attempts >= MAX_OTP_ATTEMPTS:
-                    return Response(
-                        {"error": "Too many invalid OTP attempts. Please request a new OTP."},
-                        status=status.HTTP_429_TOO_MANY_REQUESTS,
-                    )
-
-                # OTP existence
-                if not pending_user.otp_hash:
-                    return Response(
-                        {"error": "Invalid email or OTP."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                # OTP expiry
-                if (not pending_user.otp_created_at or timezone.now() - pending_user.otp_created_at > timedelta(minutes=OTP_EXPIRY_MINUTES)):
-                    return Response(
-                        {"error": "Invalid email or OTP."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-
-                # OTP match (constant-time)
-                if not hmac.compare_digest(hash_otp(otp), pending_user.otp_hash):
-                    pending_user.otp_attempts += 1
-                    pending_user.save(update_fields=["otp_attempts"])
-                    return Response(
-                        {"error": "Invalid email or OTP."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+                pending_user = PendingUser.objects.get(email=email)
 
                 # Prevent duplicates
                 if User.objects.filter(username=pending_user.username).exists():
@@ -203,7 +177,7 @@ class VerifyOtpView(APIView):
             )
 
         # JWT outside transaction
-        refresh = RefreshToken.for_user(user)
+        refresh = ClaimsRefreshToken.for_user(user)
 
         return Response(
             {
@@ -241,7 +215,7 @@ class GoogleLoginView(APIView):
 
         try:
             # Exchange authorization code for tokens
-            token_response = requests.post(
+            token_response = http.post(
                 "https://oauth2.googleapis.com/token",
                 data={
                     "code": code,
@@ -273,7 +247,7 @@ class GoogleLoginView(APIView):
             # Verify ID token
             id_info = id_token.verify_oauth2_token(
                 id_token_str,
-                google_requests.Request(),
+                http.google_request(),
                 settings.GOOGLE_CLIENT_ID,
             )
 
@@ -298,7 +272,7 @@ class GoogleLoginView(APIView):
             profile.save()
 
             # Issue JWT
-            refresh = RefreshToken.for_user(user)
+            refresh = ClaimsRefreshToken.for_user(user)
 
             return Response(
                 {
@@ -324,6 +298,14 @@ class GoogleLoginView(APIView):
             )
 
 
+# ===== Outbound HTTP Stats =====
+class OutboundHttpStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(http.http_stats())
+
+
 # ===== Profile View =====
 class ProfileAPIView(RetrieveUpdateAPIView):
     serializer_class = ProfileSerializer
@@ -336,32 +318,33 @@ class ProfileAPIView(RetrieveUpdateAPIView):
     
 
 # ===== Logout View=====
-# class LogoutView(APIView):
-#     permission_classes = [IsAuthenticated]
-
-#     def post(self, request):
-#         refresh_token = request.data.get("refresh_token")
-#         if not refresh_token:
-#             return Response(
-#                 {"error": "Refresh token is required"},
-#                 status=400
-#             )
-
-#         try:
-#             token = RefreshToken(refresh_token)
-#             token.blacklist()
-#         except TokenError:
-#             return Response(
-#                 {"error": "Invalid or expired token"},
-#                 status=400
-#             )
-
-#         return Response(status=205)
-
 class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        refresh_token = request.data.get("refresh") or request.data.get("refresh_token")
+        if not refresh_token:
+            return Response(
+                {"error": "Refresh token is required"},
+                status=400
+            )
+
+        try:
+            token = ClaimsRefreshToken(refresh_token)
+        except TokenError:
+            return Response(
+                {"error": "Invalid or expired token"},
+                status=400
+            )
+
+        if str(token.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+            return Response(
+                {"error": "Invalid or expired token"},
+                status=400
+            )
+
+        # revoked in the database and the blacklist cache (accounts.blacklist)
+        token.blacklist()
         return Response({"message": "Logged out"}, status=200)
 
 
@@ -390,14 +373,13 @@ class ForgotPasswordView(APIView):
                 status=200
             )
 
-        profile, _ = Profile.objects.get_or_create(user=user)
+        name = Profile.objects.filter(user=user).values_list("name", flat=True).first()
 
         # 🔥 ONE LINE DOES EVERYTHING (first-time + resend)
         success, msg = send_otp_email(
-            obj=profile,
             email=user.email,
-            name=profile.name or user.username,
-            purpose="password reset",
+            name=name or user.username,
+            purpose=Purpose.PASSWORD_RESET,
         )
 
         if not success:
@@ -417,38 +399,28 @@ class VerifyForgotOtpView(APIView):
         email = serializer.validated_data["email"]
         otp = serializer.validated_data["otp"]
 
-        user = User.objects.only("id", "email", "username").filter(email=email).first()
-        if user is None:
-            return Response({"error": "Invalid request."}, status=400)
-
-        profile, _ = Profile.objects.get_or_create(user=user)
+        # challenges are only issued for registered emails (ForgotPasswordView);
+        # a verified one is used up
+        result = otp_store().verify(Purpose.PASSWORD_RESET, email, otp)
 
-        if not profile.otp_hash or not profile.otp_created_at:
+        if result == MISSING:
             return Response({"error": "No OTP requested."}, status=400)
 
         # Expiry check
-        if timezone.now() - profile.otp_created_at > timedelta(minutes=OTP_EXPIRY_MINUTES):
+        if result == EXPIRED:
             return Response({"error": "OTP expired."}, status=400)
 
         # Attempt limit
-        if profile.otp_attempts >= MAX_OTP_ATTEMPTS:
+        if result == LOCKED:
             return Response(
                 {"error": "OTP attempts exceeded. Please request a new OTP."},
                 status=400
             )
 
         # OTP match
-        if hash_otp(otp) != profile.otp_hash:
-            profile.otp_attempts += 1
-            profile.save(update_fields=["otp_attempts"])
+        if result != VERIFIED:
             return Response({"error": "Invalid OTP."}, status=400)
 
-        # OTP verified → clear OTP
-        profile.otp_hash = None
-        profile.otp_created_at = None
-        profile.otp_attempts = 0
-        profile.save(update_fields=["otp_hash", "otp_created_at", "otp_attempts"])
-
         # Issue reset token
         reset_token = signing.dumps(
             {"email": email},
@@ -498,19 +470,7 @@ class ResetPasswordView(APIView):
             user.set_password(new_password)
             user.save(update_fields=["password"])
 
-            profile, _ = Profile.objects.get_or_create(user=user)
-            profile.otp_hash = None
-            profile.otp_created_at = None
-            profile.otp_attempts = 0
-            profile.otp_resend_count = 0
-            profile.save(
-                update_fields=[
-                    "otp_hash",
-                    "otp_created_at",
-                    "otp_attempts",
-                    "otp_resend_count",
-                ]
-            )
+            otp_store().reset(Purpose.PASSWORD_RESET, user.email)
 
         return Response(
             {
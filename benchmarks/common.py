@@ -0,0 +1,232 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against the database configured by DATABASE_URL (Postgres),
+seed their own rows inside a transaction and roll everything back at the end.
+
+    python -m benchmarks.job_search --jobs 100000
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+TITLES = [
+    "Python Developer", "Django Developer", "React Developer", "Backend Engineer",
+    "Frontend Engineer", "Data Analyst", "Data Scientist", "DevOps Engineer",
+    "Android Developer", "iOS Developer", "QA Engineer", "Product Manager",
+    "UI/UX Designer", "Machine Learning Engineer", "Java Developer", "Node.js Developer",
+]
+LOCATIONS = [
+    "Bangalore", "Pune", "Mumbai", "Delhi", "Hyderabad", "Chennai",
+    "Noida", "Gurgaon", "Kolkata", "Ahmedabad", "Remote",
+]
+SKILLS = [
+    "python", "django", "react", "javascript", "typescript", "sql", "postgres",
+    "docker", "kubernetes", "aws", "java", "spring", "kotlin", "swift", "figma",
+    "pandas", "numpy", "pytorch", "node", "css", "html", "git", "linux", "redis",
+]
+EXPERIENCES = ["Fresher", "0-1 years", "0+ years", "1-3 years", "2 years", "3-5 years", "5+ years"]
+CTCS = ["3 LPA", "4-6 LPA", "6 LPA", "8-12 LPA", "10 LPA", "15-20 LPA", "Not disclosed"]
+JOB_TYPES = ["Full-time", "Internship", "Part-time", "Remote", "Hybrid"]
+
+
+def setup():
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "joblane.settings")
+
+    import django
+    django.setup()
+
+    # in-process requests from APIRequestFactory use this host
+    from django.conf import settings
+    settings.ALLOWED_HOSTS.append("testserver")
+    # measure the database paths, not the anonymous response cache
+    settings.JOB_LIST_CACHE_TIMEOUT = 0
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def scratch_data():
+    """Everything created inside the block is rolled back afterwards."""
+    from django.db import transaction
+
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def timed(fn, repeat=20, warmup=2):
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "min_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)],
+    }
+
+
+def report(label, stats):
+    print(
+        f"{label:<48} min {stats['min_ms']:8.2f} ms   "
+        f"median {stats['median_ms']:8.2f} ms   p95 {stats['p95_ms']:8.2f} ms"
+    )
+
+
+def call_view(view_class, path, params=None, user=None, **initkwargs):
+    """Run a DRF view in-process with throttling disabled."""
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    request = APIRequestFactory().get(path, params or {})
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    view = view_class.as_view(throttle_classes=[], **initkwargs)
+    response = view(request)
+    response.render()
+    return response
+
+
+def create_user(username, role):
+    from django.contrib.auth import get_user_model
+
+    user = get_user_model().objects.create_user(
+        username=username, email=f"{username}@bench.local", password="bench-pass-123"
+    )
+    profile = user.profile
+    profile.role = role
+    profile.name = username
+    profile.save()
+    return user
+
+
+def seed_companies(count=50):
+    from jobs.models import Company
+
+    companies = []
+    for i in range(count):
+        recruiter = create_user(f"bench-recruiter-{i}", "recruiter")
+        companies.append(Company.objects.create(owner=recruiter, name=f"Company {i}"))
+    return companies
+
+
+def seed_jobs(count, companies, batch_size=5000, seed=42):
+    """Bulk-insert `count` active jobs spread over the given companies."""
+    from django.utils.timezone import localdate
+    from jobs.models import Job
+    from jobs.parsing import apply_parsed_ranges
+
+    rng = random.Random(seed)
+    company_rows = list(companies)
+    companies = len(company_rows)
+
+    today = localdate()
+    batch = []
+    for i in range(count):
+        company = company_rows[i % companies]
+        title = rng.choice(TITLES)
+        skills = rng.sample(SKILLS, 4)
+        batch.append(apply_parsed_ranges(Job(
+            title=title,
+            company=company,
+            location=rng.choice(LOCATIONS),
+            ctc=rng.choice(CTCS),
+            experience=rng.choice(EXPERIENCES),
+            deadline=today + timedelta(days=rng.randint(1, 60)),
+            job_type=rng.choice(JOB_TYPES),
+            description=f"{title} role working with {', '.join(skills)}.",
+            skills=skills,
+            created_by_id=company.owner_id,
+        )))
+        if len(batch) >= batch_size:
+            Job.objects.bulk_create(batch)
+            batch = []
+
+    if batch:
+        Job.objects.bulk_create(batch)
+
+
+def analyze(*tables):
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for table in tables:
+            cursor.execute(f"ANALYZE {table}")
+
+
+def explain(queryset):
+    return queryset.explain(analyze=True) if _is_postgres() else queryset.explain()
+
+
+def _is_postgres():
+    from django.db import connection
+    return connection.vendor == "postgresql"
+
+
+def seed_jobseekers(count, batch_size=5000, prefix="bench-seeker"):
+    """Bulk-insert jobseeker users and profiles (unusable passwords, no hashing)."""
+    from django.contrib.auth import get_user_model
+    from accounts.models import Profile
+
+    User = get_user_model()
+    rng = random.Random(count)
+    for start in range(0, count, batch_size):
+        users = User.objects.bulk_create([
+            User(username=f"{prefix}-{i}", email=f"{prefix}-{i}@bench.local", password="!")
+            for i in range(start, min(start + batch_size, count))
+        ])
+        # bulk_create skips the post_save signal that creates profiles
+        Profile.objects.bulk_create([
+            Profile(
+                user=user,
+                role="jobseeker",
+                name=user.username,
+                phone=f"98{rng.randint(10_000_000, 99_999_999)}",
+                skills=rng.sample(SKILLS, 5),
+            )
+            for user in users
+        ])
+    return list(Profile.objects.filter(user__username__startswith=f"{prefix}-"))
+
+
+def seed_applications(count, jobs, profiles, batch_size=5000):
+    """Bulk-insert `count` applications, each profile applying to distinct jobs."""
+    from jobs.models import Application
+
+    jobs, profiles = list(jobs), list(profiles)
+    if count > len(jobs) * len(profiles):
+        raise ValueError("not enough (job, profile) pairs")
+
+    statuses = [s for s, _ in Application.Status.choices]
+    batch = []
+    for i in range(count):
+        profile = profiles[i % len(profiles)]
+        job = jobs[i // len(profiles)]
+        batch.append(Application(applicant=profile, job=job, status=statuses[i % len(statuses)]))
+        if len(batch) >= batch_size:
+            Application.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Application.objects.bulk_create(batch)
@@ -0,0 +1,58 @@
+"""
+Page-number vs keyset (?cursor=) pagination on JobListAPIView as the job
+table grows. Page-number pages pay OFFSET n plus COUNT(*); keyset pages
+should stay flat.
+
+    python -m benchmarks.deep_pagination --sizes 10000,100000,300000
+"""
+import argparse
+
+from benchmarks import common
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,300000")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+
+    common.setup()
+
+    from jobs.models import Job
+    from jobs.pagination import KeysetPagination
+    from jobs.views.common_views import JobListAPIView
+
+    keyset = KeysetPagination()
+    keyset.time_field, keyset.id_field = "created_at", "id"
+
+    with common.scratch_data():
+        companies = common.seed_companies()
+        total = 0
+        for size in sizes:
+            common.seed_jobs(size - total, companies, seed=size)
+            total = size
+            common.analyze("jobs_job", "jobs_application")
+
+            page_size = 10
+            deep_page = (size * 9 // 10) // page_size
+            deep_row = Job.objects.order_by("-created_at", "-id")[deep_page * page_size - 1]
+            cursor = keyset.encode_cursor(deep_row)
+
+            print(f"\n{size} jobs")
+            cases = [
+                ("page=1", {}),
+                (f"page={deep_page}", {"page": deep_page}),
+                ("cursor (first page)", {"cursor": ""}),
+                ("cursor (same depth)", {"cursor": cursor}),
+            ]
+            for label, params in cases:
+                stats = common.timed(
+                    lambda: common.call_view(JobListAPIView, "/api/jobs/", params),
+                    repeat=args.repeat,
+                )
+                common.report(f"  {label}", stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Peak RSS and time-to-first-byte of the streamed applicants XLSX export.
+
+Each size runs in a fresh interpreter so ru_maxrss is not inherited from a
+larger run. The peak is reset after seeding (Linux clear_refs) and the RSS
+at that point is reported as the baseline.
+
+    python -m benchmarks.export_applicants --sizes 10000,100000,500000
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks import common
+
+SEEKERS = 1000
+
+
+def current_rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * resource.getpagesize() / 2**20
+
+
+def reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    # kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(rows):
+    common.setup()
+
+    import gc
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from jobs.models import Job
+    from jobs.views.export import ExportApplicantsView
+
+    with common.scratch_data():
+        companies = common.seed_companies(1)
+        recruiter = companies[0].owner
+        common.seed_jobs(rows // SEEKERS + 1, companies)
+        profiles = common.seed_jobseekers(SEEKERS)
+        common.seed_applications(rows, Job.objects.order_by("id"), profiles)
+        common.analyze("jobs_application", "accounts_profile", "auth_user")
+
+        del profiles
+        gc.collect()
+        baseline = current_rss_mb()
+        reset_peak_rss()
+
+        request = APIRequestFactory().get("/api/recruiter/applicants/export/")
+        force_authenticate(request, user=recruiter)
+
+        start = time.perf_counter()
+        response = ExportApplicantsView.as_view()(request)
+        stream = iter(response.streaming_content)
+        size = len(next(stream))
+        first_byte = time.perf_counter() - start
+        for chunk in stream:
+            size += len(chunk)
+        total = time.perf_counter() - start
+
+    return {
+        "rows": rows,
+        "ttfb_ms": first_byte * 1000,
+        "total_s": total,
+        "size_mb": size / 2**20,
+        "baseline_rss_mb": baseline,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    parser.add_argument("--rows", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rows:
+        print(json.dumps(measure(args.rows)))
+        return
+
+    for rows in sorted(int(s) for s in args.sizes.split(",")):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.export_applicants", "--rows", str(rows)],
+            cwd=common.BASE_DIR, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        print(
+            f"{rows:>8} rows   ttfb {result['ttfb_ms']:8.2f} ms   total {result['total_s']:7.2f} s   "
+            f"{result['size_mb']:7.2f} MB   rss {result['baseline_rss_mb']:7.1f} -> "
+            f"peak {result['peak_rss_mb']:7.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
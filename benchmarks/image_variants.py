@@ -0,0 +1,69 @@
+"""
+Image variants (accounts.image_variants): worker time to render every
+variant of one upload, and the bytes a client downloads for a 48px avatar
+with the original versus the 96px WebP / JPEG variants. No database or
+storage: the uploads are generated in memory.
+
+    python -m benchmarks.image_variants --size 2000x1500
+"""
+import argparse
+import io
+
+from benchmarks import common
+
+
+class Upload(io.BytesIO):
+    # what open_image needs from a FieldFile
+    def open(self, mode="rb"):
+        self.seek(0)
+        return self
+
+
+def photo(size, image_format, mode):
+    from PIL import Image
+
+    # noise over a gradient compresses roughly like a photo
+    image = Image.merge("RGB", [
+        Image.linear_gradient("L").resize(size),
+        Image.effect_noise(size, 40),
+        Image.linear_gradient("L").rotate(90).resize(size),
+    ])
+    if mode == "RGBA":
+        image.putalpha(Image.linear_gradient("L").resize(size))
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **({"quality": 90} if image_format == "JPEG" else {}))
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", default="2000x1500", help="upload dimensions, WIDTHxHEIGHT")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    common.setup()
+
+    from accounts.image_variants import FORMATS, VARIANT_WIDTHS, open_image, render_variant
+
+    size = tuple(int(part) for part in args.size.split("x"))
+    for label, image_format, mode in (("JPEG photo", "JPEG", "RGB"), ("PNG logo", "PNG", "RGBA")):
+        original = photo(size, image_format, mode)
+
+        def render_all():
+            image = open_image(Upload(original))
+            return {
+                (width, variant_format): render_variant(image, width, variant_format)
+                for width in VARIANT_WIDTHS
+                for variant_format in FORMATS
+            }
+
+        print(f"{label} {args.size}, {len(original) / 1024:.0f} KB")
+        common.report("  render all variants", common.timed(render_all, repeat=args.repeat, warmup=1))
+        variants = render_all()
+        for (width, variant_format), content in variants.items():
+            print(f"  {width:>4}px {variant_format:<5} {len(content) / 1024:8.1f} KB   "
+                  f"{len(original) / len(content):6.0f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Nightly saved-search matching: one JobFilter query per saved search versus
+streaming the day's new jobs through the in-memory SearchIndex (jobs.alerts).
+The per-search baseline runs on a sample and is extrapolated.
+
+    python -m benchmarks.job_alerts --searches 100000 --jobs 5000
+"""
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks import common
+
+
+def random_search(rng, user_id):
+    from jobs.models import SavedSearch
+
+    # a role keyword ("python") or a full title, mostly narrowed to a city or two
+    titles = rng.sample(common.TITLES, rng.choice((1, 1, 2)))
+    keywords = [title if rng.random() < 0.5 else title.split()[0] for title in titles]
+    return SavedSearch(
+        user_id=user_id,
+        profile=", ".join(keywords) if rng.random() < 0.9 else "",
+        location=", ".join(rng.sample(common.LOCATIONS, rng.randint(1, 2))) if rng.random() < 0.7 else "",
+        job_type=rng.choice(common.JOB_TYPES) if rng.random() < 0.3 else "",
+        experience=rng.choice(("", "", "Fresher", "Experienced")),
+    )
+
+
+def seed_searches(count, users, batch_size=5000, seed=7):
+    from jobs.models import SavedSearch
+
+    rng = random.Random(seed)
+    user_ids = [profile.user_id for profile in users]
+    batch = []
+    for i in range(count):
+        batch.append(random_search(rng, user_ids[i % len(user_ids)]))
+        if len(batch) >= batch_size:
+            SavedSearch.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        SavedSearch.objects.bulk_create(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--searches", type=int, default=100000)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--sample", type=int, default=500, help="Saved searches timed with the per-search baseline.")
+    args = parser.parse_args()
+
+    common.setup()
+
+    from django.test import override_settings
+    from django.utils import timezone
+    from django.utils.timezone import localdate
+    from jobs.alerts import load_index, match_jobs, new_jobs, send_job_alerts
+    from jobs.filters import JobFilter
+    from jobs.models import Job, SavedSearch
+
+    with common.scratch_data():
+        users = common.seed_jobseekers(args.users)
+        seed_searches(args.searches, users)
+        since = timezone.now()
+        common.seed_jobs(args.jobs, common.seed_companies())
+        common.analyze("jobs_job", "jobs_savedsearch")
+        print(f"{args.searches} saved searches x {args.jobs} new jobs")
+
+        # baseline: every saved search as its own query
+        fresh = Job.objects.filter(created_at__gt=since - timedelta(seconds=1), deadline__gte=localdate())
+        sample = list(SavedSearch.objects.order_by('?')[:args.sample])
+        start = time.perf_counter()
+        for search in sample:
+            params = {
+                field: getattr(search, field)
+                for field in ('profile', 'location', 'job_type', 'experience')
+                if getattr(search, field)
+            }
+            list(JobFilter(params, queryset=fresh).qs.values_list('id', flat=True))
+        per_search = (time.perf_counter() - start) / len(sample)
+        print(f"  per-search queries   {per_search * 1000:8.2f} ms each, ~{per_search * args.searches:8.1f} s total")
+
+        window_start = since - timedelta(seconds=1)
+        start = time.perf_counter()
+        index = load_index()
+        loaded = time.perf_counter()
+        matches, _ = match_jobs(index, new_jobs(window_start, timezone.now()))
+        matched = time.perf_counter()
+        print(f"  build index          {loaded - start:8.2f} s ({len(index.criteria_ids)} distinct criteria)")
+        print(f"  stream + match       {matched - loaded:8.2f} s ({len(matches)} users with matches)")
+
+        start = time.perf_counter()
+        # time the batch calls, not printing every digest
+        with override_settings(EMAIL_PROVIDER="console", EMAIL_BACKEND="django.core.mail.backends.dummy.EmailBackend"):
+            _, _, digests = send_job_alerts()
+        print(f"  send_job_alerts      {time.perf_counter() - start:8.2f} s ({digests} digests sent)")
+
+
+if __name__ == "__main__":
+    main()
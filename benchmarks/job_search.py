@@ -0,0 +1,58 @@
+"""
+Compare the legacy `?search=` (SearchFilter, ILIKE) path with the
+full-text `?q=` path of JobListAPIView.
+
+    python -m benchmarks.job_search --jobs 100000
+"""
+import argparse
+
+from benchmarks import common
+
+QUERIES = ["python", "django developer", "react pune", "machine learn", "kubernetes"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    common.setup()
+
+    from jobs.filters import JobFilter
+    from jobs.models import Company, Job
+    from jobs.search import search_jobs, update_company_search_vectors
+    from jobs.views.common_views import JobListAPIView
+
+    with common.scratch_data():
+        print(f"Seeding {args.jobs} jobs ...")
+        common.seed_jobs(args.jobs, common.seed_companies())
+        for company in Company.objects.all():
+            update_company_search_vectors(company)
+        common.analyze("jobs_job", "jobs_company")
+
+        for term in QUERIES:
+            legacy = common.timed(
+                lambda: common.call_view(JobListAPIView, "/api/jobs/", {"search": term}),
+                repeat=args.repeat,
+            )
+            fts = common.timed(
+                lambda: common.call_view(JobListAPIView, "/api/jobs/", {"q": term}),
+                repeat=args.repeat,
+            )
+            common.report(f"search={term!r}", legacy)
+            common.report(f"q={term!r}", fts)
+
+        print("\nPlan for q='django developer':")
+        print(common.explain(search_jobs(Job.objects.all(), "django developer")[:10]))
+
+        print("\nPlan for q + filters:")
+        qs = JobFilter(
+            {"q": "python", "job_type": "Full-time", "location": "pune"},
+            queryset=Job.objects.all(),
+        ).qs[:10]
+        print(common.explain(qs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Login throughput: the previous Q(username__iexact) | Q(email__iexact) lookup
+followed by ModelBackend on failure, versus UsernameOrEmailBackend on the
+LOWER() indexes as the only backend. Lookups are timed alone and as full
+authenticate() calls (which are dominated by the password hash).
+
+    python -m benchmarks.login --users 200000
+"""
+import argparse
+import time
+
+from benchmarks import common
+
+PASSWORD = "bench-pass-123"
+
+
+def legacy_authenticate(request, username, password):
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.backends import ModelBackend
+    from django.db.models import Q
+
+    User = get_user_model()
+    backend = ModelBackend()
+    try:
+        user = User.objects.get(Q(username__iexact=username) | Q(email__iexact=username))
+        if user.check_password(password) and backend.user_can_authenticate(user):
+            return user
+    except User.DoesNotExist:
+        pass
+    # the second entry of the old AUTHENTICATION_BACKENDS
+    return backend.authenticate(request, username=username, password=password)
+
+
+def throughput(fn, attempts):
+    start = time.perf_counter()
+    for _ in range(attempts):
+        fn()
+    elapsed = time.perf_counter() - start
+    return attempts / elapsed, elapsed / attempts * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200000)
+    parser.add_argument("--attempts", type=int, default=20, help="authenticate() calls per case")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    common.setup()
+
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.db.models import Q
+    from accounts.backends import UsernameOrEmailBackend, login_candidates
+
+    User = get_user_model()
+    backend = UsernameOrEmailBackend()
+
+    with common.scratch_data():
+        common.seed_jobseekers(args.users)
+        User.objects.filter(username__startswith="bench-seeker-").update(password=make_password(PASSWORD))
+        common.analyze("auth_user")
+        target = f"bench-seeker-{args.users // 2}"
+        print(f"{args.users} users")
+
+        cases = {
+            "username": (target.upper(), PASSWORD),
+            "email": (f"{target}@BENCH.local", PASSWORD),
+            "unknown user": ("nobody-here", PASSWORD),
+            "wrong password": (target, "wrong-password"),
+        }
+
+        print("\nlookup only")
+        for label, (username, _) in cases.items():
+            legacy = Q(username__iexact=username) | Q(email__iexact=username)
+            common.report(
+                f"  {label:<16} iexact",
+                common.timed(lambda: list(User.objects.filter(legacy)[:2]), repeat=args.repeat),
+            )
+            common.report(
+                f"  {label:<16} LOWER() index",
+                common.timed(lambda: list(login_candidates(username)[:2]), repeat=args.repeat),
+            )
+
+        print("\nauthenticate()")
+        for label, (username, password) in cases.items():
+            for name, fn in (
+                ("two backends", lambda: legacy_authenticate(None, username, password)),
+                ("one backend", lambda: backend.authenticate(None, username=username, password=password)),
+            ):
+                per_second, per_login = throughput(fn, args.attempts)
+                print(f"  {label:<16} {name:<14} {per_second:8.1f} logins/s   {per_login:8.2f} ms each")
+
+
+if __name__ == "__main__":
+    main()
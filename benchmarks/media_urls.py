@@ -0,0 +1,67 @@
+"""
+Serializing a page of jobs: company_logo as the stock ImageField (a
+Cloudinary URL built per row) versus MediaImageField (joblane.media, one
+URL per company logo per process). No database: the jobs are built in memory.
+
+    python -m benchmarks.media_urls --page-size 50 --companies 10
+"""
+import argparse
+from datetime import date
+
+from benchmarks import common
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--companies", type=int, default=10, help="distinct logos on the page")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    common.setup()
+
+    import cloudinary
+    from rest_framework import serializers
+    from jobs.models import Company, Job
+    from jobs.serializers.common_serializers import JobBasicSerializer
+    from joblane.media import clear_media_urls, media_url_stats
+
+    if not cloudinary.config().cloud_name:
+        # URLs are built locally; any cloud name will do
+        cloudinary.config(cloud_name="bench")
+
+    class StockJobBasicSerializer(JobBasicSerializer):
+        company_logo = serializers.ImageField(source="company.logo", read_only=True)
+
+    companies = [
+        Company(name=f"Bench Company {i}", logo=f"company_logos/bench-{i}.png")
+        for i in range(args.companies)
+    ]
+    jobs = []
+    for i in range(args.page_size):
+        job = Job(
+            pk=i + 1,
+            title=common.TITLES[i % len(common.TITLES)],
+            company=companies[i % len(companies)],
+            location=common.LOCATIONS[i % len(common.LOCATIONS)],
+            deadline=date.today(),
+        )
+        job.applicant_count = i
+        jobs.append(job)
+
+    print(f"{args.page_size} jobs, {args.companies} companies")
+    common.report(
+        "  ImageField       ",
+        common.timed(lambda: StockJobBasicSerializer(jobs, many=True).data, repeat=args.repeat),
+    )
+    clear_media_urls()
+    common.report(
+        "  MediaImageField  ",
+        common.timed(lambda: JobBasicSerializer(jobs, many=True).data, repeat=args.repeat),
+    )
+    stats = media_url_stats()
+    print(f"  memo: {stats['hits']} hits, {stats['misses']} misses")
+
+
+if __name__ == "__main__":
+    main()
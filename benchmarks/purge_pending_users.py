@@ -0,0 +1,96 @@
+"""
+Purging abandoned registrations: one DELETE over every expired PendingUser
+versus purge_pending_users (accounts.purge) in created_at-ordered batches.
+The single statement holds its locks for the whole run; the batched purge
+holds them for its longest batch.
+
+    python -m benchmarks.purge_pending_users --rows 5000000
+"""
+import argparse
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from benchmarks import common
+
+
+@contextmanager
+def explicit_created_at():
+    # bulk_create would otherwise stamp every row with now()
+    from accounts.models import PendingUser
+
+    field = PendingUser._meta.get_field("created_at")
+    field.auto_now_add = False
+    try:
+        yield
+    finally:
+        field.auto_now_add = True
+
+
+def seed_pending_users(count, days=60, batch_size=10000, seed=11):
+    from django.utils import timezone
+    from accounts.models import PendingUser
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    with explicit_created_at():
+        for start in range(0, count, batch_size):
+            PendingUser.objects.bulk_create([
+                PendingUser(
+                    email=f"bench-pending-{i}@bench.local",
+                    username=f"bench-pending-{i}",
+                    password="!",
+                    name="Bench",
+                    created_at=now - timedelta(seconds=rng.randint(0, days * 24 * 60 * 60)),
+                )
+                for i in range(start, min(start + batch_size, count))
+            ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    common.setup()
+
+    from django.db import transaction
+    from django.utils import timezone
+    from accounts.models import PendingUser
+    from accounts.purge import PENDING_USER_TTL, purge_pending_users
+
+    with common.scratch_data():
+        start = time.perf_counter()
+        seed_pending_users(args.rows)
+        common.analyze("accounts_pendinguser")
+        expired = PendingUser.objects.filter(created_at__lt=timezone.now() - PENDING_USER_TTL).count()
+        print(f"{args.rows} pending users, {expired} expired (seeded in {time.perf_counter() - start:.1f}s)")
+
+        # baseline, rolled back so the batched run sees the same rows
+        try:
+            with transaction.atomic():
+                start = time.perf_counter()
+                deleted, _ = PendingUser.objects.filter(created_at__lt=timezone.now() - PENDING_USER_TTL).delete()
+                elapsed = time.perf_counter() - start
+                raise common.Rollback
+        except common.Rollback:
+            pass
+        print(f"  single DELETE     {deleted:9d} rows {elapsed:8.2f} s {deleted / elapsed:10.0f} rows/s   locked {elapsed:8.2f} s")
+
+        purged = 0
+        longest = 0
+        start = time.perf_counter()
+        batch_start = start
+        for batch in purge_pending_users(batch_size=args.batch_size):
+            now = time.perf_counter()
+            longest = max(longest, now - batch_start)
+            batch_start = now
+            purged += batch
+        elapsed = time.perf_counter() - start
+        print(f"  batched purge     {purged:9d} rows {elapsed:8.2f} s {purged / elapsed:10.0f} rows/s   locked {longest:8.2f} s per batch at most")
+
+
+if __name__ == "__main__":
+    main()
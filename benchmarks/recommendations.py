@@ -0,0 +1,54 @@
+"""
+Latency of /api/jobs/recommended/ as the number of active jobs grows. Only
+JobSkill postings for the seeker's skills are read, so requests should not
+degrade into a scan of the job table.
+
+    python -m benchmarks.recommendations --sizes 10000,100000
+"""
+import argparse
+
+from benchmarks import common
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+
+    common.setup()
+
+    from jobs.recommendations import rebuild_skill_index
+    from jobs.views.jobseeker_views import RecommendedJobsView
+
+    with common.scratch_data():
+        companies = common.seed_companies()
+        seekers = []
+        for skills in (["python", "django", "postgres"], ["react", "typescript", "css", "figma", "node"], []):
+            seeker = common.create_user(f"bench-seeker-{len(seekers)}", "jobseeker")
+            seeker.profile.skills = skills
+            seeker.profile.location = "Pune"
+            seeker.profile.save()
+            seekers.append(seeker)
+
+        total = 0
+        for size in sizes:
+            common.seed_jobs(size - total, companies, seed=size)
+            total = size
+            # bulk_create skips the signals that maintain the index
+            rebuild_skill_index(batch_size=5000)
+            common.analyze("jobs_job", "jobs_jobskill")
+
+            print(f"\n{size} jobs")
+            for seeker in seekers:
+                label = f"  {len(seeker.profile.skills)} skills"
+                stats = common.timed(
+                    lambda: common.call_view(RecommendedJobsView, "/api/jobs/recommended/", user=seeker),
+                    repeat=args.repeat,
+                )
+                common.report(label, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Stored values of the fields that save receivers act on.
+
+Receivers declare the fields they compare with track_changes(). Before a save
+of an existing row, load_previous_values reads every tracked field of that
+model in one SELECT (only those in update_fields for a partial save), and
+changed() compares the instance against it, in pre_save as well as post_save.
+This replaces one re-read of the same row per receiver.
+
+    track_changes(Job, "skills", "requirements")
+    ...
+    if changed(instance, "skills", "requirements"):
+"""
+from collections import defaultdict
+
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+PREVIOUS_VALUES = "_previous_values"
+
+_tracked = defaultdict(set)
+
+
+def track_changes(model, *fields):
+    _tracked[model].update(fields)
+
+
+# connected on import, so before the receivers of any module that imports changed()
+@receiver(pre_save, dispatch_uid="joblane.changes.load_previous_values")
+def load_previous_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance.__dict__.pop(PREVIOUS_VALUES, None)
+    fields = _tracked.get(sender)
+    if not fields or raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None:
+        fields = fields & set(update_fields)
+        if not fields:
+            return
+    instance.__dict__[PREVIOUS_VALUES] = sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+def changed(instance, *fields):
+    """True if the save in progress changes any of `fields` (tracked ones) of an existing row."""
+    previous = instance.__dict__.get(PREVIOUS_VALUES) or {}
+    return any(field in previous and previous[field] != getattr(instance, field) for field in fields)
@@ -0,0 +1,197 @@
+"""
+Shared client for outbound HTTP calls (Brevo, Google OAuth).
+
+One pooled keep-alive requests.Session per host and process, so repeat calls
+skip the TCP + TLS handshake; default timeouts; retries that never replay a
+non-idempotent request once it reached the server; and per-host counters of
+requests vs. new connections in the cache (see http_stats).
+
+    from joblane import http
+    response = http.post("https://api.brevo.com/v3/smtp/email", json=payload)
+"""
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from django.core.cache import cache
+from google.auth import exceptions, transport
+from google.auth.transport import requests as google_requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+POOL_MAXSIZE = 10
+
+# Connection failures are retried for every method (nothing was sent yet).
+# Read errors and 429/5xx only for idempotent methods: a retried POST could
+# send an email twice or reuse a single-use OAuth code.
+RETRY = Retry(
+    total=3,
+    connect=2,
+    read=1,
+    status=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _host(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_session(url):
+    """Pooled session for the url's host, created once per process (fork safe)."""
+    key = (os.getpid(), _host(url))
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY)
+                session.mount(_host(url), adapter)
+                _sessions[key] = session
+    return session
+
+
+def _connections_opened(session, url):
+    # the session only talks to one host, but requests keys its pools by TLS settings too
+    pools = session.get_adapter(url).poolmanager.pools
+    return sum(pools[key].num_connections for key in pools.keys())
+
+
+def request(method, url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    session = get_session(url)
+    # approximate under concurrency: another thread may open a connection too
+    opened_before = _connections_opened(session, url)
+    try:
+        response = session.request(method, url, **kwargs)
+    except requests.RequestException:
+        _record(url, new_connections=_connections_opened(session, url) - opened_before, error=True)
+        raise
+    _record(url, new_connections=_connections_opened(session, url) - opened_before)
+    return response
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+# ===== Metrics =====
+HTTP_STATS_HOSTS_KEY = "http:stats:hosts"
+
+
+def _stats_key(host, counter):
+    return f"http:stats:{host}:{counter}"
+
+
+def _incr(key, delta=1):
+    if not cache.add(key, delta, timeout=None):
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            cache.set(key, delta, timeout=None)
+
+
+def _record(url, new_connections, error=False):
+    host = urlsplit(url).netloc
+    hosts = cache.get(HTTP_STATS_HOSTS_KEY) or set()
+    if host not in hosts:
+        cache.set(HTTP_STATS_HOSTS_KEY, hosts | {host}, timeout=None)
+
+    _incr(_stats_key(host, "requests"))
+    if new_connections > 0:
+        _incr(_stats_key(host, "connections"), new_connections)
+    if error:
+        _incr(_stats_key(host, "errors"))
+
+
+def http_stats():
+    """Per host: requests, new connections, errors and the share of requests on a reused connection."""
+    stats = {}
+    for host in sorted(cache.get(HTTP_STATS_HOSTS_KEY) or ()):
+        requests_made = cache.get(_stats_key(host, "requests"), 0)
+        connections = cache.get(_stats_key(host, "connections"), 0)
+        stats[host] = {
+            "requests": requests_made,
+            "connections": connections,
+            "errors": cache.get(_stats_key(host, "errors"), 0),
+            "reuse_ratio": round(1 - connections / requests_made, 4) if requests_made else None,
+        }
+    return stats
+
+
+# ===== Google =====
+MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+GOOGLE_CERTS_CACHE_PREFIX = "http:google-certs:"
+
+
+class _Response(transport.Response):
+    def __init__(self, status, headers, data):
+        self._status, self._headers, self._data = status, headers, data
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @property
+    def data(self):
+        return self._data
+
+
+class CachingGoogleRequest(google_requests.Request):
+    """
+    google-auth transport on the pooled sessions that caches GET responses
+    (Google's public signing certs) for as long as their Cache-Control max-age
+    allows, so verifying an ID token does not re-download the certs.
+    """
+
+    def __init__(self):
+        super().__init__(session=get_session("https://www.googleapis.com"))
+
+    def __call__(self, url, method="GET", body=None, headers=None, timeout=None, **kwargs):
+        key = GOOGLE_CERTS_CACHE_PREFIX + url
+        if method == "GET":
+            cached = cache.get(key)
+            if cached is not None:
+                return _Response(*cached)
+
+        try:
+            response = request(method, url, data=body, headers=headers, timeout=timeout or DEFAULT_TIMEOUT, **kwargs)
+        except requests.RequestException as exc:
+            raise exceptions.TransportError(exc) from exc
+
+        max_age = MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+        if method == "GET" and response.status_code == 200 and max_age and int(max_age.group(1)) > 0:
+            cache.set(key, (response.status_code, dict(response.headers), response.content), timeout=int(max_age.group(1)))
+        return _Response(response.status_code, response.headers, response.content)
+
+
+_google_request = None
+
+
+def google_request():
+    """Shared google-auth transport, e.g. for id_token.verify_oauth2_token."""
+    global _google_request
+    if _google_request is None:
+        _google_request = CachingGoogleRequest()
+    return _google_request
@@ -0,0 +1,156 @@
+"""
+Memoized URLs for uploaded media (company logos, profile pictures, resumes).
+
+Building a Cloudinary URL is pure Python work, but list serializers repeat
+it for every row, and most rows of a job page share a handful of company
+logos. media_url keeps the resolved URLs in a per-process LRU with a TTL,
+keyed on (storage, name, transformation). The serializers use it through
+MediaImageField / MediaFileField (or MEDIA_FIELD_MAPPING on a ModelSerializer)
+instead of `.url` + build_absolute_uri.
+
+    company_logo = MediaImageField(source="company.logo", read_only=True)
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import cloudinary
+from cloudinary_storage.storage import MediaCloudinaryStorage
+from django.db import models
+from django.db.models.fields.files import FieldFile
+from rest_framework import serializers
+
+from accounts.image_variants import VARIANT_WIDTHS, variant_name
+
+MEDIA_URL_CACHE_SIZE = 4096
+# names are immutable in practice (uploads get new public ids); the TTL
+# bounds how long a replaced or re-configured asset can be served stale
+MEDIA_URL_TTL = 3600
+
+
+class _LRUCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+_urls = _LRUCache(MEDIA_URL_CACHE_SIZE, MEDIA_URL_TTL)
+
+
+def _resolve(storage, name, transformation):
+    if transformation is None:
+        return storage.url(name)
+    if not isinstance(storage, MediaCloudinaryStorage):
+        raise ValueError(f"{type(storage).__name__} does not support URL transformations")
+    resource = cloudinary.CloudinaryResource(
+        storage._prepend_prefix(name), default_resource_type=storage._get_resource_type(name)
+    )
+    return resource.build_url(**dict(transformation))
+
+
+def media_url(file, transformation=None):
+    """
+    URL of a FieldFile, or None when the field is empty. `transformation` is a
+    tuple of Cloudinary options, e.g. (("width", 96), ("crop", "fill")).
+    """
+    if not file:
+        return None
+    # the storage object itself: one per model field and process
+    key = (file.storage, file.name, transformation)
+    url = _urls.get(key)
+    if url is None:
+        url = _resolve(file.storage, file.name, transformation)
+        _urls.set(key, url)
+    return url
+
+
+def absolute_media_url(file, request, transformation=None):
+    url = media_url(file, transformation)
+    # Cloudinary URLs are absolute already; only local storage needs the host
+    if url is not None and request is not None and url.startswith("/"):
+        return request.build_absolute_uri(url)
+    return url
+
+
+def media_url_stats():
+    return {"hits": _urls.hits, "misses": _urls.misses, "size": len(_urls._data)}
+
+
+def clear_media_urls():
+    _urls.clear()
+
+
+class MediaURLMixin:
+    """Serializer file field whose output goes through media_url."""
+
+    def __init__(self, *args, transformation=None, **kwargs):
+        self.transformation = transformation
+        super().__init__(*args, **kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        if not getattr(self, "use_url", True):
+            return value.name
+        return absolute_media_url(value, self.context.get("request"), self.transformation)
+
+
+class MediaFileField(MediaURLMixin, serializers.FileField):
+    pass
+
+
+class MediaImageField(MediaURLMixin, serializers.ImageField):
+    pass
+
+
+class VariantImageField(MediaImageField):
+    """
+    Read-only URL of the `width` variant of an image (accounts.image_variants),
+    or of the original until the variant exists.
+    """
+
+    def __init__(self, *, width, image_format="webp", **kwargs):
+        if width not in VARIANT_WIDTHS:
+            raise ValueError(f"No {width}px variants are generated, use one of {VARIANT_WIDTHS}")
+        self.width = width
+        self.image_format = image_format
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        name = variant_name(value, self.width, self.image_format) if value else None
+        if name is not None:
+            value = FieldFile(value.instance, value.field, name)
+        return super().to_representation(value)
+
+
+# for ModelSerializer.serializer_field_mapping
+MEDIA_FIELD_MAPPING = {
+    models.FileField: MediaFileField,
+    models.ImageField: MediaImageField,
+}
@@ -0,0 +1,155 @@
+"""
+Work queues kept in a model's own table, without a broker.
+
+A row is claimed by moving it from `pending` to `running` with a
+compare-and-set UPDATE, so any number of workers can run; the time written by
+that UPDATE identifies the claim, and a row still Running after `stale_after`
+(measured on `alive_at_field`) lost its worker to a crash or deploy and is put
+back. A TaskQueue subclass names the model and fields and implements run();
+QueueWorkerCommand turns it into a `manage.py` worker:
+
+    class FitScoreQueue(TaskQueue):
+        model = FitScoreTask
+
+        def run(self, task):
+            ...
+            return f"{task}: done"
+
+    class Command(QueueWorkerCommand):
+        queue_class = FitScoreQueue
+"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+
+class TaskQueue:
+    model = None
+    status_field = "status"
+    pending = "Pending"
+    running = "Running"
+    # written by the claim; identifies it (see claimed())
+    claimed_at_field = "started_at"
+    # a Running row whose value is older than stale_after has no live worker;
+    # None means claimed_at_field
+    alive_at_field = None
+    ordering = ("created_at", "id")
+    stale_after = timedelta(minutes=10)
+
+    def __init__(self, stale_after=None):
+        if stale_after is not None:
+            self.stale_after = stale_after
+
+    def get_queryset(self):
+        """Rows as handed to run(), e.g. with select_related."""
+        return self.model._default_manager.all()
+
+    def due(self, now):
+        """Filter of the rows that can be claimed at `now`."""
+        return Q(**{self.status_field: self.pending})
+
+    def claim_values(self, now):
+        return {self.status_field: self.running, self.claimed_at_field: now}
+
+    def claim(self, limit=1):
+        """Mark up to `limit` due rows Running for this worker and return them, oldest first."""
+        now = timezone.now()
+        manager = self.model._default_manager
+        claimed = []
+        while len(claimed) < limit:
+            candidates = list(
+                manager.filter(self.due(now)).order_by(*self.ordering).values_list("pk", flat=True)[:limit - len(claimed)]
+            )
+            if not candidates:
+                break
+            for pk in candidates:
+                # compare-and-set: rows another worker took in between no longer match
+                if manager.filter(self.due(now), pk=pk).update(**self.claim_values(now)):
+                    claimed.append(pk)
+        if not claimed:
+            return []
+        return list(self.get_queryset().filter(pk__in=claimed).order_by(*self.ordering))
+
+    def claim_next(self):
+        """Oldest due row, claimed for this worker; None if the queue is empty."""
+        claimed = self.claim(1)
+        return claimed[0] if claimed else None
+
+    def claimed(self, task):
+        """The task's row, as long as it is still Running under this worker's claim."""
+        return self.model._default_manager.filter(**{
+            "pk": task.pk,
+            self.status_field: self.running,
+            self.claimed_at_field: getattr(task, self.claimed_at_field),
+        })
+
+    def requeue_values(self):
+        return {self.status_field: self.pending}
+
+    def requeue_stale(self):
+        """Put back rows whose worker died mid-way (crash, deploy)."""
+        alive_at_field = self.alive_at_field or self.claimed_at_field
+        return self.model._default_manager.filter(**{
+            self.status_field: self.running,
+            f"{alive_at_field}__lt": timezone.now() - self.stale_after,
+        }).update(**self.requeue_values())
+
+    def housekeeping(self):
+        """Upkeep run before every claim (expiry, purges); nothing by default."""
+
+    def run(self, task):
+        """Process one claimed row; returns the line the worker prints."""
+        raise NotImplementedError
+
+    def process(self, tasks):
+        """Process a claimed batch; returns the lines the worker prints."""
+        return [self.run(task) for task in tasks]
+
+    def work(self, once=False, sleep=2, batch_size=1):
+        """
+        Claim and process batches until stopped, or with `once` until nothing
+        is due; yields the lines of process(). Sleeps `sleep` seconds when idle.
+        """
+        while True:
+            self.requeue_stale()
+            self.housekeeping()
+
+            tasks = self.claim(batch_size)
+            if not tasks:
+                if once:
+                    return
+                time.sleep(sleep)
+                continue
+
+            yield from self.process(tasks)
+
+
+class QueueWorkerCommand(BaseCommand):
+    """
+    Worker for `queue_class`, running until stopped unless --once is given.
+    Subclasses with extra options override get_queue() to pass them on.
+    """
+    queue_class = None
+    sleep = 2
+    batch_size = 1
+    stale_after_help = "Seconds before a task left running by a dead worker is requeued."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue and exit.")
+        parser.add_argument("--sleep", type=float, default=self.sleep, help="Seconds to wait when the queue is empty.")
+        parser.add_argument(
+            "--stale-after", type=int, default=int(self.queue_class.stale_after.total_seconds()),
+            help=self.stale_after_help,
+        )
+
+    def get_queue(self, options):
+        return self.queue_class(stale_after=timedelta(seconds=options["stale_after"]))
+
+    def handle(self, *args, **options):
+        queue = self.get_queue(options)
+        batch_size = options.get("batch_size") or self.batch_size
+        for line in queue.work(once=options["once"], sleep=options["sleep"], batch_size=batch_size):
+            self.stdout.write(line)
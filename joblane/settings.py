@@ -1,4 +1,4 @@
-import os, sys
+import os, sys, tempfile
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -96,7 +96,7 @@ MIDDLEWARE = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -127,6 +127,8 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
     "BLACKLIST_AFTER_ROTATION": True,
     "ROTATE_REFRESH_TOKENS": True,
+    # role / profile claims, see accounts.tokens
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.ClaimsTokenRefreshSerializer",
 }
 
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
@@ -142,6 +144,18 @@ CLOUDINARY_STORAGE = {
 # --- IMPORTANT: Move DEFAULT_FILE_STORAGE here, after CLOUDINARY_STORAGE is defined ---
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 
+# Company logos and profile pictures, with their resized variants
+# (accounts.image_variants). Tests keep them on the local filesystem.
+MEDIA_STORAGE = {
+    "BACKEND": os.getenv("MEDIA_STORAGE_BACKEND", DEFAULT_FILE_STORAGE),
+    "OPTIONS": {},
+}
+if 'test' in sys.argv:
+    MEDIA_STORAGE = {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": tempfile.mkdtemp(prefix="joblane-media-"), "base_url": "/media/"},
+    }
+
 if not DEBUG and 'test' not in sys.argv:
     SECURE_SSL_REDIRECT = True
     SESSION_COOKIE_SECURE = True
@@ -178,7 +192,9 @@ WSGI_APPLICATION = 'joblane.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-if 'test' in sys.argv:
+# Tests run on SQLite unless DATABASE_URL is set; set it to a Postgres server
+# to also run the Postgres-only tests (trigram indexes, full-text search).
+if 'test' in sys.argv and not os.getenv('DATABASE_URL'):
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
@@ -196,6 +212,59 @@ else:
 
 
 
+# Cache
+# Production needs a shared cache (Redis): the generation counters used to
+# invalidate cached job lists must be visible to every gunicorn worker.
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL and 'test' not in sys.argv:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'joblane',
+        }
+    }
+
+# Where OTP challenges live (accounts.otp): "cache" needs a cache shared by all
+# workers, so a per-process LocMemCache falls back to the database
+OTP_STORE = os.getenv("OTP_STORE", "cache" if 'redis' in CACHES['default']['BACKEND'] else "db")
+
+# Answer refresh-token blacklist checks from the cache (accounts.blacklist);
+# only safe with a cache shared by all workers
+TOKEN_BLACKLIST_CACHE = os.getenv(
+    "TOKEN_BLACKLIST_CACHE", str('redis' in CACHES['default']['BACKEND'])
+).lower() == "true"
+
+# Trust the role / profile claims of access tokens (accounts.tokens) while
+# their cached claims_version is current; only safe with a cache shared by all
+# workers, or a worker could keep serving a revoked role from its own copy
+TOKEN_CLAIMS_CACHE = os.getenv(
+    "TOKEN_CLAIMS_CACHE", str('redis' in CACHES['default']['BACKEND'])
+).lower() == "true"
+
+# Seconds an anonymous /api/jobs/ response stays cached (0 disables it)
+JOB_LIST_CACHE_TIMEOUT = int(os.getenv("JOB_LIST_CACHE_TIMEOUT", "300"))
+
+# Background export artifacts (jobs.background_exports). Any Django storage
+# backend works here, e.g. an S3 one when workers run on other machines.
+EXPORT_STORAGE = {
+    "BACKEND": os.getenv("EXPORT_STORAGE_BACKEND", "django.core.files.storage.FileSystemStorage"),
+    "OPTIONS": {"location": os.getenv("EXPORT_ROOT", os.path.join(BASE_DIR, "exports"))},
+}
+if 'test' in sys.argv:
+    EXPORT_STORAGE["OPTIONS"]["location"] = tempfile.mkdtemp(prefix="joblane-exports-")
+
+# Seconds a finished export is kept and reused for identical requests
+EXPORT_TTL = int(os.getenv("EXPORT_TTL", "3600"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -253,9 +322,9 @@ BREVO_API_KEY = os.getenv("BREVO_API_KEY")
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "Joblane <noreply@joblane.com>")
 
 
+# one backend: a second one would repeat the lookup and the hash on every failed login
 AUTHENTICATION_BACKENDS = [
     "accounts.backends.UsernameOrEmailBackend",
-    "django.contrib.auth.backends.ModelBackend", 
 ]
 
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -1,7 +1,11 @@
 from django.contrib import admin
-from .models import Company, Job, Application, SavedJob
+from .models import Company, Job, Application, SavedJob, ExportJob, StatusNotification, SavedSearch, FitScoreTask
 
 admin.site.register(Company)
 admin.site.register(Job)
 admin.site.register(Application)
 admin.site.register(SavedJob)
+admin.site.register(ExportJob)
+admin.site.register(StatusNotification)
+admin.site.register(SavedSearch)
+admin.site.register(FitScoreTask)
@@ -0,0 +1,303 @@
+"""
+Daily job alerts for saved searches.
+
+Running every SavedSearch as its own query costs one query per user. Instead
+the searches are loaded once into an in-memory index keyed by their terms
+(see SearchIndex), the day's new jobs are streamed through it, and each job
+is only checked against the searches whose terms it contains. Matches are
+grouped per user into one digest; digests share one template and go out
+with send_batch_email, and the few the provider rejects are left to the
+email outbox, which retries them.
+
+Each search's last_alerted_at is its high-water mark: a run looks at jobs
+created since the oldest mark (at most MAX_LOOKBACK back), so a run that
+was missed or failed is caught up by the next one.
+
+    python manage.py send_job_alerts
+"""
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import product
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from django.utils.timezone import localdate
+
+from accounts.email_service import render_params, send_batch_email
+from accounts.outbox import enqueue_emails
+from jobs.filters import split_values
+from jobs.models import Job, SavedSearch
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+GRAM = 3
+MAX_JOBS_PER_DIGEST = 20
+# how far back a search that has not been alerted for a while is caught up
+MAX_LOOKBACK = timedelta(days=7)
+JOB_FIELDS = ('id', 'title', 'location', 'job_type', 'min_experience', 'created_at', 'company__name')
+
+
+def grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+@dataclass(frozen=True)
+class Criteria:
+    """The filter part of a SavedSearch; an empty field does not filter."""
+    profiles: tuple
+    locations: tuple
+    job_types: tuple
+    experience: str
+
+    @classmethod
+    def parse(cls, profile, location, job_type, experience):
+        return cls(
+            profiles=tuple(sorted(split_values(profile))),
+            locations=tuple(sorted(split_values(location))),
+            job_types=tuple(sorted({v.strip() for v in job_type.split(",") if v.strip()})),
+            experience=experience,
+        )
+
+    def keys(self):
+        """Every (profile, location, job_type, experience) combination this search accepts; None = any."""
+        return product(
+            self.profiles or (None,),
+            self.locations or (None,),
+            self.job_types or (None,),
+            (self.experience or None,),
+        )
+
+
+class SearchIndex:
+    """
+    Inverted index over saved searches, with JobFilter semantics: a search
+    matches when any of its profile values occurs in the title, any location
+    value in the location, the job type is one of its types and the
+    experience bucket agrees (empty fields do not filter).
+
+    Searches with the same criteria share one entry, filed under every key
+    from Criteria.keys(). For a job only the distinct profile and location
+    values are substring-checked (found through their first trigram); the
+    entries that match are then exact lookups of the job's own keys.
+    """
+
+    def __init__(self):
+        self.criteria_ids = {}
+        # user id -> [(criteria id, since), ...]
+        self.searches = defaultdict(list)
+        # (field, trigram) -> values starting with it; values shorter than a trigram are always tried
+        self.values = defaultdict(set)
+        self.short_values = {'profile': set(), 'location': set()}
+        self.by_key = defaultdict(list)
+        self.size = 0
+        # oldest `since` of any search; no job before it can match
+        self.since = None
+        # job signature -> matching criteria ids; postings repeat title and place a lot
+        self._memo = {}
+
+    def add(self, criteria, user_id, since):
+        self.size += 1
+        if self.since is None or since < self.since:
+            self.since = since
+        criteria_id = self.criteria_ids.get(criteria)
+        if criteria_id is None:
+            criteria_id = self.criteria_ids[criteria] = len(self.criteria_ids)
+            self._file(criteria, criteria_id)
+        self.searches[user_id].append((criteria_id, since))
+
+    def _file(self, criteria, criteria_id):
+        for field, values in (('profile', criteria.profiles), ('location', criteria.locations)):
+            for value in values:
+                if len(value) < GRAM:
+                    self.short_values[field].add(value)
+                else:
+                    self.values[(field, value[:GRAM])].add(value)
+        for key in criteria.keys():
+            self.by_key[key].append(criteria_id)
+
+    def _present(self, field, text):
+        """Indexed values of `field` that occur in `text`, plus None."""
+        found = {None}
+        found.update(value for value in self.short_values[field] if value in text)
+        for gram in grams(text):
+            for value in self.values.get((field, gram), ()):
+                if value in text:
+                    found.add(value)
+        return found
+
+    def matching_criteria(self, job):
+        title, location = job['title'].lower(), job['location'].lower()
+        # same buckets as JobFilter.filter_experience (unparsed counts as experienced)
+        experience = SavedSearch.Experience.FRESHER if job['min_experience'] == 0 else SavedSearch.Experience.EXPERIENCED
+        signature = (title, location, job['job_type'], experience)
+        matched = self._memo.get(signature)
+        if matched is None:
+            keys = product(
+                self._present('profile', title),
+                self._present('location', location),
+                (job['job_type'], None),
+                (experience, None),
+            )
+            matched = set()
+            for key in keys:
+                matched.update(self.by_key.get(key, ()))
+            self._memo[signature] = matched
+        return matched
+
+
+def load_index(batch_size=10000):
+    rows = (
+        SavedSearch.objects
+        .filter(is_active=True)
+        .values_list('user_id', 'profile', 'location', 'job_type', 'experience', 'created_at', 'last_alerted_at')
+        .iterator(chunk_size=batch_size)
+    )
+    index = SearchIndex()
+    for user_id, profile, location, job_type, experience, created_at, last_alerted_at in rows:
+        since = max(created_at, last_alerted_at) if last_alerted_at else created_at
+        index.add(Criteria.parse(profile, location, job_type, experience), user_id, since)
+    return index
+
+
+def new_jobs(since, until, batch_size=2000):
+    return (
+        Job.objects
+        .filter(created_at__gt=since, created_at__lte=until, deadline__gte=localdate())
+        .order_by('created_at', 'id')
+        .values(*JOB_FIELDS)
+        .iterator(chunk_size=batch_size)
+    )
+
+
+def match_jobs(index, jobs):
+    """
+    Stream `jobs` (oldest first) through the index. Returns
+    ({user_id: (total, newest jobs)}, jobs seen), keeping at most
+    MAX_JOBS_PER_DIGEST jobs per user; a job matched by several of a user's
+    searches counts once.
+    """
+    seen = []
+    # criteria id -> positions in `seen`, ascending
+    hits = defaultdict(list)
+    for job in jobs:
+        position = len(seen)
+        seen.append(job)
+        for criteria_id in index.matching_criteria(job):
+            hits[criteria_id].append(position)
+
+    created = [job['created_at'] for job in seen]
+    matches = {}
+    for user_id, searches in index.searches.items():
+        lists = []
+        for criteria_id, since in searches:
+            positions = hits.get(criteria_id)
+            if positions:
+                # only jobs newer than the search or its last alert
+                first = bisect_left(positions, bisect_right(created, since))
+                if first < len(positions):
+                    lists.append(positions[first:] if first else positions)
+        if not lists:
+            continue
+        positions = lists[0] if len(lists) == 1 else sorted(set().union(*lists))
+        matches[user_id] = (len(positions), [seen[p] for p in reversed(positions[-MAX_JOBS_PER_DIGEST:])])
+    return matches, len(seen)
+
+
+# one template for every digest, filled per recipient (`{{ params.* }}`, see send_batch_email)
+DIGEST_SUBJECT = "JobLane - {{ params.count }} matching your saved searches"
+DIGEST_TEXT = """Hello {{ params.name }},
+
+{{ params.count }} matched your saved searches today:
+
+{{ params.jobs }}"""
+DIGEST_HTML = """
+<html>
+  <body style="margin:0; padding:0; background-color:#f9fafb; font-family: Arial, sans-serif; color:#333;">
+    <div style="max-width:600px; margin:20px auto; background:#ffffff; border-radius:10px; overflow:hidden;">
+      <h1 style="margin:0; padding:20px; font-size:24px; color:#ffffff; background:#2563eb; text-align:center;">JobLane</h1>
+      <div style="padding:30px;">
+        <h2 style="margin-top:0;">Hello <span style="color:#2563eb;">{{ params.name }}</span>,</h2>
+        <p style="font-size:16px;">{{ params.count }} matched your saved searches today:</p>
+        <p style="font-size:15px; line-height:1.6; white-space:pre-line;">{{ params.jobs }}</p>
+      </div>
+    </div>
+  </body>
+</html>
+""".strip()
+
+
+def digest_params(name, total, jobs):
+    """Template params of the daily alert: `total` matches, the newest `jobs` listed."""
+    more = total - len(jobs)
+    lines = [f"- {job['title']} at {job['company__name']} ({job['location']})" for job in jobs]
+    if more > 0:
+        lines.append(f"...and {more} more on JobLane.")
+    return {"name": name, "count": f"{total} new job{'s' if total != 1 else ''}", "jobs": "\n".join(lines)}
+
+
+def _recipients(matches, batch_size=1000):
+    """Batches of [(user_id, send_batch_email recipient), ...]."""
+    user_ids = list(matches)
+    for start in range(0, len(user_ids), batch_size):
+        users = User.objects.filter(pk__in=user_ids[start:start + batch_size]).values_list('pk', 'email', 'profile__name')
+        batch = []
+        for user_id, email, name in users:
+            name = name or email.split("@")[0]
+            batch.append((user_id, {"email": email, "name": name, "params": digest_params(name, *matches[user_id])}))
+        yield batch
+
+
+def _send_digests(recipients):
+    """Send one batch; returns the recipients the provider did not take."""
+    try:
+        results = send_batch_email(
+            subject=DIGEST_SUBJECT, text_content=DIGEST_TEXT, html_content=DIGEST_HTML, recipients=recipients
+        )
+    except Exception:
+        logger.exception("Sending %s job alert digests failed", len(recipients))
+        results = [False] * len(recipients)
+    return [recipient for recipient, sent in zip(recipients, results) if not sent]
+
+
+def _outbox_message(recipient):
+    params = recipient["params"]
+    return {
+        "email": recipient["email"],
+        "name": recipient["name"],
+        "subject": render_params(DIGEST_SUBJECT, params),
+        "text_content": render_params(DIGEST_TEXT, params),
+        "html_content": render_params(DIGEST_HTML, params, escape=True),
+    }
+
+
+def send_job_alerts(max_lookback=MAX_LOOKBACK):
+    """
+    Match jobs created since the active saved searches were last alerted
+    against them and send one digest per user. Returns (searches, jobs, digests).
+    """
+    now = timezone.now()
+    index = load_index()
+    if index.since is None:
+        return 0, 0, 0
+    matches, jobs_seen = match_jobs(index, new_jobs(max(index.since, now - max_lookback), now))
+
+    digests = 0
+    for batch in _recipients(matches):
+        unsent = _send_digests([recipient for _, recipient in batch])
+        with transaction.atomic():
+            # the outbox retries them one by one
+            enqueue_emails(_outbox_message(recipient) for recipient in unsent)
+            # advanced per batch so a crash later on does not send these again
+            SavedSearch.objects.filter(
+                user_id__in=[user_id for user_id, _ in batch], is_active=True, created_at__lte=now
+            ).update(last_alerted_at=now)
+        digests += len(batch)
+
+    SavedSearch.objects.filter(is_active=True, created_at__lte=now).update(last_alerted_at=now)
+    return index.size, jobs_seen, digests
@@ -0,0 +1,207 @@
+"""
+Background exports: the API queues an ExportJob, `manage.py run_export_worker`
+claims it, writes the file in chunks to EXPORT_STORAGE while reporting
+progress, and the API serves the finished artifact.
+
+The queue is the ExportJob table itself (ExportQueue, see joblane.queues). A
+claim is identified by its started_at: heartbeats and the final write only
+touch the row while it is still Running under that claim, so a worker that
+was requeued as stale cannot overwrite the run that replaced it.
+"""
+import hashlib
+import json
+import logging
+import tempfile
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.exports import EXPORTS
+from jobs.models import ExportJob
+from joblane.queues import TaskQueue
+
+logger = logging.getLogger(__name__)
+
+# well under STALE_AFTER, so only a dead worker misses enough beats to be requeued
+HEARTBEAT_EVERY = timedelta(seconds=30)
+STALE_AFTER = timedelta(minutes=10)
+# a live worker that missed a couple of beats (slow database, GC pause) must not be requeued
+MIN_STALE_AFTER = 3 * HEARTBEAT_EVERY
+
+
+def params_hash(user, kind, export_format, params):
+    payload = json.dumps([user.pk, kind, export_format, params], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def request_export(user, kind, export_format, params):
+    """
+    Queue an export, or return the queued / running / still fresh one for the
+    same request. Returns (export_job, created).
+    """
+    digest = params_hash(user, kind, export_format, params)
+    while True:
+        existing = (
+            ExportJob.objects
+            .filter(owner=user, params_hash=digest)
+            .filter(
+                Q(status__in=[ExportJob.Status.PENDING, ExportJob.Status.RUNNING])
+                | Q(status=ExportJob.Status.DONE, expires_at__gt=timezone.now())
+            )
+            .first()
+        )
+        if existing is not None:
+            return existing, False
+
+        try:
+            with transaction.atomic():
+                return ExportJob.objects.create(
+                    owner=user, kind=kind, export_format=export_format, params=params, params_hash=digest
+                ), True
+        except IntegrityError:
+            # an identical request queued it in between (export_one_active_per_request); return that one
+            continue
+
+
+class ExportQueue(TaskQueue):
+    """ExportJob rows, run by `manage.py run_export_worker`; liveness is the heartbeat."""
+    model = ExportJob
+    pending = ExportJob.Status.PENDING
+    running = ExportJob.Status.RUNNING
+    alive_at_field = 'heartbeat_at'
+    stale_after = STALE_AFTER
+
+    def __init__(self, stale_after=None):
+        super().__init__(stale_after)
+        if self.stale_after < MIN_STALE_AFTER:
+            raise ValueError(
+                f"stale_after must be at least {int(MIN_STALE_AFTER.total_seconds())}s "
+                f"(heartbeats every {int(HEARTBEAT_EVERY.total_seconds())}s)"
+            )
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('owner')
+
+    def claim_values(self, now):
+        return {**super().claim_values(now), 'heartbeat_at': now}
+
+    def requeue_values(self):
+        return {**super().requeue_values(), 'processed_rows': 0}
+
+    def housekeeping(self):
+        purge_expired_exports()
+
+    def run(self, task):
+        run_export(task)
+        return f"Export {task.pk}: {task.status} ({task.processed_rows} rows)"
+
+
+export_queue = ExportQueue()
+
+
+class Heartbeat:
+    """
+    Writes heartbeat_at and processed_rows every HEARTBEAT_EVERY from a
+    background thread while an export runs, so long single calls (the count
+    query, the upload to storage) keep the claim alive too. Rows passed
+    through track() are counted in memory.
+    """
+
+    def __init__(self, export_job, interval=HEARTBEAT_EVERY):
+        self.export_job = export_job
+        self.interval = interval.total_seconds()
+        self.processed = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"export-{export_job.pk}-heartbeat", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+    def track(self, rows):
+        for row in rows:
+            yield row
+            self.processed += 1
+
+    def beat(self):
+        return export_queue.claimed(self.export_job).update(processed_rows=self.processed, heartbeat_at=timezone.now())
+
+    def _run(self):
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    self.beat()
+                except Exception:
+                    logger.exception("Heartbeat of export %s failed", self.export_job.pk)
+        finally:
+            # the thread's own connection
+            connection.close()
+
+
+def run_export(export_job):
+    """
+    Write the artifact of a claimed (Running) export and mark it Done or
+    Failed. If the claim was lost meanwhile (requeued as stale), the result is
+    discarded and the row is left to the worker that holds it now.
+    """
+    spec = EXPORTS[export_job.kind]
+    with Heartbeat(export_job) as heartbeat:
+        try:
+            queryset = spec.build_queryset(export_job.owner, export_job.params)
+            export_job.total_rows = queryset.count()
+            export_queue.claimed(export_job).update(total_rows=export_job.total_rows)
+
+            # spool to disk so memory stays flat, then hand the file to the storage
+            with tempfile.TemporaryFile() as spool:
+                for chunk in spec.content(export_job.export_format, heartbeat.track(spec.rows(queryset))):
+                    spool.write(chunk)
+                spool.seek(0)
+                name = f"{spec.name}-{export_job.pk}.{export_job.export_format}"
+                export_job.file.save(name, File(spool), save=False)
+        except Exception as exc:
+            logger.exception("Export %s failed", export_job.pk)
+            export_job.status = ExportJob.Status.FAILED
+            export_job.error = str(exc)[:1000]
+        else:
+            export_job.status = ExportJob.Status.DONE
+            export_job.expires_at = timezone.now() + timedelta(seconds=settings.EXPORT_TTL)
+        export_job.processed_rows = heartbeat.processed
+
+    export_job.finished_at = timezone.now()
+    finished = export_queue.claimed(export_job).update(
+        status=export_job.status,
+        error=export_job.error,
+        file=export_job.file,
+        total_rows=export_job.total_rows,
+        processed_rows=export_job.processed_rows,
+        finished_at=export_job.finished_at,
+        expires_at=export_job.expires_at,
+    )
+    if not finished:
+        logger.warning("Export %s was requeued while running; discarding this run", export_job.pk)
+        if export_job.file:
+            export_job.file.delete(save=False)
+        export_job.refresh_from_db()
+    return export_job
+
+
+def purge_expired_exports():
+    """Delete artifacts past their TTL; the rows stay as Expired for polling clients."""
+    expired = ExportJob.objects.filter(status=ExportJob.Status.DONE, expires_at__lte=timezone.now())
+    purged = 0
+    for export_job in expired.iterator():
+        if export_job.file:
+            export_job.file.delete(save=False)
+        export_job.status = ExportJob.Status.EXPIRED
+        export_job.save(update_fields=['status', 'file'])
+        purged += 1
+    return purged
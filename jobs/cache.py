@@ -0,0 +1,98 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.timezone import localdate
+
+
+def _generation_key(namespace):
+    return f"jobs:gen:{namespace}"
+
+
+def get_generation(namespace):
+    """
+    Current generation number of a cache namespace. Entries embed it in their
+    key, so bumping the generation invalidates all of them at once.
+    """
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # start from a timestamp so an evicted counter never reuses old keys
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(namespace):
+    key = _generation_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def bump_generation_on_commit(*namespaces):
+    """
+    bump_generation() once the current transaction commits (at once outside
+    one). Bumped earlier, a concurrent request could still read the old rows
+    and cache them under the new generation until the next write.
+    """
+    transaction.on_commit(lambda: [bump_generation(namespace) for namespace in namespaces])
+
+
+# ===== Anonymous job list response cache =====
+JOB_LIST_NAMESPACE = "job-list"
+
+# JobFilter/SearchFilter treat these case-insensitively
+CASE_INSENSITIVE_PARAMS = {"profile", "location", "q", "search"}
+# comma separated sets where order does not matter
+UNORDERED_LIST_PARAMS = {"profile", "location", "job_type", "facets"}
+
+
+def normalize_query(params):
+    items = []
+    for key in params:
+        for value in params.getlist(key):
+            value = value.strip()
+            if key in CASE_INSENSITIVE_PARAMS:
+                value = value.lower()
+            if key in UNORDERED_LIST_PARAMS:
+                value = ",".join(sorted({v.strip() for v in value.split(",") if v.strip()}))
+            items.append((key, value))
+    return urlencode(sorted(items))
+
+
+def job_list_cache_key(request):
+    # the date rolls the cache over when deadline__gte=localdate() moves
+    digest = hashlib.md5(
+        f"{request.get_host()}?{normalize_query(request.query_params)}".encode()
+    ).hexdigest()
+    generation = get_generation(JOB_LIST_NAMESPACE)
+    return f"jobs:list:{generation}:{localdate().isoformat()}:{digest}"
+
+
+def _stats_key(namespace, outcome):
+    return f"jobs:stats:{namespace}:{outcome}"
+
+
+def record_cache_lookup(namespace, hit):
+    key = _stats_key(namespace, "hits" if hit else "misses")
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def cache_stats(namespace):
+    hits = cache.get(_stats_key(namespace, "hits"), 0)
+    misses = cache.get(_stats_key(namespace, "misses"), 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / lookups, 4) if lookups else None,
+        "generation": get_generation(namespace),
+    }
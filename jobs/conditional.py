@@ -0,0 +1,95 @@
+import hashlib
+from abc import ABC, abstractmethod
+from functools import reduce
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.timezone import localdate
+from rest_framework.response import Response
+
+
+def build_etag(request, parts):
+    user_id = request.user.pk if request.user.is_authenticated else 0
+    raw = "|".join(str(p) for p in (request.get_full_path(), user_id, *parts))
+    return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+
+def _field_value(row, path):
+    return reduce(lambda obj, name: getattr(obj, name, None), path.split("__"), row)
+
+
+def page_fingerprint(rows, *timestamp_fields):
+    """
+    Id and timestamps (model field paths, e.g. 'company__updated_at') of each
+    row already loaded for a page: changes when a row on it is edited, joins,
+    leaves or moves.
+    """
+    return [
+        (row.pk, *(_field_value(row, field) for field in timestamp_fields))
+        for row in rows
+    ]
+
+
+class ConditionalGetMixin(ABC):
+    """
+    ETag / Last-Modified for GET endpoints. Validators come from cheap
+    timestamps and counters, so a matching If-None-Match / If-Modified-Since
+    is answered with 304 before the serializer runs.
+
+    List views fingerprint the page they return (ETag only: a row leaving the
+    set does not advance any timestamp). Detail views may also return a
+    datetime for Last-Modified.
+    """
+    etag = None
+    last_modified = None
+
+    @abstractmethod
+    def get_validators(self, instance=None):
+        """Return (etag_parts, last_modified_or_None) for `instance`, the object or page being returned."""
+
+    def not_modified_response(self, instance=None):
+        parts, self.last_modified = self.get_validators(instance)
+        self.etag = build_etag(self.request, [localdate(), *parts])
+        return self.conditional_response()
+
+    def conditional_response(self):
+        # HTTP dates have one-second resolution
+        last_modified = int(self.last_modified.timestamp()) if self.last_modified else None
+        return get_conditional_response(self.request, etag=self.etag, last_modified=last_modified)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.etag and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            if self.last_modified:
+                response["Last-Modified"] = http_date(self.last_modified.timestamp())
+            response.setdefault("Cache-Control", "private, no-cache")
+        return response
+
+
+class ConditionalListMixin(ConditionalGetMixin):
+    """
+    Validators from the page itself: the paginator's state (total count or
+    whether a next page exists) and each row's id and timestamps. The page
+    query runs either way, so a 304 costs no query beyond those of the 200.
+    """
+    # (model field paths) of each row that are part of the page fingerprint
+    fingerprint_timestamps = ()
+
+    def get_validators(self, instance=None):
+        state = self.paginator.get_page_state() if self.paginator is not None else None
+        return [state, *page_fingerprint(instance, *self.fingerprint_timestamps)], None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+
+        not_modified = self.not_modified_response(rows)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(rows, many=True)
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
@@ -0,0 +1,147 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest, Now
+
+from jobs.models import Application, Job
+
+STATUS_COUNTER_FIELDS = {
+    Application.Status.PENDING: 'pending_count',
+    Application.Status.SHORTLISTED: 'shortlisted_count',
+    Application.Status.REJECTED: 'rejected_count',
+}
+COUNTER_FIELDS = ['applicant_count', *STATUS_COUNTER_FIELDS.values()]
+
+
+def _bump(job_id, **deltas):
+    # single UPDATE ... SET col = col + n, safe under concurrent writers
+    Job.objects.filter(pk=job_id).update(updated_at=Now(), **{
+        field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()
+    })
+
+
+def application_created(application):
+    _bump(application.job_id, **{
+        'applicant_count': 1,
+        STATUS_COUNTER_FIELDS[application.status]: 1,
+    })
+
+
+def application_deleted(application):
+    _bump(application.job_id, **{
+        'applicant_count': -1,
+        STATUS_COUNTER_FIELDS[application.status]: -1,
+    })
+
+
+def change_application_status(application, new_status):
+    """
+    Compare-and-set the status and move the per-status counters in one
+    transaction. Returns False when the status was already `new_status`.
+    """
+    old_status = application.status
+    if old_status == new_status:
+        return False
+
+    with transaction.atomic():
+        updated = (
+            Application.objects
+            .filter(pk=application.pk, status=old_status)
+            .update(status=new_status, updated_at=Now())
+        )
+        if not updated:
+            # someone else changed it first; reload and retry against the fresh value
+            application.refresh_from_db(fields=['status'])
+            return change_application_status(application, new_status)
+
+        _bump(application.job_id, **{
+            STATUS_COUNTER_FIELDS[old_status]: -1,
+            STATUS_COUNTER_FIELDS[new_status]: 1,
+        })
+
+    application.status = new_status
+    return True
+
+
+def bulk_change_application_status(applications, new_status):
+    """
+    Set-based change_application_status for a queryset: one UPDATE of the
+    rows not already at `new_status` and one counter UPDATE per affected job.
+    Returns the changed applications as (unsaved) instances with pk, job_id
+    and the new status.
+    """
+    with transaction.atomic():
+        # locked, so the old statuses the counter deltas come from stay true until commit
+        rows = list(
+            applications
+            .exclude(status=new_status)
+            .select_for_update(of=('self',))
+            .order_by('pk')
+            .values_list('pk', 'job_id', 'status')
+        )
+        if not rows:
+            return []
+
+        Application.objects.filter(pk__in=[pk for pk, _, _ in rows]).exclude(status=new_status).update(
+            status=new_status, updated_at=Now()
+        )
+
+        deltas = defaultdict(Counter)
+        for _, job_id, old_status in rows:
+            deltas[job_id][STATUS_COUNTER_FIELDS[old_status]] -= 1
+            deltas[job_id][STATUS_COUNTER_FIELDS[new_status]] += 1
+        for job_id, job_deltas in deltas.items():
+            _bump(job_id, **job_deltas)
+
+    return [Application(pk=pk, job_id=job_id, status=new_status) for pk, job_id, _ in rows]
+
+
+def actual_counts(job_ids):
+    counts = {job_id: dict.fromkeys(COUNTER_FIELDS, 0) for job_id in job_ids}
+    rows = (
+        Application.objects
+        .filter(job_id__in=job_ids)
+        .values_list('job_id', 'status')
+        .annotate(n=Count('id'))
+        .order_by()
+    )
+    for job_id, status, n in rows:
+        counts[job_id]['applicant_count'] += n
+        counts[job_id][STATUS_COUNTER_FIELDS[status]] += n
+    return counts
+
+
+def reconcile_counts(batch_size=1000):
+    """
+    Recompute counters for every job in primary-key batches and rewrite only
+    the rows that drifted. Yields (jobs_checked, jobs_fixed) per batch.
+    """
+    last_id = 0
+    while True:
+        # lock one batch at a time so concurrent applies wait only briefly
+        with transaction.atomic():
+            jobs = list(
+                Job.objects
+                .select_for_update()
+                .filter(pk__gt=last_id)
+                .order_by('pk')
+                .only('pk', *COUNTER_FIELDS)[:batch_size]
+            )
+            if not jobs:
+                return
+
+            counts = actual_counts([job.pk for job in jobs])
+            drifted = []
+            for job in jobs:
+                expected = counts[job.pk]
+                if any(getattr(job, field) != value for field, value in expected.items()):
+                    for field, value in expected.items():
+                        setattr(job, field, value)
+                    drifted.append(job)
+
+            if drifted:
+                Job.objects.bulk_update(drifted, COUNTER_FIELDS)
+
+        last_id = jobs[-1].pk
+        yield len(jobs), len(drifted)
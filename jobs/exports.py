@@ -0,0 +1,251 @@
+"""
+Exports of applicants and recruiter jobs in xlsx, csv and ndjson, streamed
+inline (export_response) or written by the background worker
+(jobs.background_exports) from the same ExportSpec.
+
+Rows are plain tuples from values_list(...).iterator(), written in batches of
+EXPORT_BATCH_SIZE rows per chunk. csv and ndjson are gzip-encoded for clients
+that accept it; xlsx is already a zip and is sent as is.
+"""
+import csv
+import io
+import json
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+from django.utils.timezone import localtime
+from rest_framework.exceptions import ValidationError
+from rest_framework.negotiation import DefaultContentNegotiation
+
+from jobs.models import Application, Job
+from jobs.xlsx import CONTENT_TYPE as XLSX_CONTENT_TYPE, stream_xlsx
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_BATCH_SIZE = 500
+
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+class ExportNegotiation(DefaultContentNegotiation):
+    """
+    ?format= picks the export file format on these views, not a DRF renderer;
+    errors are still rendered with the first (JSON) renderer.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def _batched(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_csv(header, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    for batch in _batched(rows):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _json_default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def stream_ndjson(keys, rows):
+    encode = json.JSONEncoder(default=_json_default, ensure_ascii=False).encode
+    for batch in _batched(rows):
+        yield "".join(encode(dict(zip(keys, row))) + "\n" for row in batch).encode()
+
+
+EXPORT_FORMATS = {
+    "xlsx": XLSX_CONTENT_TYPE,
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def validate_export_format(value):
+    export_format = (value or "xlsx").lower()
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError({"format": f"Choose one of: {', '.join(EXPORT_FORMATS)}."})
+    return export_format
+
+
+def get_export_format(request):
+    return validate_export_format(request.query_params.get("format"))
+
+
+# ===== What can be exported =====
+@dataclass(frozen=True)
+class ExportSpec:
+    name: str
+    fields: list            # (export key, values_list path)
+    columns: list           # xlsx headers
+    xlsx_row: Callable      # raw row -> xlsx row
+    build_queryset: Callable  # (user, params) -> queryset
+    params: tuple           # accepted filter params
+
+    @property
+    def keys(self):
+        return [key for key, _ in self.fields]
+
+    def clean_params(self, data):
+        return {name: str(data[name]).strip() for name in self.params if str(data.get(name) or "").strip()}
+
+    def rows(self, queryset):
+        # plain tuples over a server-side cursor: no model instances, no N+1
+        paths = [path for _, path in self.fields]
+        return queryset.values_list(*paths).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    def content(self, export_format, rows):
+        """Iterator of file bytes for `rows` in the given format."""
+        if export_format == "xlsx":
+            return stream_xlsx(self.columns, map(self.xlsx_row, rows), title=self.name.title())
+        if export_format == "csv":
+            return stream_csv(self.keys, rows)
+        return stream_ndjson(self.keys, rows)
+
+
+def _date(value):
+    return value.strftime("%d %b %Y")
+
+
+def applicant_export_queryset(user, params):
+    qs = Application.objects.filter(job__created_by=user).order_by("job_id", "-applied_at", "-id")
+
+    if params.get("job_id"):
+        try:
+            qs = qs.filter(job_id=int(params["job_id"]))
+        except ValueError:
+            raise ValidationError({"job_id": "Must be an integer."})
+
+    status = params.get("status")
+    if status and status.lower() != "all":
+        qs = qs.filter(status=status)
+
+    return qs
+
+
+def applicant_xlsx_row(row):
+    _, name, email, phone, _, title, status, _, applied_at = row
+    return [name, email, phone, title, status, _date(localtime(applied_at))]
+
+
+APPLICANTS_EXPORT = ExportSpec(
+    name="applicants",
+    fields=[
+        ("id", "id"),
+        ("applicant_name", "applicant__name"),
+        ("applicant_email", "applicant__user__email"),
+        ("applicant_phone", "applicant__phone"),
+        ("job_id", "job_id"),
+        ("job_title", "job__title"),
+        ("status", "status"),
+        ("fit_score", "fit_score"),
+        ("applied_at", "applied_at"),
+    ],
+    columns=["Applicant Name", "Email", "Phone", "Job Title", "Status", "Applied On"],
+    xlsx_row=applicant_xlsx_row,
+    build_queryset=applicant_export_queryset,
+    params=("job_id", "status"),
+)
+
+# same search / ordering as RecruiterJobViewSet
+JOB_SEARCH_FIELDS = ("title", "company__name", "location")
+JOB_ORDERING_FIELDS = ("created_at", "deadline", "applicant_count")
+
+
+def job_export_queryset(user, params):
+    qs = Job.objects.filter(created_by=user)
+
+    for term in re.split(r"[\s,]+", params.get("search", "")):
+        if term:
+            qs = qs.filter(Q(*[Q(**{f"{field}__icontains": term}) for field in JOB_SEARCH_FIELDS], _connector=Q.OR))
+
+    ordering = [
+        field for field in params.get("ordering", "").split(",")
+        if field.strip().lstrip("-") in JOB_ORDERING_FIELDS
+    ]
+    return qs.order_by(*[f.strip() for f in ordering] or ["-created_at"], "-id")
+
+
+def job_xlsx_row(row):
+    (_, title, _, location, job_type, experience, ctc, _, _, _, _,
+     deadline, created_at, applicants, pending, shortlisted, rejected) = row
+    return [
+        title, location, job_type, experience, ctc, _date(deadline), _date(localtime(created_at)),
+        applicants, pending, shortlisted, rejected,
+    ]
+
+
+JOBS_EXPORT = ExportSpec(
+    name="jobs",
+    fields=[
+        ("id", "id"),
+        ("title", "title"),
+        ("company", "company__name"),
+        ("location", "location"),
+        ("job_type", "job_type"),
+        ("experience", "experience"),
+        ("ctc", "ctc"),
+        ("min_experience", "min_experience"),
+        ("max_experience", "max_experience"),
+        ("min_ctc", "min_ctc"),
+        ("max_ctc", "max_ctc"),
+        ("deadline", "deadline"),
+        ("created_at", "created_at"),
+        ("applicant_count", "applicant_count"),
+        ("pending_count", "pending_count"),
+        ("shortlisted_count", "shortlisted_count"),
+        ("rejected_count", "rejected_count"),
+    ],
+    columns=[
+        "Title", "Location", "Job Type", "Experience", "CTC", "Deadline", "Posted On",
+        "Applicants", "Pending", "Shortlisted", "Rejected",
+    ],
+    xlsx_row=job_xlsx_row,
+    build_queryset=job_export_queryset,
+    params=("search", "ordering"),
+)
+
+EXPORTS = {spec.name: spec for spec in (APPLICANTS_EXPORT, JOBS_EXPORT)}
+
+
+def export_response(request, spec):
+    """Stream `spec` for request.user, filtered by the request's query params."""
+    export_format = get_export_format(request)
+    queryset = spec.build_queryset(request.user, spec.clean_params(request.query_params))
+    content = spec.content(export_format, spec.rows(queryset))
+
+    response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{spec.name}.{export_format}"'
+
+    if export_format != "xlsx":
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if ACCEPTS_GZIP_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response.streaming_content = compress_sequence(response.streaming_content)
+            response["Content-Encoding"] = "gzip"
+
+    return response
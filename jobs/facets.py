@@ -0,0 +1,96 @@
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils.timezone import localdate
+
+from jobs.cache import get_generation
+from jobs.models import Job
+
+FILTER_OPTIONS_NAMESPACE = "filter-options"
+FILTER_OPTIONS_TIMEOUT = 60 * 60
+FILTER_OPTION_FIELDS = ("location", "title", "job_type")
+
+
+def count_filter_options():
+    """
+    Per-value counts of location, title and job_type over active jobs, from a
+    single GROUP BY over the three columns folded per field in Python.
+    """
+    counters = {field: Counter() for field in FILTER_OPTION_FIELDS}
+    rows = (
+        Job.objects
+        .filter(deadline__gte=localdate())
+        .values_list(*FILTER_OPTION_FIELDS)
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for *values, n in rows:
+        for field, value in zip(FILTER_OPTION_FIELDS, values):
+            counters[field][value] += n
+
+    return {
+        field: sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+        for field, counter in counters.items()
+    }
+
+
+def get_filter_options():
+    # keyed by date as well: jobs drop out of the active set at midnight
+    key = f"jobs:filter-options:{get_generation(FILTER_OPTIONS_NAMESPACE)}:{localdate().isoformat()}"
+    options = cache.get(key)
+    if options is None:
+        options = count_filter_options()
+        cache.set(key, options, FILTER_OPTIONS_TIMEOUT)
+    return options
+
+
+# ===== Search facets (JobListAPIView ?facets=) =====
+LOCATION_FACET_SIZE = 20
+
+EXPERIENCE_BUCKETS = {
+    "Fresher": Q(min_experience=0),
+    "Experienced": ~Q(min_experience=0) | Q(min_experience__isnull=True),
+}
+
+
+def facet_buckets(name):
+    """(value, condition) pairs for a facet, mirroring JobFilter semantics."""
+    if name == "job_type":
+        return [(value, Q(job_type=value)) for value in Job.JobType.values]
+    if name == "experience":
+        return list(EXPERIENCE_BUCKETS.items())
+    if name == "location":
+        # candidates come from the cached filter-options index
+        top = get_filter_options()["location"][:LOCATION_FACET_SIZE]
+        return [(value, Q(location=value)) for value, _ in top]
+    raise KeyError(name)
+
+
+FACETS = ("job_type", "location", "experience")
+
+
+def facet_counts(queryset, names):
+    """
+    Counts for every requested facet bucket over an already filtered
+    queryset, as one conditional-aggregation query:
+    SELECT COUNT(id) FILTER (WHERE ...), COUNT(id) FILTER (WHERE ...), ...
+    """
+    buckets = {name: facet_buckets(name) for name in names}
+    aggregates = {}
+    for name, pairs in buckets.items():
+        for i, (_, condition) in enumerate(pairs):
+            aggregates[f"{name}_{i}"] = Count("id", filter=condition)
+
+    totals = queryset.order_by().aggregate(**aggregates) if aggregates else {}
+
+    result = {}
+    for name, pairs in buckets.items():
+        counts = [
+            {"value": value, "count": totals[f"{name}_{i}"]}
+            for i, (value, _) in enumerate(pairs)
+        ]
+        if name == "location":
+            counts = sorted((c for c in counts if c["count"]), key=lambda c: -c["count"])
+        result[name] = counts
+    return result
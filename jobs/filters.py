@@ -1,9 +1,36 @@
 import django_filters
 from django.db.models import Q
+from rest_framework.filters import OrderingFilter
 from .models import Job
+from .search import search_jobs
+
+# Longer comma lists are truncated; each value is one more index probe.
+MAX_FILTER_VALUES = 10
+
+
+def split_values(value):
+    values = []
+    for v in value.split(","):
+        v = v.strip().lower()
+        if v and v not in values:
+            values.append(v)
+    return values[:MAX_FILTER_VALUES]
+
+
+def any_icontains(field, values):
+    """
+    OR of `icontains` lookups. On Postgres each one compiles to
+    UPPER(col::text) LIKE UPPER('%v%'), which the pg_trgm GIN indexes from
+    migration 0005 serve as a BitmapOr; SQLite just evaluates the LIKEs.
+    """
+    q = Q()
+    for v in values:
+        q |= Q(**{f"{field}__icontains": v})
+    return q
 
 
 class JobFilter(django_filters.FilterSet):
+    q = django_filters.CharFilter(method="filter_search")
     profile = django_filters.CharFilter(method="filter_profile")
     location = django_filters.CharFilter(method="filter_location")
 
@@ -13,36 +40,65 @@ class JobFilter(django_filters.FilterSet):
 
     experience = django_filters.CharFilter(method="filter_experience")
 
+    # overlap with the job's parsed range; open-ended jobs (NULL max) match any lower bound
+    min_exp = django_filters.NumberFilter(method="filter_min_exp", min_value=0)
+    max_exp = django_filters.NumberFilter(method="filter_max_exp", min_value=0)
+    min_ctc = django_filters.NumberFilter(method="filter_min_ctc", min_value=0)
+
     class Meta:
         model = Job
         fields = []
 
+    def filter_search(self, queryset, name, value):
+        return search_jobs(queryset, value)
+
     def filter_profile(self, queryset, name, value):
-        values = [v.strip() for v in value.split(",") if v.strip()]
-        q = Q()
-        for v in values:
-            q |= Q(title__icontains=v)
-        return queryset.filter(q)
+        values = split_values(value)
+        if not values:
+            return queryset
+        return queryset.filter(any_icontains("title", values))
 
     def filter_location(self, queryset, name, value):
-        values = [v.strip() for v in value.split(",") if v.strip()]
-        q = Q()
-        for v in values:
-            q |= Q(location__icontains=v)
-        return queryset.filter(q)
+        values = split_values(value)
+        if not values:
+            return queryset
+        return queryset.filter(any_icontains("location", values))
 
     def filter_experience(self, queryset, name, value):
-        fresher_query = (
-            Q(experience__iexact="0")
-            | Q(experience__iexact="0 years")
-            | Q(experience__iexact="0 year")
-            | Q(experience__iexact="fresher")
-            | Q(experience__regex=r"^0\s*[-to]")
-            | Q(experience__istartswith="0+")
-        )
-
+        # min_experience is parsed from the free-text column on save (jobs.parsing)
         if value == "Fresher":
-            return queryset.filter(fresher_query)
+            return queryset.filter(min_experience=0)
         if value == "Experienced":
-            return queryset.exclude(fresher_query)
+            return queryset.exclude(min_experience=0)
         return queryset
+
+    def filter_min_exp(self, queryset, name, value):
+        return queryset.filter(Q(max_experience__gte=value) | Q(max_experience__isnull=True, min_experience__isnull=False))
+
+    def filter_max_exp(self, queryset, name, value):
+        return queryset.filter(min_experience__lte=value)
+
+    def filter_min_ctc(self, queryset, name, value):
+        return queryset.filter(Q(max_ctc__gte=value) | Q(max_ctc__isnull=True, min_ctc__isnull=False))
+
+
+class AliasOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that also accepts the view's `ordering_aliases`,
+    e.g. {"fit": ("-fit_score", "-id")} so ?ordering=fit means best fit first.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if params:
+            aliases = getattr(view, 'ordering_aliases', {})
+            fields = [
+                field
+                for param in params.split(',')
+                for field in aliases.get(param.strip(), (param.strip(),))
+            ]
+            ordering = self.remove_invalid_fields(queryset, fields, view, request)
+            if ordering:
+                return ordering
+
+        return self.get_default_ordering(view)
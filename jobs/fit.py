@@ -0,0 +1,135 @@
+"""
+Applicant fit: how well a seeker's Profile.skills cover a job's skills and
+requirements, as an integer 0-100 stored on Application.fit_score.
+
+Scores are computed once per (job, applicant) row and recomputed in batches
+only when Job.skills / Job.requirements or Profile.skills change (see
+jobs.signals), so ?ordering=fit is a plain indexed ORDER BY. A job can have
+thousands of applicants, so its re-score is queued as a FitScoreTask and run
+by `manage.py refresh_fit_scores` instead of inside the recruiter's request;
+a seeker's own applications are few and are re-scored on save.
+"""
+import logging
+import re
+
+from jobs.models import Application, FitScoreTask
+from jobs.recommendations import skill_set
+from joblane.queues import TaskQueue
+
+logger = logging.getLogger(__name__)
+
+SKILLS_WEIGHT = 0.7
+REQUIREMENTS_WEIGHT = 0.3
+REFRESH_BATCH_SIZE = 500
+
+WORD_RE = re.compile(r"[\w+#.]+")
+
+
+def requirement_texts(requirements):
+    if not isinstance(requirements, list):
+        return []
+    return [
+        " ".join(word.strip(".") for word in WORD_RE.findall(text.lower()))
+        for text in requirements
+        if isinstance(text, str)
+    ]
+
+
+def mentions(text, skill):
+    # whole-word match so "java" does not count for "javascript"
+    return f" {skill} " in f" {text} "
+
+
+def fit_score(seeker_skills, job_skills, requirements):
+    """
+    Weighted share of the job's skills the seeker has and of requirement
+    lines that mention at least one of the seeker's skills.
+    Arguments are normalized: skill sets and requirement_texts() output.
+    """
+    parts = []
+    if job_skills:
+        parts.append((SKILLS_WEIGHT, len(seeker_skills & job_skills) / len(job_skills)))
+    if requirements:
+        covered = sum(1 for text in requirements if any(mentions(text, s) for s in seeker_skills))
+        parts.append((REQUIREMENTS_WEIGHT, covered / len(requirements)))
+
+    if not parts or not seeker_skills:
+        return 0
+    return round(100 * sum(w * v for w, v in parts) / sum(w for w, _ in parts))
+
+
+def job_terms(job):
+    return skill_set(job.skills), requirement_texts(job.requirements)
+
+
+def score_application(application):
+    application.fit_score = fit_score(skill_set(application.applicant.skills), *job_terms(application.job))
+    return application
+
+
+def _refresh(applications, score):
+    changed = []
+    for application in applications.iterator(chunk_size=REFRESH_BATCH_SIZE):
+        new_score = score(application)
+        if new_score != application.fit_score:
+            application.fit_score = new_score
+            changed.append(application)
+
+    Application.objects.bulk_update(changed, ["fit_score"], batch_size=REFRESH_BATCH_SIZE)
+    return len(changed)
+
+
+def refresh_job_fit_scores(job):
+    """Re-score every applicant of a job after its skills / requirements changed."""
+    terms = job_terms(job)
+    applications = job.applications.select_related("applicant").only("id", "fit_score", "applicant__skills")
+    return _refresh(applications, lambda a: fit_score(skill_set(a.applicant.skills), *terms))
+
+
+def refresh_profile_fit_scores(profile):
+    """Re-score every application of a seeker after their skills changed."""
+    skills = skill_set(profile.skills)
+    applications = profile.applications.select_related("job").only(
+        "id", "fit_score", "job__skills", "job__requirements"
+    )
+    return _refresh(applications, lambda a: fit_score(skills, *job_terms(a.job)))
+
+
+def queue_job_fit_refresh(job):
+    """Queue a re-score of the job's applicants unless one is already waiting."""
+    # a Running task may have read the old terms, so only a Pending one covers this change
+    if not FitScoreTask.objects.filter(job=job, status=FitScoreTask.Status.PENDING).exists():
+        FitScoreTask.objects.create(job=job)
+
+
+def run_task(task):
+    """
+    Re-score the applicants of a claimed task's job. Returns the number of
+    scores that changed, or None if it failed (the task is kept as Failed).
+    """
+    try:
+        changed = refresh_job_fit_scores(task.job)
+    except Exception as exc:
+        logger.exception("Fit score refresh for %s failed", task)
+        task.status = FitScoreTask.Status.FAILED
+        task.error = str(exc)[:1000]
+        task.save(update_fields=['status', 'error'])
+        return None
+
+    task.delete()
+    return changed
+
+
+class FitScoreQueue(TaskQueue):
+    """FitScoreTask rows, run by `manage.py refresh_fit_scores`."""
+    model = FitScoreTask
+    pending = FitScoreTask.Status.PENDING
+    running = FitScoreTask.Status.RUNNING
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('job')
+
+    def run(self, task):
+        label = str(task)
+        changed = run_task(task)
+        return f"{label}: {'failed' if changed is None else f'{changed} scores changed'}"
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.parsing import apply_parsed_ranges
+
+RANGE_FIELDS = ["min_experience", "max_experience", "min_ctc", "max_ctc"]
+
+
+class Command(BaseCommand):
+    help = "Parse Job.experience / Job.ctc into the numeric range columns for existing rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_id = 0
+        updated = 0
+
+        while True:
+            jobs = list(
+                Job.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .only("pk", "experience", "ctc", *RANGE_FIELDS)[:batch_size]
+            )
+            if not jobs:
+                break
+
+            Job.objects.bulk_update([apply_parsed_ranges(job) for job in jobs], RANGE_FIELDS)
+            updated += len(jobs)
+            last_id = jobs[-1].pk
+
+        self.stdout.write(self.style.SUCCESS(f"Parsed ranges for {updated} jobs."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from jobs.recommendations import rebuild_skill_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the JobSkill recommendation index from Job.skills, e.g. after bulk imports."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        indexed = rebuild_skill_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed skills for {indexed} jobs."))
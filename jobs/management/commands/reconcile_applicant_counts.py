@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.counters import reconcile_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute Job applicant/status counters from Application rows and fix drift in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--sleep", type=float, default=0, help="Seconds to pause between batches.")
+
+    def handle(self, *args, **options):
+        checked = fixed = 0
+
+        for batch_checked, batch_fixed in reconcile_counts(batch_size=options["batch_size"]):
+            checked += batch_checked
+            fixed += batch_fixed
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} jobs, fixed {fixed}."))
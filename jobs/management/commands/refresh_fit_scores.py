@@ -0,0 +1,7 @@
+from jobs.fit import FitScoreQueue
+from joblane.queues import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "Re-score applicants of jobs whose skills or requirements changed. Runs until stopped unless --once is given."
+    queue_class = FitScoreQueue
@@ -0,0 +1,16 @@
+from django.core.management.base import CommandError
+
+from jobs.background_exports import ExportQueue
+from joblane.queues import QueueWorkerCommand
+
+
+class Command(QueueWorkerCommand):
+    help = "Process queued ExportJobs. Runs until stopped unless --once is given."
+    queue_class = ExportQueue
+    stale_after_help = "Seconds without a heartbeat before a running export is requeued."
+
+    def get_queue(self, options):
+        try:
+            return super().get_queue(options)
+        except ValueError as exc:
+            raise CommandError(f"--stale-after: {exc}")
@@ -0,0 +1,19 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from jobs.alerts import MAX_LOOKBACK, send_job_alerts
+
+
+class Command(BaseCommand):
+    help = "Match new jobs against saved searches and send one digest email per user. Run nightly (cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-days", type=int, default=MAX_LOOKBACK.days,
+            help="Catch up on at most this many days of jobs, e.g. after the job has not run for a while.",
+        )
+
+    def handle(self, *args, **options):
+        searches, jobs, digests = send_job_alerts(max_lookback=timedelta(days=options["max_days"]))
+        self.stdout.write(f"Matched {jobs} new jobs against {searches} saved searches; sent {digests} digests.")
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.notifications import purge_failed_notifications, send_due_notifications
+
+
+class Command(BaseCommand):
+    help = "Email applicants about application status changes in batches. Runs until stopped unless --once is given."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Send what is due now and exit.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--sleep", type=float, default=5, help="Seconds to wait when nothing is due.")
+
+    def handle(self, *args, **options):
+        while True:
+            sent, skipped, failed = send_due_notifications(batch_size=options["batch_size"])
+            if sent or skipped or failed:
+                self.stdout.write(f"Sent {sent}, coalesced {skipped}, deferred or failed {failed}.")
+                continue
+
+            purge_failed_notifications()
+            if options["once"]:
+                return
+            time.sleep(options["sleep"])
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:03
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+BACKFILL_SQL = """
+UPDATE jobs_job AS j
+SET search_vector =
+    setweight(to_tsvector('english', coalesce(j.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(c.name, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(j.location, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(j.skills::text, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(j.description, '')), 'D')
+FROM jobs_company AS c
+WHERE c.id = j.company_id
+"""
+
+
+def create_search_index(apps, schema_editor):
+    # GIN / tsvector only exist on Postgres; SQLite (tests) keeps a plain column
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS jobs_job_search_vector_gin "
+        "ON jobs_job USING gin (search_vector)"
+    )
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS jobs_job_search_vector_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_alter_application_options_alter_job_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
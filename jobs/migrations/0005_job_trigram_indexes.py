@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+# Expressions match what Postgres generates for `field__icontains`,
+# i.e. UPPER("jobs_job"."title"::text) LIKE UPPER(...)
+TRIGRAM_INDEXES = {
+    "jobs_job_title_trgm": "UPPER(title::text) gin_trgm_ops",
+    "jobs_job_location_trgm": "UPPER(location::text) gin_trgm_ops",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, expression in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON jobs_job USING gin ({expression})"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
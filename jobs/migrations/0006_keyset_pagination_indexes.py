@@ -0,0 +1,32 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_alter_pendinguser_username_alter_profile_skills'),
+        ('jobs', '0005_job_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'applied_at', 'id'], name='app_job_applied_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applicant', 'applied_at', 'id'], name='app_seeker_applied_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['created_at', 'id'], name='job_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['created_by', 'created_at', 'id'], name='job_owner_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+STATUS_FIELDS = {
+    'Pending': 'pending_count',
+    'Shortlisted': 'shortlisted_count',
+    'Rejected': 'rejected_count',
+}
+
+
+def backfill_counters(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('jobs', 'Application')
+
+    totals = {}
+    rows = Application.objects.values_list('job_id', 'status').annotate(n=Count('id')).order_by()
+    for job_id, status, n in rows:
+        counters = totals.setdefault(job_id, {'applicant_count': 0})
+        counters['applicant_count'] += n
+        counters[STATUS_FIELDS[status]] = counters.get(STATUS_FIELDS[status], 0) + n
+
+    for job_id, counters in totals.items():
+        Job.objects.filter(pk=job_id).update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='applicant_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='shortlisted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:13
+
+from django.db import migrations, models
+
+from jobs.parsing import apply_parsed_ranges
+
+RANGE_FIELDS = ['min_experience', 'max_experience', 'min_ctc', 'max_ctc']
+
+
+def backfill_ranges(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+
+    batch = []
+    for job in Job.objects.only('id', 'experience', 'ctc').iterator():
+        batch.append(apply_parsed_ranges(job))
+        if len(batch) >= 1000:
+            Job.objects.bulk_update(batch, RANGE_FIELDS)
+            batch = []
+    Job.objects.bulk_update(batch, RANGE_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_application_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='max_ctc',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, max_digits=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='max_experience',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='min_ctc',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, max_digits=7, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='min_experience',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_ranges, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_skill_index(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobSkill = apps.get_model('jobs', 'JobSkill')
+
+    rows = []
+    for job_id, skills, deadline in Job.objects.values_list('id', 'skills', 'deadline').iterator():
+        normalized = {
+            ' '.join(skill.lower().split())[:100]
+            for skill in (skills if isinstance(skills, list) else [])
+            if isinstance(skill, str) and skill.strip()
+        }
+        rows.extend(JobSkill(job_id=job_id, skill=skill, deadline=deadline) for skill in normalized)
+        if len(rows) >= 5000:
+            JobSkill.objects.bulk_create(rows)
+            rows = []
+    JobSkill.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_change_tracking_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('deadline', models.DateField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'deadline'], name='jobskill_skill_deadline_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'skill'), name='unique_job_skill')],
+            },
+        ),
+        migrations.RunPython(backfill_skill_index, migrations.RunPython.noop),
+    ]
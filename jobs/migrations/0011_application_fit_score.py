@@ -0,0 +1,48 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:27
+
+from django.db import migrations, models
+
+
+def backfill_fit_scores(apps, schema_editor):
+    # only the pure scoring helpers are used, never the live models
+    from jobs.fit import fit_score, requirement_texts
+    from jobs.recommendations import skill_set
+
+    Application = apps.get_model('jobs', 'Application')
+
+    batch = []
+    rows = Application.objects.select_related('job', 'applicant').only(
+        'id', 'job__skills', 'job__requirements', 'applicant__skills'
+    )
+    for application in rows.iterator(chunk_size=500):
+        application.fit_score = fit_score(
+            skill_set(application.applicant.skills),
+            skill_set(application.job.skills),
+            requirement_texts(application.job.requirements),
+        )
+        batch.append(application)
+        if len(batch) >= 500:
+            Application.objects.bulk_update(batch, ['fit_score'])
+            batch = []
+    Application.objects.bulk_update(batch, ['fit_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_alter_pendinguser_username_alter_profile_skills'),
+        ('jobs', '0010_job_skill_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='fit_score',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'fit_score', 'id'], name='app_job_fit_id_idx'),
+        ),
+        migrations.RunPython(backfill_fit_scores, migrations.RunPython.noop),
+    ]
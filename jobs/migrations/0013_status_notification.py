@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 00:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_export_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Shortlisted', 'Shortlisted'), ('Rejected', 'Rejected')], max_length=20)),
+                ('state', models.CharField(choices=[('Pending', 'Pending'), ('Sent', 'Sent'), ('Skipped', 'Skipped'), ('Failed', 'Failed')], default='Pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('due_at', models.DateTimeField()),
+                ('claim_token', models.UUIDField(blank=True, null=True)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_notifications', to='jobs.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['state', 'due_at'], name='status_notif_state_due_idx'), models.Index(fields=['claim_token'], name='status_notif_claim_idx')],
+            },
+        ),
+    ]
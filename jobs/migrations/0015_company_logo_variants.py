@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:00
+
+import accounts.storages
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0014_saved_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='logo_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='company',
+            name='logo',
+            field=models.ImageField(blank=True, null=True, storage=accounts.storages.media_storage, upload_to='company_logos/'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 02:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0015_company_logo_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FitScoreTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('Pending', 'Pending'), ('Running', 'Running'), ('Failed', 'Failed')], default='Pending', max_length=10)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fit_score_tasks', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='fit_task_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fail_duplicate_active_exports(apps, schema_editor):
+    # racing requests may already have queued twins; keep the oldest of each
+    ExportJob = apps.get_model('jobs', 'ExportJob')
+    seen = set()
+    active = ExportJob.objects.filter(status__in=['Pending', 'Running']).order_by('created_at', 'id')
+    for pk, owner_id, params_hash in active.values_list('pk', 'owner_id', 'params_hash'):
+        if (owner_id, params_hash) in seen:
+            ExportJob.objects.filter(pk=pk).update(status='Failed', error='Duplicate of an earlier request')
+        seen.add((owner_id, params_hash))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0016_fit_score_task'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_active_exports, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='exportjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['Pending', 'Running'])), fields=('owner', 'params_hash'), name='export_one_active_per_request'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 03:09
+
+from django.db import migrations, models
+
+
+def delete_finished_notifications(apps, schema_editor):
+    StatusNotification = apps.get_model('jobs', 'StatusNotification')
+    StatusNotification.objects.filter(state__in=['Sent', 'Skipped']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0017_export_one_active_per_request'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_finished_notifications, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='statusnotification',
+            name='sent_at',
+        ),
+        migrations.AlterField(
+            model_name='statusnotification',
+            name='state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Failed', 'Failed')], default='Pending', max_length=10),
+        ),
+    ]
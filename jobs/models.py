@@ -1,7 +1,10 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.contrib.postgres.search import SearchVectorField
 from accounts.models import Profile
 from django.contrib.auth import get_user_model
-from cloudinary_storage.storage import MediaCloudinaryStorage 
+from accounts.storages import media_storage
 
 User = get_user_model()
 
@@ -9,15 +12,18 @@ class Company(models.Model):
     name = models.CharField(max_length=255, db_index=True)
     logo = models.ImageField(
         upload_to="company_logos/",
-        storage=MediaCloudinaryStorage(),
+        storage=media_storage,
         null=True,
         blank=True
     )
+    # resized copies of logo, written by accounts.image_variants
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False)
     owner = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
         related_name="company"
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -43,6 +49,12 @@ class Job(models.Model):
     location = models.CharField(max_length=100, db_index=True)
     ctc = models.CharField(max_length=50)
     experience = models.CharField(max_length=100)
+
+    # Parsed from experience / ctc on save (jobs.parsing); years and LPA
+    min_experience = models.PositiveSmallIntegerField(null=True, blank=True, editable=False, db_index=True)
+    max_experience = models.PositiveSmallIntegerField(null=True, blank=True, editable=False, db_index=True)
+    min_ctc = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True, editable=False, db_index=True)
+    max_ctc = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True, editable=False, db_index=True)
     deadline = models.DateField(db_index=True)
 
     job_type = models.CharField(max_length=20, choices=JobType.choices)
@@ -55,15 +67,114 @@ class Job(models.Model):
     perks = models.JSONField(default=list, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True,db_index=True)
+    # Bumped by every change visible in job responses, incl. counters and saves
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='jobs', db_index=True)
 
+    # Denormalized application counters, maintained by jobs.counters
+    applicant_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+    pending_count = models.PositiveIntegerField(default=0, editable=False)
+    shortlisted_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Maintained by jobs.signals, GIN-indexed on Postgres (see migration 0004)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # keyset pagination (jobs.pagination.KeysetPagination)
+            models.Index(fields=['created_at', 'id'], name='job_created_id_idx'),
+            models.Index(fields=['created_by', 'created_at', 'id'], name='job_owner_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} at {self.company.name}"
 
 
+class JobSkill(models.Model):
+    """
+    Inverted skill index (skill -> jobs) for recommendations, maintained from
+    Job.skills by jobs.signals. deadline is copied from the job so active
+    postings are read from the (skill, deadline) index without a join.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.CharField(max_length=100)
+    deadline = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'skill'], name='unique_job_skill')
+        ]
+        indexes = [
+            models.Index(fields=['skill', 'deadline'], name='jobskill_skill_deadline_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.skill} -> {self.job_id}"
+
+
+def export_storage():
+    from django.conf import settings
+    from django.utils.module_loading import import_string
+
+    return import_string(settings.EXPORT_STORAGE["BACKEND"])(**settings.EXPORT_STORAGE.get("OPTIONS", {}))
+
+
+class ExportJob(models.Model):
+    """A background export (jobs.background_exports), polled until its file is ready."""
+    class Status(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        RUNNING = 'Running', 'Running'
+        DONE = 'Done', 'Done'
+        FAILED = 'Failed', 'Failed'
+        EXPIRED = 'Expired', 'Expired'
+
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='export_jobs')
+    kind = models.CharField(max_length=20)
+    export_format = models.CharField(max_length=10)
+    params = models.JSONField(default=dict, blank=True)
+    # owner + kind + format + params; identical requests reuse a finished file
+    params_hash = models.CharField(max_length=64)
+
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    total_rows = models.PositiveIntegerField(null=True, blank=True)
+    processed_rows = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    file = models.FileField(upload_to='exports/', storage=export_storage, null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='export_status_created_idx'),
+            models.Index(fields=['owner', 'params_hash'], name='export_owner_hash_idx'),
+        ]
+        constraints = [
+            # identical requests racing in request_export() queue one export
+            models.UniqueConstraint(
+                fields=['owner', 'params_hash'],
+                condition=Q(status__in=['Pending', 'Running']),
+                name='export_one_active_per_request',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}.{self.export_format} for {self.owner} ({self.status})"
+
+    @property
+    def is_expired(self):
+        # Done exports stay Done until the worker purges them
+        return self.status == self.Status.EXPIRED or (
+            self.status == self.Status.DONE and self.expires_at is not None and self.expires_at <= timezone.now()
+        )
+
+
 class SavedJob(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs', db_index=True)
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='saved_by', db_index=True)
@@ -88,6 +199,9 @@ class Application(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications', db_index=True)
     applied_at = models.DateTimeField(auto_now_add=True, db_index=True)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING, db_index=True)
+    # 0-100 skill fit against the job, maintained by jobs.fit
+    fit_score = models.PositiveSmallIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
@@ -96,7 +210,100 @@ class Application(models.Model):
                 name='unique_job_application'
             )
         ]
+        indexes = [
+            # keyset pagination (jobs.pagination.KeysetPagination)
+            models.Index(fields=['job', 'applied_at', 'id'], name='app_job_applied_id_idx'),
+            models.Index(fields=['applicant', 'applied_at', 'id'], name='app_seeker_applied_id_idx'),
+            models.Index(fields=['job', 'fit_score', 'id'], name='app_job_fit_id_idx'),
+        ]
         ordering = ['-applied_at']
 
     def __str__(self):
         return f"{self.applicant.name} applied for {self.job.title}"
+
+
+class FitScoreTask(models.Model):
+    """
+    A job whose skills / requirements changed and whose applicants' fit scores
+    are stale. Queued by the job save and processed by `manage.py
+    refresh_fit_scores` (see jobs.fit); finished tasks are deleted.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        RUNNING = 'Running', 'Running'
+        FAILED = 'Failed', 'Failed'
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='fit_score_tasks')
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='fit_task_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"Fit scores of job {self.job_id} ({self.status})"
+
+
+class StatusNotification(models.Model):
+    """
+    An application status change the applicant should hear about. Rows are
+    written by the recruiter views and sent in batches by jobs.notifications;
+    sent and superseded rows are deleted, Failed ones after a retention period.
+    """
+    class State(models.TextChoices):
+        PENDING = 'Pending', 'Pending'
+        FAILED = 'Failed', 'Failed'
+
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_notifications')
+    status = models.CharField(max_length=20, choices=Application.Status.choices)
+    state = models.CharField(max_length=10, choices=State.choices, default=State.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    due_at = models.DateTimeField()
+    claim_token = models.UUIDField(null=True, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['state', 'due_at'], name='status_notif_state_due_idx'),
+            models.Index(fields=['claim_token'], name='status_notif_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id} -> {self.status} ({self.state})"
+
+
+class SavedSearch(models.Model):
+    """
+    A stored JobFilter query (same comma-separated syntax as the job list
+    params) that jobs.alerts matches against each day's new jobs.
+    """
+    class Experience(models.TextChoices):
+        ANY = '', 'Any'
+        FRESHER = 'Fresher', 'Fresher'
+        EXPERIENCED = 'Experienced', 'Experienced'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
+    name = models.CharField(max_length=100, blank=True)
+    profile = models.CharField(max_length=255, blank=True)
+    location = models.CharField(max_length=255, blank=True)
+    job_type = models.CharField(max_length=255, blank=True)
+    experience = models.CharField(max_length=20, choices=Experience.choices, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # newest job creation time already covered by an alert
+    last_alerted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='saved_search_user_idx'),
+        ]
+
+    def __str__(self):
+        return self.name or f"Saved search {self.pk}"
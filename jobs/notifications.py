@@ -0,0 +1,226 @@
+"""
+Applicant notifications for application status changes.
+
+Recruiter views call queue_status_notifications() next to the status change;
+`manage.py send_status_notifications` picks up rows that have been due for
+NOTIFY_DELAY, coalesces them per application (only the latest status is
+mailed, and nothing if the application is back to Pending), renders each
+template once per (status, locale) and sends every group with a single
+batch call (Brevo messageVersions, or the console backend locally). Sent and
+superseded rows are deleted; Failed ones are kept for FAILED_RETENTION.
+
+These are not EmailOutbox rows because the outbox sends each message on its
+own and never looks at other rows, while a status change must wait out the
+delay, give way to a newer change of the same application and go out with
+the rest of its group in one provider call. Retries use the outbox's backoff.
+"""
+import logging
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from accounts.email_service import send_batch_email
+from accounts.outbox import backoff
+from jobs.models import Application, StatusNotification
+
+logger = logging.getLogger(__name__)
+
+# changes inside this window collapse into one email
+NOTIFY_DELAY = timedelta(seconds=60)
+MAX_ATTEMPTS = 5
+CLAIM_TIMEOUT = timedelta(minutes=5)
+FAILED_RETENTION = timedelta(days=7)
+
+SUBJECTS = {
+    Application.Status.SHORTLISTED: "JobLane - You've been shortlisted for {{ params.job_title }}",
+    Application.Status.REJECTED: "JobLane - Update on your application for {{ params.job_title }}",
+}
+MESSAGES = {
+    Application.Status.SHORTLISTED: "Good news! {{ params.company }} has shortlisted your application for "
+                                    "{{ params.job_title }}. They may reach out to you soon.",
+    Application.Status.REJECTED: "Thank you for applying to {{ params.job_title }} at {{ params.company }}. "
+                                 "They have decided not to move forward with your application.",
+}
+
+
+def queue_status_notifications(applications):
+    """Record status changes (already saved) of `applications` for the sender."""
+    due_at = timezone.now() + NOTIFY_DELAY
+    return StatusNotification.objects.bulk_create([
+        StatusNotification(application_id=application.pk, status=application.status, due_at=due_at)
+        for application in applications
+    ])
+
+
+@lru_cache(maxsize=None)
+def status_email_template(status, locale):
+    """(subject, text, html) with `{{ params.* }}` placeholders, rendered once per (status, locale)."""
+    # only English copy exists for now; the locale keeps the cache key ready for more
+    subject, message = SUBJECTS[status], MESSAGES[status]
+
+    text_content = f"""
+Hello {{{{ params.name }}}},
+
+{message}
+
+- The JobLane team
+""".strip()
+
+    html_content = f"""
+<html>
+  <body style="margin:0; padding:0; background-color:#f9fafb; font-family: Arial, sans-serif; color:#333;">
+    <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
+      <tr>
+        <td align="center" style="padding:20px 0;">
+          <table width="600" style="max-width:600px; background:#ffffff; border-radius:10px; overflow:hidden;">
+            <tr>
+              <td align="center" style="background:#2563eb; padding:20px;">
+                <h1 style="margin:0; font-size:24px; color:#ffffff;">JobLane</h1>
+              </td>
+            </tr>
+            <tr>
+              <td style="padding:30px;">
+                <h2 style="margin-top:0;">Hello <span style="color:#2563eb;">{{{{ params.name }}}}</span>,</h2>
+                <p style="font-size:16px;">{message}</p>
+              </td>
+            </tr>
+          </table>
+        </td>
+      </tr>
+    </table>
+  </body>
+</html>
+""".strip()
+
+    return subject, text_content, html_content
+
+
+def claim_due_notifications(limit):
+    """Claim up to `limit` due rows with one UPDATE; returns them with application data loaded."""
+    now = timezone.now()
+    due = (
+        StatusNotification.objects
+        .filter(state=StatusNotification.State.PENDING, due_at__lte=now)
+        .filter(Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - CLAIM_TIMEOUT))
+        .order_by('due_at', 'id')
+        .values_list('pk', flat=True)[:limit]
+    )
+    token = uuid.uuid4()
+    # rows another worker claimed in between fail the re-checked filter and stay theirs
+    StatusNotification.objects.filter(pk__in=list(due)).filter(
+        Q(claimed_at__isnull=True) | Q(claimed_at__lt=now - CLAIM_TIMEOUT)
+    ).update(claim_token=token, claimed_at=now)
+
+    return list(
+        StatusNotification.objects
+        .filter(claim_token=token)
+        .select_related('application__applicant__user', 'application__job__company')
+        .order_by('id')
+    )
+
+
+def _coalesce(notifications):
+    """Split claimed rows into (to_send, superseded): the newest row per application wins."""
+    latest = {}
+    for notification in notifications:
+        latest[notification.application_id] = notification  # ordered by id
+
+    # newer rows outside this batch (not due yet, or past the batch limit)
+    outside = (
+        StatusNotification.objects
+        .filter(state=StatusNotification.State.PENDING, application_id__in=list(latest))
+        .exclude(pk__in=[notification.pk for notification in notifications])
+        .values_list('application_id', 'pk')
+    )
+    newer = {application_id for application_id, pk in outside if pk > latest[application_id].pk}
+
+    to_send, superseded = [], []
+    for notification in notifications:
+        application = notification.application
+        if (
+            latest[notification.application_id] is notification
+            and notification.application_id not in newer
+            and notification.status != Application.Status.PENDING
+            and application.status == notification.status
+        ):
+            to_send.append(notification)
+        else:
+            superseded.append(notification)
+    return to_send, superseded
+
+
+def _recipient(notification):
+    application = notification.application
+    return {
+        "email": application.applicant.user.email,
+        "name": application.applicant.name,
+        "params": {
+            "name": application.applicant.name,
+            "job_title": application.job.title,
+            "company": application.job.company.name,
+        },
+    }
+
+
+def send_due_notifications(batch_size=500):
+    """Send one batch of due notifications; returns (sent, skipped, failed)."""
+    notifications = claim_due_notifications(batch_size)
+    if not notifications:
+        return 0, 0, 0
+
+    to_send, superseded = _coalesce(notifications)
+    now = timezone.now()
+    StatusNotification.objects.filter(pk__in=[n.pk for n in superseded]).delete()
+
+    groups = defaultdict(list)
+    for notification in to_send:
+        groups[(notification.status, settings.LANGUAGE_CODE)].append(notification)
+
+    sent, failed = [], []
+    for (status, locale), group in groups.items():
+        subject, text_content, html_content = status_email_template(status, locale)
+        try:
+            results = send_batch_email(
+                subject=subject,
+                text_content=text_content,
+                html_content=html_content,
+                recipients=[_recipient(notification) for notification in group],
+            )
+        except Exception:
+            logger.exception("Sending %s status notifications failed", status)
+            results = [False] * len(group)
+
+        for notification, ok in zip(group, results):
+            (sent if ok else failed).append(notification)
+
+    StatusNotification.objects.filter(pk__in=[n.pk for n in sent]).delete()
+    for notification in failed:
+        notification.attempts += 1
+        notification.claim_token = notification.claimed_at = None
+        notification.last_error = "Provider rejected the batch"
+        if notification.attempts >= MAX_ATTEMPTS:
+            notification.state = StatusNotification.State.FAILED
+        else:
+            notification.due_at = now + backoff(notification.attempts)
+    StatusNotification.objects.bulk_update(
+        failed, ['attempts', 'claim_token', 'claimed_at', 'last_error', 'state', 'due_at']
+    )
+
+    return len(sent), len(superseded), len(failed)
+
+
+def purge_failed_notifications(older_than=FAILED_RETENTION, batch_size=1000):
+    """Delete up to `batch_size` Failed rows whose last attempt was due more than `older_than` ago."""
+    expired = StatusNotification.objects.filter(
+        state=StatusNotification.State.FAILED, due_at__lt=timezone.now() - older_than
+    )
+    pks = list(expired.order_by('due_at').values_list('pk', flat=True)[:batch_size])
+    if not pks:
+        return 0
+    deleted, _ = expired.filter(pk__in=pks).delete()
+    return deleted
@@ -1,6 +1,169 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from functools import reduce
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, OrderBy, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
 
 class StandardPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
+
+    def get_page_state(self):
+        """What besides the rows shapes the response: count and links."""
+        return self.page.paginator.count
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek pagination on the queryset's ordering, e.g. ?cursor=<opaque>.
+
+    The keyset is the ordering the view ends up with (its filter backends
+    included, e.g. ?ordering=deadline or relevance for ?q=), with `id`
+    appended as the tie-breaker; `keyset_ordering` on the view is the
+    fallback for unordered querysets. Each page is a
+    `WHERE (value, id) < (last_value, last_id) ORDER BY value DESC, id DESC LIMIT n`
+    range scan, so there is no OFFSET and no COUNT(*), and deep pages cost the
+    same as the first one.
+    """
+    cursor_query_param = 'cursor'
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    invalid_cursor_message = 'Invalid cursor'
+    invalid_ordering_message = 'This ordering cannot be combined with cursor pagination.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.keyset = self.get_keyset(queryset, view)
+
+        queryset = queryset.order_by(*(f'-{name}' if desc else name for name, desc in self.keyset))
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.seek_filter(position))
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_keyset(self, queryset, view):
+        """[(field, descending), ...] from the active ordering, ending with id."""
+        keyset = []
+        for term in queryset.query.order_by or view.keyset_ordering:
+            if isinstance(term, str):
+                name, desc = term.lstrip('-'), term.startswith('-')
+            elif isinstance(term, OrderBy) and isinstance(term.expression, F):
+                name, desc = term.expression.name, term.descending
+            else:
+                name, desc = '?', False
+            if name == '?':
+                # random order or an expression: nothing to seek on
+                raise ValidationError({self.cursor_query_param: self.invalid_ordering_message})
+            if name == 'pk':
+                name = 'id'
+            keyset.append((name, desc))
+            if name == 'id':
+                # unique: later terms never break a tie
+                return keyset
+        return keyset + [('id', keyset[0][1] if keyset else True)]
+
+    def seek_filter(self, position):
+        """Rows after `position` in keyset order: (a, b) < (x, y) per field direction."""
+        condition = equal = Q()
+        for (name, desc), value in zip(self.keyset, position):
+            condition |= equal & Q(**{f'{name}__{"lt" if desc else "gt"}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            position = json.loads(urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        # the field lookups parse dates, datetimes and decimals back from strings
+        if (
+            not isinstance(position, list) or len(position) != len(self.keyset)
+            or not all(isinstance(value, (str, int, float)) for value in position)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_cursor(self, obj):
+        position = [reduce(getattr, name.split('__'), obj) for name, _ in self.keyset]
+        # full isoformat: DjangoJSONEncoder would cut datetimes to milliseconds
+        payload = json.dumps(position, default=lambda value: value.isoformat() if hasattr(value, 'isoformat') else str(value))
+        return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def get_page_state(self):
+        return self.has_next
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class OptionalKeysetPagination(StandardPagination):
+    """
+    Page numbers by default; a request that carries `?cursor=` (empty for the
+    first page) switches to KeysetPagination on the same ordering.
+    """
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if KeysetPagination.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_page_state(self):
+        if self.keyset is not None:
+            return self.keyset.get_page_state()
+        return super().get_page_state()
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,89 @@
+"""
+Parse the free-text Job.experience and Job.ctc columns into numeric ranges.
+
+experience -> whole years, ctc -> lakhs per annum (LPA). A missing upper bound
+means open-ended ("5+ years"); (None, None) means the text could not be read,
+or gave a value outside what the range columns can hold.
+"""
+import math
+import re
+from decimal import Decimal, ROUND_HALF_UP
+
+NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+OPEN_ENDED_RE = re.compile(r"\+|\babove\b|\bmore\b|\bplus\b|\bminimum\b|\bmin\b")
+
+MONTHLY_RE = re.compile(r"/\s*m(?:onth)?\b|\bper\s+month\b|\bmonthly\b|\bpm\b|\bp\.m\b")
+THOUSANDS_RE = re.compile(r"\d\s*k\b")
+CRORE_RE = re.compile(r"\bcr(?:ore)?s?\b")
+
+LAKH = Decimal(100_000)
+TWO_PLACES = Decimal("0.01")
+# bounds of the range columns: years that make sense, DecimalField(max_digits=7, decimal_places=2)
+MAX_EXPERIENCE_YEARS = 60
+MAX_CTC_LPA = Decimal("99999.99")
+
+
+def _numbers(text):
+    return [Decimal(n) for n in NUMBER_RE.findall(text.replace(",", ""))]
+
+
+def parse_experience(text):
+    text = (text or "").lower().strip()
+    numbers = _numbers(text)
+    is_fresher = "fresher" in text
+
+    if not numbers:
+        return (0, 0) if is_fresher else (None, None)
+
+    if "month" in text and "year" not in text:
+        numbers = [n / 12 for n in numbers]
+
+    low = 0 if is_fresher else math.floor(numbers[0])
+    if low > MAX_EXPERIENCE_YEARS:
+        return None, None
+    if OPEN_ENDED_RE.search(text):
+        return low, None
+
+    high = max(low, math.ceil(numbers[1] if len(numbers) > 1 else numbers[0]))
+    if high > MAX_EXPERIENCE_YEARS:
+        return None, None
+    return low, high
+
+
+def _to_lpa(value, text):
+    if CRORE_RE.search(text):
+        value *= 100
+    elif THOUSANDS_RE.search(text):
+        value = value * 1000 / LAKH
+    elif value >= 1000:
+        # plain rupees
+        value = value / LAKH
+
+    if MONTHLY_RE.search(text):
+        value *= 12
+
+    return value.quantize(TWO_PLACES, rounding=ROUND_HALF_UP)
+
+
+def parse_ctc(text):
+    text = (text or "").lower().strip()
+    numbers = _numbers(text)
+    if not numbers:
+        return None, None
+
+    low = _to_lpa(numbers[0], text)
+    if low > MAX_CTC_LPA:
+        return None, None
+    if OPEN_ENDED_RE.search(text):
+        return low, None
+
+    high = max(low, _to_lpa(numbers[1], text) if len(numbers) > 1 else low)
+    if high > MAX_CTC_LPA:
+        return None, None
+    return low, high
+
+
+def apply_parsed_ranges(job):
+    job.min_experience, job.max_experience = parse_experience(job.experience)
+    job.min_ctc, job.max_ctc = parse_ctc(job.ctc)
+    return job
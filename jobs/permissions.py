@@ -1,22 +1,20 @@
 from rest_framework.permissions import BasePermission
+from accounts.tokens import user_role
 
 class IsJobSeeker(BasePermission):
     def has_permission(self, request, view):
-        user = request.user
+        # token claims when available (accounts.tokens), else the profile row
         return (
             request.user.is_authenticated and
-            hasattr(user, "profile") and
-            request.user.profile.role == 'jobseeker'
+            user_role(request.user) == 'jobseeker'
         )
 
 
 class IsRecruiter(BasePermission):
     def has_permission(self, request, view):
-        user = request.user
         return (
             request.user.is_authenticated and
-            hasattr(user, "profile") and
-            request.user.profile.role == 'recruiter'
+            user_role(request.user) == 'recruiter'
         )
 
 
@@ -24,9 +22,9 @@ class IsJobOwner(BasePermission):
     def has_object_permission(self, request, view, obj):
         # obj can be Job OR Application
         if hasattr(obj, "created_by"):
-            return obj.created_by == request.user
+            return obj.created_by_id == request.user.pk
 
         if hasattr(obj, "job"):
-            return obj.job.created_by == request.user
+            return obj.job.created_by_id == request.user.pk
 
         return False
@@ -0,0 +1,143 @@
+"""
+Skill-based job recommendations for jobseekers.
+
+Profile.skills are looked up in the JobSkill inverted index (skill -> active
+jobs), so only postings that share a skill with the seeker are touched. The
+best CANDIDATE_POOL jobs by overlap are then re-scored in Python on skill
+overlap, location and recency.
+"""
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.timezone import localdate
+
+from jobs.models import Job, JobSkill
+
+MAX_PROFILE_SKILLS = 50
+CANDIDATE_POOL = 300
+DEFAULT_LIMIT = 20
+
+SKILL_WEIGHT = 0.6
+LOCATION_WEIGHT = 0.25
+RECENCY_WEIGHT = 0.15
+RECENCY_HALF_LIFE_DAYS = 14
+
+REMOTE_LOCATIONS = {"remote", "anywhere"}
+
+
+def normalize_skill(value):
+    if not isinstance(value, str):
+        return None
+    value = " ".join(value.lower().split())
+    return value[:100] or None
+
+
+def skill_set(values):
+    if not isinstance(values, list):
+        return set()
+    return {skill for skill in map(normalize_skill, values) if skill}
+
+
+# ===== Index maintenance =====
+def sync_job_skills(job, created=False):
+    """Bring the JobSkill rows of one job in line with Job.skills / deadline."""
+    skills = skill_set(job.skills)
+
+    if not created:
+        index = JobSkill.objects.filter(job=job)
+        index.exclude(skill__in=skills).delete()
+        index.exclude(deadline=job.deadline).update(deadline=job.deadline)
+        skills -= set(index.values_list("skill", flat=True))
+
+    JobSkill.objects.bulk_create(
+        [JobSkill(job=job, skill=skill, deadline=job.deadline) for skill in skills],
+        ignore_conflicts=True,
+    )
+
+
+def rebuild_skill_index(batch_size=1000):
+    """Re-index every job, e.g. after bulk_create (which skips signals)."""
+    last_id = 0
+    indexed = 0
+
+    while True:
+        jobs = list(
+            Job.objects.filter(pk__gt=last_id)
+            .order_by("pk")
+            .only("pk", "skills", "deadline")[:batch_size]
+        )
+        if not jobs:
+            return indexed
+
+        JobSkill.objects.filter(job__in=jobs).delete()
+        JobSkill.objects.bulk_create(
+            [
+                JobSkill(job=job, skill=skill, deadline=job.deadline)
+                for job in jobs
+                for skill in skill_set(job.skills)
+            ],
+            batch_size=batch_size,
+        )
+        indexed += len(jobs)
+        last_id = jobs[-1].pk
+
+
+# ===== Scoring =====
+def candidate_jobs(skills):
+    """Active job ids sharing the most skills with the seeker, newest first on ties."""
+    return list(
+        JobSkill.objects
+        .filter(skill__in=skills, deadline__gte=localdate())
+        .values("job_id")
+        .annotate(matched=Count("id"))
+        .order_by("-matched", "-job_id")
+        .values_list("job_id", flat=True)[:CANDIDATE_POOL]
+    )
+
+
+def location_score(seeker_location, job):
+    if job.location.strip().lower() in REMOTE_LOCATIONS or job.job_type == Job.JobType.REMOTE:
+        return 1.0
+    return 1.0 if seeker_location and seeker_location in job.location.lower() else 0.0
+
+
+def score_job(job, skills, seeker_location, now):
+    job_skills = skill_set(job.skills)
+    matched = skills & job_skills
+    # Dice overlap: rewards covering the job's requirements without
+    # punishing seekers who list many skills
+    overlap = 2 * len(matched) / (len(skills) + len(job_skills)) if matched else 0.0
+
+    age_days = max((now - job.created_at).total_seconds(), 0) / 86400
+    recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+    score = (
+        SKILL_WEIGHT * overlap
+        + LOCATION_WEIGHT * location_score(seeker_location, job)
+        + RECENCY_WEIGHT * recency
+    )
+    return score, sorted(matched)
+
+
+def recommend_jobs(profile, limit=DEFAULT_LIMIT):
+    """
+    Top `limit` active jobs for a jobseeker profile as a list of
+    (job, score, matched_skills). Seekers without skills get the newest jobs
+    ranked by location and recency only.
+    """
+    skills = set(sorted(skill_set(profile.skills))[:MAX_PROFILE_SKILLS])
+    jobs = Job.objects.select_related("company")
+
+    if skills:
+        jobs = jobs.filter(pk__in=candidate_jobs(skills))
+    else:
+        jobs = jobs.filter(deadline__gte=localdate()).order_by("-created_at", "-id")[:CANDIDATE_POOL]
+
+    now = timezone.now()
+    seeker_location = (profile.location or "").strip().lower()
+    ranked = []
+    for job in jobs:
+        score, matched = score_job(job, skills, seeker_location, now)
+        ranked.append((job, round(score, 4), matched))
+
+    ranked.sort(key=lambda item: (-item[1], -item[0].created_at.timestamp(), -item[0].pk))
+    return ranked[:limit]
@@ -0,0 +1,86 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, Q, Value
+
+SEARCH_CONFIG = "english"
+MAX_SEARCH_TERMS = 8
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_postgres():
+    return connection.vendor == "postgresql"
+
+
+def job_search_vector(company_name):
+    """
+    Weighted tsvector for a Job row.
+    Company name is passed as a literal because UPDATE cannot join.
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(company_name or ""), weight="A", config=SEARCH_CONFIG)
+        + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("skills", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="D", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vector(job):
+    if not is_postgres():
+        return
+
+    from jobs.models import Job
+
+    Job.objects.filter(pk=job.pk).update(
+        search_vector=job_search_vector(job.company.name)
+    )
+
+
+def update_company_search_vectors(company):
+    """Re-index every job of a company, e.g. after a rename."""
+    if not is_postgres():
+        return
+
+    company.jobs.update(search_vector=job_search_vector(company.name))
+
+
+def parse_terms(value):
+    terms = TERM_RE.findall((value or "").lower())
+    return terms[:MAX_SEARCH_TERMS]
+
+
+def build_prefix_query(terms):
+    # every term must match, last characters may still be typed -> prefix match
+    raw = " & ".join(f"{term}:*" for term in terms)
+    return SearchQuery(raw, search_type="raw", config=SEARCH_CONFIG)
+
+
+def search_jobs(queryset, value):
+    """
+    Full-text search on Job.search_vector ranked by relevance.
+    Falls back to icontains matching on databases without tsvector (SQLite tests).
+    """
+    terms = parse_terms(value)
+    if not terms:
+        return queryset
+
+    if is_postgres():
+        query = build_prefix_query(terms)
+        return (
+            queryset
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-created_at", "-id")
+        )
+
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term)
+            | Q(company__name__icontains=term)
+            | Q(location__icontains=term)
+            | Q(skills__icontains=term)
+        )
+    return queryset
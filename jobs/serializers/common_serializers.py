@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from jobs.models import Job, Company
+from joblane.media import MEDIA_FIELD_MAPPING, VariantImageField
 
     
 class CompanySerializer(serializers.ModelSerializer):
+    serializer_field_mapping = {**serializers.ModelSerializer.serializer_field_mapping, **MEDIA_FIELD_MAPPING}
+
     class Meta:
         model = Company
         fields = ["id", "name", "logo"]
@@ -10,20 +13,20 @@ class CompanySerializer(serializers.ModelSerializer):
 
 class JobSerializer(serializers.ModelSerializer):
     company_name = serializers.CharField(source="company.name", read_only=True)
-    company_logo = serializers.ImageField(source="company.logo", read_only=True)
-    applicants_count = serializers.IntegerField(read_only=True)
+    company_logo = VariantImageField(source="company.logo", width=256)
+    applicants_count = serializers.IntegerField(source="applicant_count", read_only=True)
     is_saved = serializers.BooleanField(read_only=True)
     has_applied = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = Job
-        fields = '__all__'
+        exclude = ['search_vector', 'applicant_count', 'pending_count', 'shortlisted_count', 'rejected_count']
         read_only_fields = ['id', 'created_by', 'created_at', 'company']
 
 
 class JobBasicSerializer(serializers.ModelSerializer):
     company_name = serializers.CharField(source="company.name", read_only=True)
-    company_logo = serializers.ImageField(source="company.logo", read_only=True)
+    company_logo = VariantImageField(source="company.logo", width=96)
     applicant_count = serializers.IntegerField(read_only=True)
     
     class Meta:
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from jobs.models import Application
+from jobs.models import Application, Job, SavedSearch
 from jobs.serializers.common_serializers import JobBasicSerializer
 
 
@@ -10,3 +10,29 @@ class AppliedJobSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = ['id', 'job', 'status', 'applied_at']
+
+
+class RecommendedJobSerializer(serializers.Serializer):
+    job = JobBasicSerializer(read_only=True)
+    score = serializers.FloatField(read_only=True)
+    matched_skills = serializers.ListField(child=serializers.CharField(), read_only=True)
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = ['id', 'name', 'profile', 'location', 'job_type', 'experience', 'is_active', 'created_at', 'last_alerted_at']
+        read_only_fields = ['created_at', 'last_alerted_at']
+
+    def validate_job_type(self, value):
+        values = [v.strip() for v in value.split(",") if v.strip()]
+        invalid = [v for v in values if v not in Job.JobType.values]
+        if invalid:
+            raise serializers.ValidationError(f"Unknown job type: {', '.join(invalid)}.")
+        return ",".join(values)
+
+    def validate(self, attrs):
+        fields = ('profile', 'location', 'job_type', 'experience')
+        if not any(attrs.get(f, getattr(self.instance, f, "")) for f in fields):
+            raise serializers.ValidationError("Set at least one of profile, location, job_type or experience.")
+        return attrs
@@ -1,11 +1,18 @@
+from django.urls import reverse
 from rest_framework import serializers
-from jobs.models import Application
+from jobs.models import Application, ExportJob
 from accounts.serializers import ProfileSerializer
 from jobs.serializers.common_serializers import JobBasicSerializer
+from joblane.media import VariantImageField
+
+
+class ApplicantSerializer(ProfileSerializer):
+    # applicant lists show avatars
+    profile_pic_thumbnail = VariantImageField(source='profile_pic', width=96)
 
 
 class ApplicationSerializer(serializers.ModelSerializer):
-    applicant = ProfileSerializer(read_only=True)
+    applicant = ApplicantSerializer(read_only=True)
     job = JobBasicSerializer(read_only=True)
 
     class Meta:
@@ -20,6 +27,32 @@ class BasicApplicationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Application
-        fields = ['id', 'applicant_name', 'applicant_email', 'status', 'applied_at']
+        fields = ['id', 'applicant_name', 'applicant_email', 'status', 'applied_at', 'fit_score']
 
 
+class ExportJobSerializer(serializers.ModelSerializer):
+    format = serializers.CharField(source='export_format', read_only=True)
+    progress = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = [
+            'id', 'kind', 'format', 'params', 'status', 'processed_rows', 'total_rows', 'progress',
+            'error', 'created_at', 'finished_at', 'expires_at', 'download_url',
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        if obj.status == ExportJob.Status.DONE:
+            return 100
+        if not obj.total_rows:
+            return 0
+        return min(99, obj.processed_rows * 100 // obj.total_rows)
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJob.Status.DONE or obj.is_expired:
+            return None
+        url = reverse('export-job-download', args=[obj.pk])
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
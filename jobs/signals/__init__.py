@@ -0,0 +1,8 @@
+"""
+Model signal receivers of the jobs app, one module per concern. Importing
+the package (JobsConfig.ready) connects them all.
+
+Receivers that act on a changed field compare against joblane.changes, which
+reads the stored row once per save for all of them.
+"""
+from jobs.signals import caches, counters, fit, images, search  # noqa: F401
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.image_variants import variants_recorded
+from jobs.cache import JOB_LIST_NAMESPACE, bump_generation_on_commit
+from jobs.facets import FILTER_OPTIONS_NAMESPACE
+from jobs.models import Application, Company, Job
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_caches(sender, **kwargs):
+    bump_generation_on_commit(FILTER_OPTIONS_NAMESPACE, JOB_LIST_NAMESPACE)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+@receiver(variants_recorded, sender=Company)
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_job_list_cache(sender, **kwargs):
+    # company name/logo and applicant_count are part of the list output
+    bump_generation_on_commit(JOB_LIST_NAMESPACE)
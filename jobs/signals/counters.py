@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from jobs.counters import application_created, application_deleted
+from jobs.models import Application
+
+
+@receiver(post_save, sender=Application)
+def count_new_application(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        application_created(instance)
+
+
+@receiver(post_delete, sender=Application)
+def uncount_deleted_application(sender, instance, **kwargs):
+    # also fires for rows removed by cascades (profile / user deletion)
+    application_deleted(instance)
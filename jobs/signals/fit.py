@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import Profile
+from jobs.fit import queue_job_fit_refresh, refresh_profile_fit_scores, score_application
+from jobs.models import Application, Job
+from joblane.changes import changed, track_changes
+
+JOB_FIT_FIELDS = ("skills", "requirements")
+PROFILE_FIT_FIELDS = ("skills",)
+
+track_changes(Job, *JOB_FIT_FIELDS)
+track_changes(Profile, *PROFILE_FIT_FIELDS)
+
+
+@receiver(pre_save, sender=Application)
+def score_new_application(sender, instance, raw=False, **kwargs):
+    if instance._state.adding and not raw:
+        score_application(instance)
+
+
+@receiver(post_save, sender=Job)
+def rescore_job_applicants(sender, instance, raw=False, **kwargs):
+    if not raw and changed(instance, *JOB_FIT_FIELDS):
+        queue_job_fit_refresh(instance)
+
+
+@receiver(post_save, sender=Profile)
+def rescore_profile_applications(sender, instance, raw=False, **kwargs):
+    if not raw and changed(instance, *PROFILE_FIT_FIELDS):
+        refresh_profile_fit_scores(instance)
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.image_variants import queue_uploads, track_uploads
+from jobs.models import Company
+
+
+@receiver(pre_save, sender=Company)
+def track_logo_upload(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:
+        track_uploads(instance, ["logo"], update_fields)
+
+
+@receiver(post_save, sender=Company)
+def queue_logo_variants(sender, instance, raw=False, **kwargs):
+    if not raw:
+        queue_uploads(instance)
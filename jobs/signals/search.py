@@ -0,0 +1,39 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from jobs.models import Company, Job
+from jobs.parsing import apply_parsed_ranges
+from jobs.recommendations import sync_job_skills
+from jobs.search import update_company_search_vectors, update_search_vector
+from joblane.changes import changed, track_changes
+
+# what job_search_vector reads from the row (the company name is handled below)
+SEARCH_VECTOR_FIELDS = ("title", "location", "skills", "description", "company_id")
+SKILL_INDEX_FIELDS = ("skills", "deadline")
+
+track_changes(Job, *SEARCH_VECTOR_FIELDS, *SKILL_INDEX_FIELDS)
+track_changes(Company, "name")
+
+
+@receiver(pre_save, sender=Job)
+def parse_job_ranges(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    apply_parsed_ranges(instance)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_indexes(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created or changed(instance, *SEARCH_VECTOR_FIELDS):
+        update_search_vector(instance)
+    if created or changed(instance, *SKILL_INDEX_FIELDS):
+        sync_job_skills(instance, created=created)
+
+
+@receiver(post_save, sender=Company)
+def refresh_company_search_vectors(sender, instance, created, raw=False, **kwargs):
+    if created or raw or not changed(instance, "name"):
+        return
+    update_company_search_vectors(instance)
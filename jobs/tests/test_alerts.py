@@ -0,0 +1,138 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+
+from accounts.email_service import send_batch_email
+from accounts.models import EmailOutbox
+from jobs.alerts import send_job_alerts
+from jobs.models import Job, SavedSearch
+from jobs.tests.utils import create_recruiter_with_company, create_user
+
+
+@override_settings(EMAIL_PROVIDER="console")
+class JobAlertTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.seeker = create_user("seeker@test.com", "jobseeker")
+        self.other = create_user("other@test.com", "jobseeker")
+        # searches exist before today's jobs
+        yesterday = timezone.now() - timedelta(hours=12)
+        self.search = SavedSearch.objects.create(user=self.seeker, profile="python, django", location="pune")
+        self.fresher_search = SavedSearch.objects.create(user=self.other, job_type="Internship", experience="Fresher")
+        SavedSearch.objects.update(created_at=yesterday)
+
+    def create_job(self, title, location="Pune", job_type="Full-time", experience="2 years", deadline=None):
+        return Job.objects.create(
+            title=title,
+            company=self.recruiter.company,
+            location=location,
+            ctc="12 LPA",
+            experience=experience,
+            deadline=deadline or localdate() + timedelta(days=10),
+            job_type=job_type,
+            description="Test",
+            created_by=self.recruiter,
+        )
+
+    def test_digest_per_user_with_filter_semantics(self):
+        self.create_job("Senior Python Developer")
+        self.create_job("Django Engineer", location="Pune, Remote")
+        self.create_job("Python Developer", location="Mumbai")
+        self.create_job("React Developer")
+        self.create_job("Python Intern", location="Delhi", job_type="Internship", experience="Fresher")
+        self.create_job("Data Intern", job_type="Internship", experience="1 years")
+
+        with patch("jobs.alerts.send_batch_email", wraps=send_batch_email) as batch:
+            self.assertEqual(send_job_alerts(), (2, 6, 2))
+
+        batch.assert_called_once()
+        self.assertFalse(EmailOutbox.objects.exists())
+        digests = {m.to[0]: m for m in mail.outbox}
+        self.assertIn("2 new jobs", digests["seeker@test.com"].subject)
+        self.assertIn("Senior Python Developer", digests["seeker@test.com"].body)
+        self.assertIn("Django Engineer", digests["seeker@test.com"].body)
+        self.assertNotIn("Mumbai", digests["seeker@test.com"].body)
+        self.assertIn("1 new job ", digests["other@test.com"].subject)
+        self.assertIn("Python Intern", digests["other@test.com"].body)
+
+    def test_rerun_does_not_repeat_alerts(self):
+        self.create_job("Python Developer")
+        send_job_alerts()
+        self.assertEqual(send_job_alerts()[2], 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_missed_runs_are_caught_up(self):
+        SavedSearch.objects.update(created_at=timezone.now() - timedelta(days=5))
+        job = self.create_job("Python Developer")
+        Job.objects.filter(pk=job.pk).update(created_at=timezone.now() - timedelta(days=3))
+        self.assertEqual(send_job_alerts()[2], 1)
+
+        SavedSearch.objects.update(last_alerted_at=None)
+        self.assertEqual(send_job_alerts(max_lookback=timedelta(days=2))[2], 0)
+
+    @patch("jobs.alerts.send_batch_email")
+    def test_rejected_digests_go_to_the_outbox(self, batch):
+        batch.side_effect = lambda recipients, **kwargs: [r["email"] != "seeker@test.com" for r in recipients]
+        self.create_job("Python Developer")
+        self.create_job("Python Intern", job_type="Internship", experience="Fresher")
+
+        self.assertEqual(send_job_alerts()[2], 2)
+
+        retry = EmailOutbox.objects.get()
+        self.assertEqual(retry.to_email, "seeker@test.com")
+        self.assertIn("2 new jobs", retry.subject)
+        self.assertIn("Python Developer", retry.html_content)
+        self.assertEqual(send_job_alerts()[2], 0)
+
+    def test_jobs_older_than_search_or_expired_are_ignored(self):
+        self.create_job("Python Developer", deadline=localdate() - timedelta(days=1))
+        SavedSearch.objects.update(created_at=timezone.now() + timedelta(minutes=1))
+        self.create_job("Python Developer")
+
+        self.assertEqual(send_job_alerts()[2], 0)
+
+    def test_inactive_searches_are_skipped(self):
+        SavedSearch.objects.update(is_active=False)
+        self.create_job("Python Developer")
+        self.assertEqual(send_job_alerts(), (0, 0, 0))
+
+    def test_command_runs(self):
+        self.create_job("Python Developer")
+        out = StringIO()
+        call_command("send_job_alerts", stdout=out)
+        self.assertIn("sent 1 digests", out.getvalue())
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class SavedSearchAPITest(APITestCase):
+
+    def setUp(self):
+        self.seeker = create_user("seeker@test.com", "jobseeker")
+        self.client.force_authenticate(self.seeker)
+
+    def test_create_and_list_own_searches(self):
+        url = reverse("saved-searches-list")
+        response = self.client.post(url, {"profile": "python", "job_type": "Full-time, Remote"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["job_type"], "Full-time,Remote")
+
+        SavedSearch.objects.create(user=create_user("x@test.com", "jobseeker"), profile="java")
+        response = self.client.get(url)
+        self.assertEqual([s["profile"] for s in response.data["results"]], ["python"])
+
+    def test_rejects_empty_or_invalid_search(self):
+        url = reverse("saved-searches-list")
+        self.assertEqual(self.client.post(url, {"name": "all"}, format="json").status_code, 400)
+        self.assertEqual(self.client.post(url, {"job_type": "Contract"}, format="json").status_code, 400)
+
+    def test_recruiters_cannot_save_searches(self):
+        self.client.force_authenticate(create_recruiter_with_company())
+        self.assertEqual(self.client.get(reverse("saved-searches-list")).status_code, 403)
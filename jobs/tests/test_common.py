@@ -1,12 +1,20 @@
 from rest_framework.test import APITestCase
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils.timezone import localdate, timedelta
+from django.db.models.functions import Length
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 from jobs.models import Job
+from jobs.pagination import KeysetPagination
+from jobs.views.common_views import JobListAPIView
 from jobs.tests.utils import create_recruiter_with_company
 
 class JobCommonViewsTest(APITestCase):
 
     def setUp(self):
+        cache.clear()
         self.recruiter = create_recruiter_with_company()
         self.job = Job.objects.create(
             title="Backend Engineer",
@@ -27,6 +35,171 @@ class JobCommonViewsTest(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 1)
 
+    def test_job_list_search_query(self):
+        Job.objects.create(
+            title="Frontend Developer",
+            company=self.recruiter.company,
+            location="Pune",
+            ctc="6 LPA",
+            experience="0-1 years",
+            deadline=localdate() + timedelta(days=5),
+            job_type="Internship",
+            description="React work",
+            skills=["react", "css"],
+            created_by=self.recruiter
+        )
+        url = reverse("job-list")
+
+        response = self.client.get(url, {"q": "backend eng"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([j["id"] for j in response.data["results"]], [self.job.id])
+
+        response = self.client.get(url, {"q": "react"})
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["title"], "Frontend Developer")
+
+    def test_job_list_search_composes_with_filters(self):
+        url = reverse("job-list")
+
+        response = self.client.get(url, {"q": "backend", "job_type": "Internship"})
+        self.assertEqual(response.data["count"], 0)
+
+        response = self.client.get(url, {"q": "backend", "job_type": "Full-time"})
+        self.assertEqual(response.data["count"], 1)
+
+    def test_job_list_cursor_pagination(self):
+        for i in range(4):
+            Job.objects.create(
+                title=f"Engineer {i}",
+                company=self.recruiter.company,
+                location="Remote",
+                ctc="10 LPA",
+                experience="1-3 years",
+                deadline=localdate() + timedelta(days=5),
+                job_type="Full-time",
+                description="Test job",
+                created_by=self.recruiter
+            )
+        expected = list(Job.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        seen = []
+        response = self.client.get(reverse("job-list"), {"cursor": "", "page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            seen += [j["id"] for j in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(seen, expected)
+
+    def test_job_list_invalid_cursor(self):
+        response = self.client.get(reverse("job-list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_rejects_unseekable_ordering(self):
+        request = Request(APIRequestFactory().get("/", {"cursor": ""}))
+        with self.assertRaises(ValidationError):
+            KeysetPagination().paginate_queryset(Job.objects.order_by("?"), request, JobListAPIView())
+        with self.assertRaises(ValidationError):
+            KeysetPagination().paginate_queryset(Job.objects.order_by(Length("title")), request, JobListAPIView())
+
+    def test_job_list_facets_follow_filters(self):
+        for title, location, job_type, experience in [
+            ("Intern Developer", "Remote", "Internship", "Fresher"),
+            ("Data Analyst", "Pune", "Full-time", "0-1 years"),
+        ]:
+            Job.objects.create(
+                title=title,
+                company=self.recruiter.company,
+                location=location,
+                ctc="5 LPA",
+                experience=experience,
+                deadline=localdate() + timedelta(days=5),
+                job_type=job_type,
+                description="Test job",
+                created_by=self.recruiter
+            )
+
+        response = self.client.get(reverse("job-list"), {
+            "facets": "job_type,experience,location",
+            "location": "remote",
+        })
+
+        self.assertEqual(response.status_code, 200)
+        facets = response.data["facets"]
+        self.assertEqual(response.data["count"], 2)
+        job_types = {f["value"]: f["count"] for f in facets["job_type"]}
+        self.assertEqual(job_types["Full-time"], 1)
+        self.assertEqual(job_types["Internship"], 1)
+        self.assertEqual(job_types["Hybrid"], 0)
+        self.assertEqual(facets["experience"], [
+            {"value": "Fresher", "count": 1},
+            {"value": "Experienced", "count": 1},
+        ])
+        self.assertEqual(facets["location"], [{"value": "Remote", "count": 2}])
+
+    def test_job_list_unknown_facet(self):
+        response = self.client.get(reverse("job-list"), {"facets": "salary"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_job_list_anonymous_response_cache(self):
+        url = reverse("job-list")
+
+        first = self.client.get(url, {"location": "Remote,Pune", "job_type": "Full-time"})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        # same query, different order and case -> same cache entry
+        with self.assertNumQueries(0):
+            second = self.client.get(url, {"job_type": "Full-time", "location": "pune,remote"})
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data["count"], first.data["count"])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.job.title = "Staff Engineer"
+            self.job.save()
+            # not committed yet: a page read now must not outlive the commit
+            self.assertEqual(self.client.get(url, {"location": "Remote,Pune", "job_type": "Full-time"})["X-Cache"], "HIT")
+        for callback in callbacks:
+            callback()
+
+        third = self.client.get(url, {"location": "Remote,Pune", "job_type": "Full-time"})
+        self.assertEqual(third["X-Cache"], "MISS")
+        self.assertEqual(third.data["results"][0]["title"], "Staff Engineer")
+
+    def test_job_list_conditional_get(self):
+        url = reverse("job-list")
+        etag = self.client.get(url)["ETag"]
+
+        # served from the response cache, still answers If-None-Match
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.title = "Platform Engineer"
+            self.job.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_job_list_not_cached_for_authenticated_users(self):
+        self.client.force_authenticate(self.recruiter)
+        response = self.client.get(reverse("job-list"))
+        self.assertNotIn("X-Cache", response)
+
+    def test_job_list_cache_stats_admin_only(self):
+        self.client.get(reverse("job-list"))
+        self.client.get(reverse("job-list"))
+
+        url = reverse("job-list-cache-stats")
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.recruiter.is_staff = True
+        self.recruiter.save()
+        response = self.client.get(url)
+        self.assertEqual((response.data["hits"], response.data["misses"]), (1, 1))
+
     def test_job_detail_requires_auth(self):
         url = reverse("job-detail", args=[self.job.id])
         response = self.client.get(url)
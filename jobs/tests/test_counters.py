@@ -0,0 +1,106 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+from jobs.models import Job, Application
+from jobs.tests.utils import create_user, create_recruiter_with_company
+
+
+class ApplicantCounterTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.jobseeker = create_user("seeker@test.com", "jobseeker")
+
+        self.job = Job.objects.create(
+            title="Python Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            ctc="12 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+
+    def assertCounts(self, applicants, pending, shortlisted, rejected):
+        self.job.refresh_from_db()
+        self.assertEqual(
+            (self.job.applicant_count, self.job.pending_count, self.job.shortlisted_count, self.job.rejected_count),
+            (applicants, pending, shortlisted, rejected),
+        )
+
+    def test_apply_increments_counters(self):
+        self.jobseeker.profile.resume = "dummy_resume.pdf"
+        self.jobseeker.profile.save()
+        self.client.force_authenticate(self.jobseeker)
+        self.client.post(reverse("apply-job", args=[self.job.id]))
+        self.client.post(reverse("apply-job", args=[self.job.id]))
+
+        self.assertCounts(1, 1, 0, 0)
+
+        response = self.client.get(reverse("job-list"))
+        self.assertEqual(response.data["results"][0]["applicant_count"], 1)
+
+    def test_status_change_moves_counters(self):
+        application = Application.objects.create(applicant=self.jobseeker.profile, job=self.job)
+        self.client.force_authenticate(self.recruiter)
+        url = reverse("application-status", args=[application.id])
+
+        self.client.patch(url, {"status": "Shortlisted"}, format="json")
+        self.assertCounts(1, 0, 1, 0)
+
+        self.client.patch(url, {"status": "Shortlisted"}, format="json")
+        self.assertCounts(1, 0, 1, 0)
+
+        self.client.patch(url, {"status": "Rejected"}, format="json")
+        self.assertCounts(1, 0, 0, 1)
+
+    def test_bulk_status_change_moves_counters(self):
+        other_job = Job.objects.create(
+            title="Go Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+        applications = [
+            Application.objects.create(applicant=create_user(f"seeker{i}@test.com", "jobseeker").profile, job=job, status=status)
+            for i, (job, status) in enumerate([
+                (self.job, "Pending"), (self.job, "Shortlisted"), (self.job, "Rejected"), (other_job, "Pending"),
+            ])
+        ]
+        self.client.force_authenticate(self.recruiter)
+
+        response = self.client.post(
+            reverse("bulk-application-status"),
+            {"ids": [application.id for application in applications], "status": "Rejected"},
+            format="json",
+        )
+
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertCounts(3, 0, 0, 3)
+        other_job.refresh_from_db()
+        self.assertEqual((other_job.pending_count, other_job.rejected_count), (0, 1))
+        self.assertEqual(Application.objects.filter(status="Rejected").count(), 4)
+
+    def test_cascade_delete_decrements_counters(self):
+        Application.objects.create(applicant=self.jobseeker.profile, job=self.job)
+        self.assertCounts(1, 1, 0, 0)
+
+        self.jobseeker.delete()
+        self.assertCounts(0, 0, 0, 0)
+
+    def test_reconcile_repairs_drift(self):
+        Application.objects.create(applicant=self.jobseeker.profile, job=self.job)
+        Job.objects.filter(pk=self.job.pk).update(applicant_count=7, pending_count=0, rejected_count=3)
+
+        out = StringIO()
+        call_command("reconcile_applicant_counts", batch_size=1, stdout=out)
+        self.assertIn("Checked 1 jobs, fixed 1.", out.getvalue())
+        self.assertCounts(1, 1, 0, 0)
@@ -0,0 +1,266 @@
+import csv
+import gzip
+import io
+import json
+
+import openpyxl
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+from jobs.background_exports import Heartbeat, export_queue, params_hash, request_export, run_export
+from jobs.models import Job, Application, ExportJob
+from jobs.tests.utils import create_user, create_recruiter_with_company
+
+
+class ExportApplicantsTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.job = Job.objects.create(
+            title="Python Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            ctc="12 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+        for i in range(3):
+            seeker = create_user(f"seeker{i}@test.com", "jobseeker")
+            seeker.profile.name = f"Seeker <{i}> & Co"
+            seeker.profile.save()
+            Application.objects.create(
+                applicant=seeker.profile,
+                job=self.job,
+                status="Shortlisted" if i == 0 else "Pending",
+            )
+        self.url = reverse("export-applicants")
+        self.client.force_authenticate(self.recruiter)
+
+    def read_sheet(self, response, sheet="Applicants"):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        workbook = openpyxl.load_workbook(io.BytesIO(b"".join(response.streaming_content)))
+        return [[cell.value for cell in row] for row in workbook[sheet].iter_rows()]
+
+    def test_streams_xlsx(self):
+        with self.assertNumQueries(1):
+            rows = self.read_sheet(self.client.get(self.url, {"job_id": self.job.id}))
+
+        self.assertEqual(rows[0], ["Applicant Name", "Email", "Phone", "Job Title", "Status", "Applied On"])
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            sorted(row[0] for row in rows[1:]),
+            ["Seeker <0> & Co", "Seeker <1> & Co", "Seeker <2> & Co"],
+        )
+
+    def test_status_filter(self):
+        rows = self.read_sheet(self.client.get(self.url, {"status": "Shortlisted"}))
+        self.assertEqual([row[1] for row in rows[1:]], ["seeker0@test.com"])
+
+    def test_only_own_jobs(self):
+        other = create_user("other@test.com", "recruiter")
+        self.client.force_authenticate(other)
+        rows = self.read_sheet(self.client.get(self.url, {"job_id": self.job.id}))
+        self.assertEqual(len(rows), 1)
+
+        self.client.force_authenticate(create_user("nosy@test.com", "jobseeker"))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_csv(self):
+        response = self.client.get(self.url, {"format": "csv", "status": "Shortlisted"})
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="applicants.csv"')
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(rows[0][:3], ["id", "applicant_name", "applicant_email"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][2], "seeker0@test.com")
+
+    def test_ndjson_gzip(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"format": "ndjson"}, HTTP_ACCEPT_ENCODING="gzip, br")
+            body = gzip.decompress(b"".join(response.streaming_content))
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]["job_title"], "Python Dev")
+        self.assertIn("T", records[0]["applied_at"])
+
+    def test_unknown_format(self):
+        response = self.client.get(self.url, {"format": "pdf"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("format", response.json())
+
+    def test_recruiter_jobs_export(self):
+        other = create_user("other@test.com", "recruiter")
+        Job.objects.create(
+            title="Not mine", company=self.recruiter.company, location="Pune", ctc="1 LPA",
+            experience="1 year", deadline=localdate(), job_type="Full-time",
+            description="Test", created_by=other,
+        )
+        url = reverse("recruiter-jobs-export")
+
+        response = self.client.get(url, {"format": "ndjson"})
+        records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([(r["title"], r["applicant_count"], r["min_ctc"]) for r in records], [("Python Dev", 3, "12.00")])
+
+        rows = self.read_sheet(self.client.get(url), sheet="Jobs")
+        self.assertEqual(rows[0][0], "Title")
+        self.assertEqual(rows[1][0], "Python Dev")
+
+
+class BackgroundExportTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.job = Job.objects.create(
+            title="Python Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            ctc="12 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+        for i in range(3):
+            seeker = create_user(f"seeker{i}@test.com", "jobseeker")
+            Application.objects.create(applicant=seeker.profile, job=self.job)
+        self.url = reverse("export-jobs")
+        self.client.force_authenticate(self.recruiter)
+
+    def tearDown(self):
+        for export_job in ExportJob.objects.exclude(file=""):
+            export_job.file.delete(save=False)
+
+    def run_worker(self):
+        out = io.StringIO()
+        call_command("run_export_worker", once=True, stdout=out)
+        return out.getvalue()
+
+    def test_queue_run_and_download(self):
+        response = self.client.post(self.url, {"kind": "applicants", "format": "csv", "job_id": self.job.id})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "Pending")
+        self.assertEqual(response.data["params"], {"job_id": str(self.job.id)})
+        detail_url = reverse("export-job-detail", args=[response.data["id"]])
+        download_url = reverse("export-job-download", args=[response.data["id"]])
+
+        self.assertEqual(self.client.get(download_url).status_code, 409)
+
+        self.assertIn(f"Export {response.data['id']}: Done (3 rows)", self.run_worker())
+
+        response = self.client.get(detail_url)
+        self.assertEqual(response.data["status"], "Done")
+        self.assertEqual((response.data["processed_rows"], response.data["total_rows"]), (3, 3))
+        self.assertEqual(response.data["progress"], 100)
+        self.assertTrue(response.data["download_url"].endswith(download_url))
+
+        response = self.client.get(download_url)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="applicants.csv"')
+        rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 4)
+
+    def test_identical_requests_reuse_export(self):
+        payload = {"kind": "jobs", "format": "ndjson", "search": "python"}
+        first = self.client.post(self.url, payload).data["id"]
+
+        response = self.client.post(self.url, payload)
+        self.assertEqual((response.status_code, response.data["id"]), (200, first))
+
+        self.run_worker()
+        response = self.client.post(self.url, payload)
+        self.assertEqual((response.status_code, response.data["id"], response.data["status"]), (200, first, "Done"))
+
+        response = self.client.post(self.url, {**payload, "format": "csv"})
+        self.assertEqual(response.status_code, 202)
+
+    def test_expired_exports_are_purged(self):
+        export_id = self.client.post(self.url, {"kind": "jobs"}).data["id"]
+        self.run_worker()
+        export_job = ExportJob.objects.get(pk=export_id)
+        storage, name = export_job.file.storage, export_job.file.name
+        self.assertTrue(storage.exists(name))
+
+        ExportJob.objects.filter(pk=export_id).update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.run_worker()
+
+        self.assertFalse(storage.exists(name))
+        self.assertEqual(self.client.get(reverse("export-job-download", args=[export_id])).status_code, 410)
+        self.assertEqual(self.client.post(self.url, {"kind": "jobs"}).status_code, 202)
+
+    def test_export_past_ttl_is_not_served_before_the_purge(self):
+        export_id = self.client.post(self.url, {"kind": "jobs"}).data["id"]
+        self.run_worker()
+        ExportJob.objects.filter(pk=export_id).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(ExportJob.objects.get(pk=export_id).status, ExportJob.Status.DONE)
+        self.assertEqual(self.client.get(reverse("export-job-download", args=[export_id])).status_code, 410)
+        self.assertIsNone(self.client.get(reverse("export-job-detail", args=[export_id])).data["download_url"])
+
+    def test_one_active_export_per_request(self):
+        export_job, created = request_export(self.recruiter, "jobs", "csv", {})
+        self.assertTrue(created)
+        # what a concurrent request that missed the lookup would insert
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ExportJob.objects.create(
+                owner=self.recruiter, kind="jobs", export_format="csv", params={},
+                params_hash=params_hash(self.recruiter, "jobs", "csv", {}),
+            )
+        self.assertEqual(request_export(self.recruiter, "jobs", "csv", {}), (export_job, False))
+
+    def test_stale_after_must_allow_missed_heartbeats(self):
+        with self.assertRaisesMessage(CommandError, "--stale-after"):
+            call_command("run_export_worker", once=True, stale_after=30, stdout=io.StringIO())
+
+    def test_stale_running_export_is_requeued(self):
+        export_job, _ = request_export(self.recruiter, "jobs", "xlsx", {})
+        self.assertEqual(export_queue.claim_next(), export_job)
+        self.assertIsNone(export_queue.claim_next())
+
+        ExportJob.objects.filter(pk=export_job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+        self.run_worker()
+
+        export_job.refresh_from_db()
+        self.assertEqual(export_job.status, ExportJob.Status.DONE)
+
+    def test_requeued_run_does_not_overwrite_its_replacement(self):
+        export_job, _ = request_export(self.recruiter, "jobs", "csv", {})
+        stale = export_queue.claim_next()
+        self.assertEqual(Heartbeat(stale).beat(), 1)
+
+        # the first worker looks dead and another one takes the export over
+        ExportJob.objects.filter(pk=export_job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+        export_queue.requeue_stale()
+        current = export_queue.claim_next()
+        self.assertEqual(Heartbeat(stale).beat(), 0)
+
+        with self.assertLogs("jobs.background_exports", "WARNING"):
+            run_export(stale)
+        export_job.refresh_from_db()
+        self.assertEqual((export_job.status, export_job.started_at), (ExportJob.Status.RUNNING, current.started_at))
+        self.assertFalse(export_job.file)
+
+        run_export(current)
+        export_job.refresh_from_db()
+        self.assertEqual((export_job.status, export_job.processed_rows), (ExportJob.Status.DONE, 1))
+        # the discarded run's file is gone
+        self.assertEqual(export_job.file.storage.listdir("exports")[1], [export_job.file.name.split("/")[-1]])
+
+    def test_validation_and_ownership(self):
+        self.assertEqual(self.client.post(self.url, {"kind": "users"}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {"kind": "jobs", "format": "pdf"}).status_code, 400)
+        self.assertEqual(self.client.post(self.url, {"kind": "applicants", "job_id": "x"}).status_code, 400)
+
+        export_id = self.client.post(self.url, {"kind": "jobs"}).data["id"]
+        self.client.force_authenticate(create_user("other@test.com", "recruiter"))
+        self.assertEqual(self.client.get(reverse("export-job-detail", args=[export_id])).status_code, 404)
@@ -0,0 +1,122 @@
+from unittest import skipUnless
+
+from django.db import connection, transaction
+from django.test import TestCase
+from django.utils.timezone import localdate, timedelta
+from jobs.filters import JobFilter
+from jobs.models import Job
+from jobs.tests.utils import create_recruiter_with_company
+
+
+def make_job(recruiter, title, location, experience="1-3 years", ctc="10 LPA", description="Test job"):
+    return Job.objects.create(
+        title=title,
+        company=recruiter.company,
+        location=location,
+        ctc=ctc,
+        experience=experience,
+        deadline=localdate() + timedelta(days=5),
+        job_type="Full-time",
+        description=description,
+        created_by=recruiter
+    )
+
+
+class JobFilterTest(TestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.python_pune = make_job(self.recruiter, "Python Developer", "Pune")
+        self.react_blr = make_job(self.recruiter, "React Engineer", "Bangalore")
+        self.java_delhi = make_job(self.recruiter, "Java Developer", "Delhi")
+
+    def filter(self, params):
+        return set(JobFilter(params, queryset=Job.objects.all()).qs.values_list("id", flat=True))
+
+    def test_multi_value_profile_and_location(self):
+        result = self.filter({
+            "profile": "python, django ,react",
+            "location": "pune,BANGALORE",
+        })
+        self.assertEqual(result, {self.python_pune.id, self.react_blr.id})
+
+    def test_blank_values_are_ignored(self):
+        self.assertEqual(len(self.filter({"profile": " , ,"})), 3)
+
+    def test_experience_buckets_use_parsed_columns(self):
+        fresher = make_job(self.recruiter, "Trainee", "Pune", experience="0-1 years")
+        open_fresher = make_job(self.recruiter, "Intern", "Pune", experience="Fresher")
+
+        self.assertEqual(self.filter({"experience": "Fresher"}), {fresher.id, open_fresher.id})
+        self.assertNotIn(fresher.id, self.filter({"experience": "Experienced"}))
+        self.assertIn(self.java_delhi.id, self.filter({"experience": "Experienced"}))
+
+    def test_experience_and_ctc_ranges(self):
+        senior = make_job(self.recruiter, "Lead", "Pune", experience="5+ years", ctc="25-30 LPA")
+        junior = make_job(self.recruiter, "Junior", "Pune", experience="0-2 years", ctc="25,000/month")
+
+        self.assertEqual(self.filter({"min_exp": 6}), {senior.id})
+        self.assertEqual(self.filter({"max_exp": 0}), {junior.id})
+        self.assertEqual(self.filter({"min_exp": 2, "max_exp": 2}) - {senior.id}, {
+            junior.id, self.python_pune.id, self.react_blr.id, self.java_delhi.id,
+        })
+        self.assertEqual(self.filter({"min_ctc": 20}), {senior.id})
+        self.assertNotIn(junior.id, self.filter({"min_ctc": 4}))
+
+    @skipUnless(connection.vendor == "postgresql", "pg_trgm indexes are Postgres only")
+    def test_trigram_index_serves_multi_value_filters(self):
+        cases = [
+            ({"profile": "python,django,react"}, "jobs_job_title_trgm"),
+            ({"location": "pune,bangalore"}, "jobs_job_location_trgm"),
+        ]
+        for params, index_name in cases:
+            qs = JobFilter(params, queryset=Job.objects.all()).qs
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                # tiny test table: stop the planner from preferring a seq scan
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = qs.explain()
+
+            self.assertIn(index_name, plan)
+            self.assertIn("BitmapOr", plan)
+
+
+@skipUnless(connection.vendor == "postgresql", "tsvector search is Postgres only")
+class JobFullTextSearchTest(TestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.title_match = make_job(self.recruiter, "Senior Python Developer", "Pune")
+        self.description_match = make_job(
+            self.recruiter, "Backend Engineer", "Delhi", description="Services written in Python and Go"
+        )
+        self.other = make_job(self.recruiter, "Java Developer", "Bangalore")
+
+    def search(self, value):
+        return list(JobFilter({"q": value}, queryset=Job.objects.all()).qs.values_list("id", flat=True))
+
+    def test_title_matches_rank_above_description_matches(self):
+        self.assertEqual(self.search("python"), [self.title_match.id, self.description_match.id])
+
+    def test_every_term_matches_as_a_prefix(self):
+        self.assertEqual(self.search("pyth devel"), [self.title_match.id])
+        self.assertEqual(set(self.search("deve")), {self.title_match.id, self.other.id})
+
+    def test_tsquery_syntax_in_input_is_ignored(self):
+        for value in ("python & | !", "(python):*", "python's <-> 'dev'", "c++ / node.js", "the python"):
+            with self.subTest(value=value):
+                # never a tsquery syntax error; operators are dropped, words kept
+                self.search(value)
+        self.assertEqual(self.search("!python &"), [self.title_match.id, self.description_match.id])
+        # nothing left to search for: no filter at all
+        self.assertEqual(len(self.search("&|!:*")), 3)
+
+    def test_vector_follows_job_and_company_edits(self):
+        self.other.title = "Kotlin Developer"
+        self.other.save()
+        self.assertEqual(self.search("kotlin"), [self.other.id])
+
+        company = self.recruiter.company
+        company.name = "Zephyrsoft"
+        company.save()
+        self.assertEqual(len(self.search("zephyr")), 3)
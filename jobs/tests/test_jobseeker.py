@@ -1,7 +1,9 @@
 from rest_framework.test import APITestCase
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils.timezone import localdate, timedelta
 from jobs.models import Job, SavedJob, Application
+from jobs.counters import change_application_status
 from jobs.tests.utils import create_user, create_recruiter_with_company
 
 class JobSeekerFlowTest(APITestCase):
@@ -72,3 +74,133 @@ class JobSeekerFlowTest(APITestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 1)
+
+
+class JobFilterOptionsTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_recruiter_with_company()
+        for title, location in [("Django Developer", "Pune"), ("Django Developer", "Delhi"), ("Designer", "Pune")]:
+            self.create_job(title, location)
+
+    def create_job(self, title, location):
+        return Job.objects.create(
+            title=title,
+            company=self.recruiter.company,
+            location=location,
+            ctc="8 LPA",
+            experience="1 year",
+            deadline=localdate() + timedelta(days=5),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+
+    def test_filter_options_with_counts(self):
+        response = self.client.get(reverse("filter-options"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["locations"], ["Delhi", "Pune"])
+        self.assertEqual(response.data["profiles"], ["Designer", "Django Developer"])
+        self.assertEqual(response.data["facets"]["location"][0], {"value": "Pune", "count": 2})
+        self.assertEqual(response.data["facets"]["job_type"], [{"value": "Full-time", "count": 3}])
+
+    def test_filter_options_limit(self):
+        response = self.client.get(reverse("filter-options"), {"limit": 1})
+
+        self.assertEqual(response.data["profiles"], ["Django Developer"])
+        self.assertEqual(len(response.data["facets"]["location"]), 1)
+
+    def test_filter_options_cached_until_job_changes(self):
+        url = reverse("filter-options")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job("QA Engineer", "Noida")
+        response = self.client.get(url)
+        self.assertIn("Noida", response.data["locations"])
+
+
+class ConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.jobseeker = create_user("poller@test.com", "jobseeker")
+        self.recruiter = create_recruiter_with_company()
+        self.job = Job.objects.create(
+            title="Django Developer",
+            company=self.recruiter.company,
+            location="Bangalore",
+            ctc="8 LPA",
+            experience="1 year",
+            deadline=localdate() + timedelta(days=5),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+        self.client.force_authenticate(self.jobseeker)
+
+    def test_job_detail_etag_and_last_modified(self):
+        url = reverse("job-detail", args=[self.job.id])
+        response = self.client.get(url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        # saving the job flips is_saved, so the old validator must not match
+        self.client.post(reverse("save-job", args=[self.job.id]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["is_saved"])
+
+    def test_saved_jobs_etag_changes_with_the_set(self):
+        url = reverse("saved-jobs")
+        SavedJob.objects.create(user=self.jobseeker, job=self.job)
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.delete(reverse("save-job", args=[self.job.id]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_saving_does_not_touch_the_shared_job(self):
+        updated_at = self.job.updated_at
+        self.client.post(reverse("save-job", args=[self.job.id]))
+        self.client.delete(reverse("save-job", args=[self.job.id]))
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.updated_at, updated_at)
+
+    def test_saved_jobs_etag_changes_with_a_row_on_the_page(self):
+        url = reverse("saved-jobs")
+        SavedJob.objects.create(user=self.jobseeker, job=self.job)
+        etag = self.client.get(url, {"cursor": ""})["ETag"]
+
+        self.assertEqual(self.client.get(url, {"cursor": ""}, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.recruiter.company.name = "Renamed Inc"
+        self.recruiter.company.save()
+        response = self.client.get(url, {"cursor": ""}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["company_name"], "Renamed Inc")
+
+    def test_applied_jobs_etag_changes_with_status(self):
+        url = reverse("applied-jobs")
+        application = Application.objects.create(applicant=self.jobseeker.profile, job=self.job)
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        change_application_status(application, Application.Status.SHORTLISTED)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
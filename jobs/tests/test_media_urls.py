@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+import cloudinary
+from cloudinary_storage.storage import MediaCloudinaryStorage
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+
+from jobs.models import Company, Job
+from jobs.tests.utils import create_recruiter_with_company, create_user
+from joblane.media import MEDIA_URL_TTL, absolute_media_url, clear_media_urls, media_url, media_url_stats
+
+LOGO_URL = "http://testserver/media/company_logos/acme.png"
+
+
+class MediaUrlTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        clear_media_urls()
+
+    def test_job_list_resolves_each_logo_once(self):
+        recruiter = create_recruiter_with_company()
+        Company.objects.filter(owner=recruiter).update(logo="company_logos/acme.png")
+        for i in range(3):
+            Job.objects.create(
+                title=f"Engineer {i}",
+                company=recruiter.company,
+                location="Remote",
+                deadline=localdate() + timedelta(days=5),
+                job_type="Full-time",
+                description="Test job",
+                created_by=recruiter,
+            )
+
+        response = self.client.get(reverse("job-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([job["company_logo"] for job in response.data["results"]], [LOGO_URL] * 3)
+        self.assertEqual(media_url_stats()["misses"], 1)
+        self.assertEqual(media_url_stats()["hits"], 2)
+
+    def test_entries_expire(self):
+        logo = Company(logo="company_logos/acme.png").logo
+        with patch("joblane.media.time.monotonic", return_value=0):
+            media_url(logo)
+            media_url(logo)
+        with patch("joblane.media.time.monotonic", return_value=MEDIA_URL_TTL + 1):
+            media_url(logo)
+        self.assertEqual(media_url_stats()["misses"], 2)
+
+    def test_cloudinary_transformation(self):
+        logo = Company(logo="company_logos/acme.png").logo
+        logo.storage = MediaCloudinaryStorage()
+        request = RequestFactory().get("/")
+
+        with patch.object(cloudinary.config(), "cloud_name", "demo"):
+            self.assertEqual(
+                absolute_media_url(logo, request, (("width", 96), ("crop", "fill"))),
+                "https://res.cloudinary.com/demo/image/upload/c_fill,w_96/v1/company_logos/acme.png",
+            )
+            self.assertEqual(media_url(logo), "https://res.cloudinary.com/demo/image/upload/v1/company_logos/acme.png")
+        self.assertIsNone(media_url(Company().logo))
+
+    def test_local_storage_urls_are_made_absolute(self):
+        logo = Company(logo="company_logos/acme.png").logo
+        request = RequestFactory().get("/")
+
+        self.assertEqual(absolute_media_url(logo, request), LOGO_URL)
+        with self.assertRaises(ValueError):
+            media_url(logo, (("width", 96),))
+
+    def test_profile_urls(self):
+        user = create_user("seeker@test.com", "jobseeker")
+        user.profile.profile_pic = "profiles/me.png"
+        user.profile.save()
+        self.client.force_authenticate(user)
+
+        response = self.client.get(reverse("user-profile"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["profile_pic"], "http://testserver/media/profiles/me.png")
+        self.assertIsNone(response.data["resume"])
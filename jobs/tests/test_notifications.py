@@ -0,0 +1,158 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+
+from accounts.email_service import send_batch_email
+from jobs.models import Application, Job, StatusNotification
+from jobs.notifications import purge_failed_notifications, send_due_notifications
+from jobs.tests.utils import create_recruiter_with_company, create_user
+
+
+@override_settings(EMAIL_PROVIDER="console")
+class StatusNotificationTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.job = Job.objects.create(
+            title="Python Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            ctc="12 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            created_by=self.recruiter
+        )
+        self.applications = [
+            Application.objects.create(applicant=create_user(f"seeker{i}@test.com", "jobseeker").profile, job=self.job)
+            for i in range(3)
+        ]
+        self.client.force_authenticate(self.recruiter)
+
+    def set_status(self, application, value):
+        url = reverse("application-status", args=[application.id])
+        self.assertEqual(self.client.patch(url, {"status": value}, format="json").status_code, 200)
+
+    def make_due(self):
+        StatusNotification.objects.update(due_at=timezone.now() - timedelta(seconds=1))
+
+    def test_status_change_is_mailed_after_delay(self):
+        self.set_status(self.applications[0], "Shortlisted")
+
+        self.assertEqual(send_due_notifications(), (0, 0, 0))
+        self.make_due()
+        self.assertEqual(send_due_notifications(), (1, 0, 0))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["seeker0@test.com"])
+        self.assertIn("shortlisted for Python Dev", mail.outbox[0].subject)
+        self.assertFalse(StatusNotification.objects.exists())
+
+    def test_quick_changes_coalesce_to_latest_status(self):
+        self.set_status(self.applications[0], "Shortlisted")
+        self.set_status(self.applications[0], "Rejected")
+        self.set_status(self.applications[1], "Rejected")
+        self.set_status(self.applications[1], "Pending")
+        self.make_due()
+
+        self.assertEqual(send_due_notifications(), (1, 3, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("Update on your application", mail.outbox[0].subject)
+        self.assertFalse(StatusNotification.objects.exists())
+
+    def test_newer_change_not_yet_due_supersedes(self):
+        self.set_status(self.applications[0], "Shortlisted")
+        self.make_due()
+        self.set_status(self.applications[0], "Rejected")
+
+        self.assertEqual(send_due_notifications(), (0, 1, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_bulk_reject_sends_one_batch(self):
+        url = reverse("bulk-application-status")
+        ids = [application.id for application in self.applications]
+        response = self.client.post(url, {"ids": ids, "status": "Rejected"}, format="json")
+        self.assertEqual(response.data, {"updated": 3})
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.rejected_count, 3)
+
+        self.make_due()
+        with patch("jobs.notifications.send_batch_email", wraps=send_batch_email) as batch:
+            self.assertEqual(send_due_notifications(), (3, 0, 0))
+
+        batch.assert_called_once()
+        self.assertEqual(len(batch.call_args.kwargs["recipients"]), 3)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), [f"seeker{i}@test.com" for i in range(3)])
+
+    def test_bulk_update_ignores_other_recruiters_applications(self):
+        other = create_recruiter_with_company()
+        self.client.force_authenticate(other)
+        response = self.client.post(
+            reverse("bulk-application-status"),
+            {"ids": [self.applications[0].id], "status": "Rejected"},
+            format="json",
+        )
+        self.assertEqual(response.data, {"updated": 0})
+        self.assertFalse(StatusNotification.objects.exists())
+
+    def test_bulk_update_validates_ids(self):
+        response = self.client.post(
+            reverse("bulk-application-status"), {"ids": ["x"], "status": "Rejected"}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(
+            reverse("bulk-application-status"), {"ids": [True], "status": "Rejected"}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    @patch("jobs.notifications.send_batch_email", side_effect=ConnectionError("down"))
+    def test_failed_batch_is_retried_later(self, _):
+        self.set_status(self.applications[0], "Rejected")
+        self.make_due()
+
+        with self.assertLogs("jobs.notifications", "ERROR"):
+            self.assertEqual(send_due_notifications(), (0, 0, 1))
+
+        notification = StatusNotification.objects.get()
+        self.assertEqual(notification.state, StatusNotification.State.PENDING)
+        self.assertEqual(notification.attempts, 1)
+        self.assertIsNone(notification.claim_token)
+        self.assertGreater(notification.due_at, timezone.now())
+
+    def test_failed_rows_are_purged_after_retention(self):
+        self.set_status(self.applications[0], "Rejected")
+        self.set_status(self.applications[1], "Rejected")
+        StatusNotification.objects.update(state=StatusNotification.State.FAILED)
+        StatusNotification.objects.filter(application=self.applications[0]).update(
+            due_at=timezone.now() - timedelta(days=8)
+        )
+
+        self.assertEqual(purge_failed_notifications(), 1)
+        self.assertEqual(StatusNotification.objects.get().application_id, self.applications[1].id)
+
+    @override_settings(EMAIL_PROVIDER="brevo")
+    @patch("accounts.email_service.BREVO_BATCH_SIZE", 2)
+    @patch("accounts.email_service.http.post")
+    def test_brevo_uses_message_versions(self, post):
+        post.return_value.status_code = 201
+        recipients = [{"email": f"u{i}@test.com", "name": "U", "params": {"name": "U"}} for i in range(3)]
+
+        results = send_batch_email(
+            subject="Hi", text_content="Hi {{ params.name }}", html_content="<p>Hi</p>", recipients=recipients
+        )
+
+        self.assertEqual(results, [True] * 3)
+        self.assertEqual(post.call_count, 2)
+        payload = post.call_args_list[0].kwargs["json"]
+        self.assertEqual(payload["textContent"], "Hi {{ params.name }}")
+        self.assertEqual(
+            payload["messageVersions"][0],
+            {"to": [{"email": "u0@test.com", "name": "U"}], "params": {"name": "U"}},
+        )
@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from jobs.parsing import parse_ctc, parse_experience
+
+
+class ParseExperienceTest(SimpleTestCase):
+
+    def test_formats(self):
+        cases = {
+            "Fresher": (0, 0),
+            "0 years": (0, 0),
+            "0-1 years": (0, 1),
+            "0 to 2 yrs": (0, 2),
+            "0+": (0, None),
+            "1-3 years": (1, 3),
+            "2 years": (2, 2),
+            "5+ years": (5, None),
+            "6 months": (0, 1),
+            "Any": (None, None),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_experience(text), expected)
+
+    def test_out_of_range(self):
+        self.assertEqual(parse_experience("100000 years"), (None, None))
+        self.assertEqual(parse_experience("2-99999 years"), (None, None))
+        self.assertEqual(parse_experience("60+ years"), (60, None))
+
+
+class ParseCtcTest(SimpleTestCase):
+
+    def test_formats(self):
+        cases = {
+            "10 LPA": ("10", "10"),
+            "4-6 LPA": ("4", "6"),
+            "₹ 8,00,000": ("8", "8"),
+            "15k/month": ("1.8", "1.8"),
+            "Rs 50000 per month": ("6", "6"),
+            "12 LPA+": ("12", None),
+        }
+        for text, (low, high) in cases.items():
+            with self.subTest(text=text):
+                expected = (Decimal(low), Decimal(high) if high else None)
+                self.assertEqual(parse_ctc(text), expected)
+
+    def test_unparseable(self):
+        self.assertEqual(parse_ctc("Not disclosed"), (None, None))
+
+    def test_out_of_range(self):
+        self.assertEqual(parse_ctc("1,00,00,00,00,000"), (None, None))
+        self.assertEqual(parse_ctc("1-2000 crore"), (None, None))
+        self.assertEqual(parse_ctc("999 crore"), (Decimal("99900"), Decimal("99900")))
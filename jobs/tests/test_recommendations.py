@@ -0,0 +1,101 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.timezone import localdate, timedelta
+from rest_framework.test import APITestCase
+from jobs.models import Job, JobSkill
+from jobs.tests.utils import create_user, create_recruiter_with_company
+
+
+class RecommendedJobsTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.jobseeker = create_user("seeker@test.com", "jobseeker")
+        profile = self.jobseeker.profile
+        profile.skills = ["Python", "Django", " SQL "]
+        profile.location = "Pune"
+        profile.save()
+
+        self.url = reverse("recommended-jobs")
+        self.client.force_authenticate(self.jobseeker)
+
+    def create_job(self, title, skills, location="Bangalore", days_left=10):
+        return Job.objects.create(
+            title=title,
+            company=self.recruiter.company,
+            location=location,
+            ctc="10 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=days_left),
+            job_type="Full-time",
+            description="Test",
+            skills=skills,
+            created_by=self.recruiter
+        )
+
+    def index_of(self, job):
+        return set(JobSkill.objects.filter(job=job).values_list("skill", "deadline"))
+
+    def test_index_follows_job_skills_and_deadline(self):
+        job = self.create_job("Backend", ["Python", "python", "Docker "])
+        self.assertEqual(self.index_of(job), {("python", job.deadline), ("docker", job.deadline)})
+
+        job.skills = ["Python", "Kubernetes"]
+        job.deadline = localdate() + timedelta(days=30)
+        job.save()
+        self.assertEqual(self.index_of(job), {("python", job.deadline), ("kubernetes", job.deadline)})
+
+        job.delete()
+        self.assertFalse(JobSkill.objects.exists())
+
+    def test_ranks_by_skill_overlap_and_location(self):
+        best = self.create_job("Django Dev", ["python", "django", "sql"])
+        local = self.create_job("Python Dev", ["python", "aws"], location="Pune")
+        partial = self.create_job("Data", ["python", "aws"])
+        self.create_job("Frontend", ["react", "css"])
+        self.create_job("Expired", ["python", "django", "sql"], days_left=-1)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        self.assertEqual([r["job"]["id"] for r in results], [best.id, local.id, partial.id])
+        self.assertEqual(results[0]["matched_skills"], ["django", "python", "sql"])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_limit(self):
+        for i in range(3):
+            self.create_job(f"Job {i}", ["python"])
+
+        response = self.client.get(self.url, {"limit": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(self.url, {"limit": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_without_skills_returns_newest_jobs(self):
+        profile = self.jobseeker.profile
+        profile.skills = []
+        profile.save()
+        older = self.create_job("Old", ["react"])
+        newer = self.create_job("New", [])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual([r["job"]["id"] for r in response.data["results"]], [newer.id, older.id])
+
+    def test_recruiter_forbidden(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_rebuild_command(self):
+        job = self.create_job("Backend", ["python"])
+        Job.objects.filter(pk=job.pk).update(skills=["go", "rust"])
+
+        out = StringIO()
+        call_command("rebuild_job_skill_index", stdout=out)
+        self.assertIn("Indexed skills for 1 jobs.", out.getvalue())
+
+        self.assertEqual({skill for skill, _ in self.index_of(job)}, {"go", "rust"})
@@ -1,7 +1,13 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from django.urls import reverse
-from django.utils.timezone import localdate, timedelta
-from jobs.models import Job, Application
+from django.utils.timezone import localdate, now, timedelta
+from jobs.models import Job, Application, FitScoreTask
+from jobs.fit import FitScoreQueue, fit_score
 from jobs.tests.utils import create_user, create_recruiter_with_company
 
 class RecruiterFlowTest(APITestCase):
@@ -36,6 +42,50 @@ class RecruiterFlowTest(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 1)
 
+    def test_list_applicants_cursor_pagination(self):
+        url = reverse("job-applicants", args=[self.job.id])
+        response = self.client.get(url, {"cursor": ""})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([a["id"] for a in response.data["results"]], [self.application.id])
+        self.assertIsNone(response.data["next"])
+
+    def walk_cursor(self, url, params):
+        seen = []
+        response = self.client.get(url, {**params, "cursor": "", "page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            seen += [item["id"] for item in response.data["results"]]
+            if not response.data["next"]:
+                return seen
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_pages_follow_requested_ordering(self):
+        for days in (3, 7, 3, 20):
+            job = Job.objects.create(
+                title=f"Job {days}",
+                company=self.recruiter.company,
+                location="Remote",
+                deadline=localdate() + timedelta(days=days),
+                job_type="Full-time",
+                description="Test",
+                created_by=self.recruiter
+            )
+            Application.objects.create(applicant=create_user(f"c{job.id}@test.com", "jobseeker").profile, job=self.job)
+        url = reverse("recruiter-jobs-list")
+        jobs = Job.objects.filter(created_by=self.recruiter)
+
+        self.assertEqual(self.walk_cursor(url, {"ordering": "deadline"}), list(jobs.order_by("deadline", "id").values_list("id", flat=True)))
+        self.assertEqual(self.walk_cursor(url, {"ordering": "-deadline"}), list(jobs.order_by("-deadline", "-id").values_list("id", flat=True)))
+
+        Application.objects.filter(pk=self.application.pk).update(status="Shortlisted")
+        url = reverse("job-applicants", args=[self.job.id])
+        applications = Application.objects.filter(job=self.job)
+        self.assertEqual(
+            self.walk_cursor(url, {"ordering": "status,-applied_at"}),
+            list(applications.order_by("status", "-applied_at", "id").values_list("id", flat=True)),
+        )
+
     def test_update_application_status(self):
         url = reverse("application-status", args=[self.application.id])
         response = self.client.patch(
@@ -56,3 +106,123 @@ class RecruiterFlowTest(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 403)
+
+
+class ApplicantFitTest(APITestCase):
+
+    def setUp(self):
+        self.recruiter = create_recruiter_with_company()
+        self.job = Job.objects.create(
+            title="Backend Dev",
+            company=self.recruiter.company,
+            location="Remote",
+            ctc="12 LPA",
+            experience="2 years",
+            deadline=localdate() + timedelta(days=10),
+            job_type="Full-time",
+            description="Test",
+            skills=["Python", "Django", "Postgres", "Docker"],
+            requirements=["Strong Python.", "Experience with Java or Go"],
+            created_by=self.recruiter
+        )
+        self.url = reverse("job-applicants", args=[self.job.id])
+        self.client.force_authenticate(self.recruiter)
+
+    def apply(self, email, skills):
+        seeker = create_user(email, "jobseeker")
+        seeker.profile.skills = skills
+        seeker.profile.save()
+        return Application.objects.create(applicant=seeker.profile, job=self.job)
+
+    def fit_of(self, application):
+        application.refresh_from_db()
+        return application.fit_score
+
+    def test_fit_score_formula(self):
+        self.assertEqual(fit_score({"python"}, {"python", "django"}, ["strong python"]), 65)
+        # "java" must not match "javascript"
+        self.assertEqual(fit_score({"javascript"}, set(), ["java or go"]), 0)
+        self.assertEqual(fit_score(set(), {"python"}, []), 0)
+
+    def test_ordering_by_fit(self):
+        weak = self.apply("weak@test.com", ["React"])
+        strong = self.apply("strong@test.com", ["python", "django", "postgres", "docker", "go"])
+        medium = self.apply("medium@test.com", ["python"])
+
+        response = self.client.get(self.url, {"ordering": "fit"})
+        self.assertEqual([a["id"] for a in response.data["results"]], [strong.id, medium.id, weak.id])
+        self.assertEqual(response.data["results"][0]["fit_score"], 100)
+
+        response = self.client.get(self.url, {"ordering": "fit", "cursor": "", "page_size": 2})
+        self.assertEqual([a["id"] for a in response.data["results"]], [strong.id, medium.id])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([a["id"] for a in response.data["results"]], [weak.id])
+
+    def test_scores_follow_skill_changes(self):
+        application = self.apply("seeker@test.com", ["react"])
+        self.assertEqual(self.fit_of(application), 0)
+
+        profile = application.applicant
+        profile.skills = ["python", "django"]
+        profile.save()
+        self.assertEqual(self.fit_of(application), 50)
+
+        self.job.skills = ["react"]
+        self.job.save()
+        self.refresh_fit_scores()
+        self.assertEqual(self.fit_of(application), 15)
+
+        self.job.requirements = []
+        self.job.save(update_fields=["requirements"])
+        self.refresh_fit_scores()
+        self.assertEqual(self.fit_of(application), 0)
+
+    def refresh_fit_scores(self):
+        out = StringIO()
+        call_command("refresh_fit_scores", "--once", stdout=out)
+        return out.getvalue()
+
+    def test_job_edit_queues_rescore(self):
+        application = self.apply("seeker@test.com", ["python", "django"])
+        self.assertEqual(self.fit_of(application), 50)
+
+        response = self.client.patch(reverse("recruiter-jobs-detail", args=[self.job.id]), {"skills": ["python"]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.job.refresh_from_db()
+        self.job.requirements = ["Strong Python."]
+        self.job.save()
+
+        # scored off the request, once for both pending edits
+        self.assertEqual(self.fit_of(application), 50)
+        self.assertEqual(FitScoreTask.objects.filter(job=self.job).count(), 1)
+
+        self.assertIn("1 scores changed", self.refresh_fit_scores())
+        self.assertEqual(self.fit_of(application), 100)
+        self.assertFalse(FitScoreTask.objects.exists())
+
+        self.job.title = "Backend Engineer"
+        self.job.save()
+        self.assertFalse(FitScoreTask.objects.exists())
+
+    def test_stale_task_is_requeued(self):
+        application = self.apply("seeker@test.com", ["python", "django"])
+        self.job.skills = ["python"]
+        self.job.save()
+
+        queue = FitScoreQueue()
+        task = queue.claim_next()
+        self.assertEqual(task.status, FitScoreTask.Status.RUNNING)
+        self.assertIsNone(queue.claim_next())
+        self.assertEqual(queue.requeue_stale(), 0)
+
+        FitScoreTask.objects.filter(pk=task.pk).update(started_at=now() - timedelta(minutes=11))
+        self.assertIn("1 scores changed", self.refresh_fit_scores())
+        self.assertEqual(self.fit_of(application), 85)
+        self.assertFalse(FitScoreTask.objects.exists())
+
+    def test_job_save_reads_previous_row_once(self):
+        self.job.title = "Backend Engineer"
+        with CaptureQueriesContext(connection) as queries:
+            self.job.save()
+        rereads = [q["sql"] for q in queries if q["sql"].startswith("SELECT") and 'FROM "jobs_job"' in q["sql"]]
+        self.assertEqual(len(rereads), 1)
@@ -1,7 +1,8 @@
 from django.urls import path
-from jobs.views.common_views import JobListAPIView, JobDetailAPIView
+from jobs.views.common_views import JobListAPIView, JobDetailAPIView, JobListCacheStatsView
 
 urlpatterns = [
     path('jobs/', JobListAPIView.as_view(), name='job-list'),
     path('jobs/<int:id>/', JobDetailAPIView.as_view(), name='job-detail'),
+    path('jobs/cache-stats/', JobListCacheStatsView.as_view(), name='job-list-cache-stats'),
 ]
@@ -1,12 +1,18 @@
 from django.urls import path
+from rest_framework.routers import SimpleRouter
 from jobs.views.jobseeker_views import (
     ApplyToJobView,
     AppliedJobsView,
     SaveJobView,
     SavedJobsView,
-    JobFilterOptionsView
+    JobFilterOptionsView,
+    RecommendedJobsView,
+    SavedSearchViewSet,
 )
 
+router = SimpleRouter()
+router.register(r'saved-searches', SavedSearchViewSet, basename='saved-searches')
+
 urlpatterns = [
     path('jobs/<int:id>/apply/', ApplyToJobView.as_view(), name='apply-job'),
     path('applied/', AppliedJobsView.as_view(), name='applied-jobs'),
@@ -14,4 +20,7 @@ urlpatterns = [
     path('jobs/<int:id>/save/', SaveJobView.as_view(), name='save-job'),
     path('saved/', SavedJobsView.as_view(), name='saved-jobs'),
     path('filters/', JobFilterOptionsView.as_view(), name="filter-options"),
+    path('jobs/recommended/', RecommendedJobsView.as_view(), name='recommended-jobs'),
 ]
+
+urlpatterns += router.urls
@@ -5,9 +5,15 @@ from jobs.views.recruiter_views import (
     JobApplicantsView,
     ApplicantDetailView,
     UpdateApplicationStatusView,
+    BulkUpdateApplicationStatusView,
     CompanyAPIView,
 )
-from jobs.views.export import export_applicants
+from jobs.views.export import (
+    ExportApplicantsView,
+    ExportJobCreateView,
+    ExportJobDetailView,
+    ExportJobDownloadView,
+)
 
 router = DefaultRouter()
 router.register(r'recruiter/jobs', RecruiterJobViewSet, basename='recruiter-jobs')
@@ -16,8 +22,12 @@ urlpatterns = [
     path('recruiter/jobs/<int:job_id>/applicants/', JobApplicantsView.as_view(), name='job-applicants'),
     path('recruiter/applicants/<int:pk>/', ApplicantDetailView.as_view(), name='applicant-detail'),
     path('recruiter/applicants/<int:pk>/status/', UpdateApplicationStatusView.as_view(), name='application-status'),
+    path('recruiter/applicants/status/', BulkUpdateApplicationStatusView.as_view(), name='bulk-application-status'),
     path("recruiter/company/", CompanyAPIView.as_view(), name="company-profile"),
-    path("recruiter/applicants/export/", export_applicants, name="export-applicants"),
+    path("recruiter/applicants/export/", ExportApplicantsView.as_view(), name="export-applicants"),
+    path("recruiter/exports/", ExportJobCreateView.as_view(), name="export-jobs"),
+    path("recruiter/exports/<int:pk>/", ExportJobDetailView.as_view(), name="export-job-detail"),
+    path("recruiter/exports/<int:pk>/download/", ExportJobDownloadView.as_view(), name="export-job-download"),
 
 ]
 
@@ -1,34 +1,90 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.timezone import localdate
 from django.db import models
-from django.db.models import Count, Exists, OuterRef
+from django.db.models import Exists, OuterRef
 from rest_framework import generics
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from jobs.filters import JobFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter
+from rest_framework.exceptions import ValidationError
 
 
 
 # local imports
 from jobs.serializers.common_serializers import JobSerializer, JobBasicSerializer
 from jobs.models import Job, Application, SavedJob
-from jobs.pagination import StandardPagination
+from jobs.pagination import OptionalKeysetPagination
+from jobs.facets import FACETS, facet_counts
+from jobs.cache import JOB_LIST_NAMESPACE, cache_stats, job_list_cache_key, record_cache_lookup
+from jobs.conditional import ConditionalGetMixin, ConditionalListMixin
+from accounts.tokens import user_profile_id
 
 
-class JobListAPIView(generics.ListAPIView):
+class JobListAPIView(ConditionalListMixin, generics.ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = JobBasicSerializer
-    pagination_class = StandardPagination
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    fingerprint_timestamps = ('updated_at', 'company__updated_at')
     filter_backends = [DjangoFilterBackend, SearchFilter]  # 👈 REQUIRED
 
     filterset_class = JobFilter
     search_fields = ["title", "company__name", "location"]
 
     def get_queryset(self):
-        return Job.objects.filter(deadline__gte=localdate()).select_related('company').annotate(applicant_count=Count('applications', distinct=True)).order_by('-created_at')
+        return Job.objects.filter(deadline__gte=localdate()).select_related('company').order_by('-created_at')
 
+    def get_facets(self):
+        names = [n.strip() for n in self.request.query_params.get('facets', '').split(',') if n.strip()]
+        unknown = set(names) - set(FACETS)
+        if unknown:
+            raise ValidationError({"facets": f"Unknown facets: {', '.join(sorted(unknown))}. Choose from {', '.join(FACETS)}."})
+        return list(dict.fromkeys(names))
 
-class JobDetailAPIView(generics.RetrieveAPIView):
+    def get_cache_key(self):
+        # only anonymous traffic shares cached pages
+        if not settings.JOB_LIST_CACHE_TIMEOUT or self.request.user.is_authenticated:
+            return None
+        return job_list_cache_key(self.request)
+
+    def list(self, request, *args, **kwargs):
+        cache_key = self.get_cache_key()
+        if cache_key:
+            cached = cache.get(cache_key)
+            record_cache_lookup(JOB_LIST_NAMESPACE, hit=cached is not None)
+            if cached is not None:
+                # entries die with the generation, so the stored ETag is still valid
+                self.etag = cached['etag']
+                return self.conditional_response() or Response(cached['data'], headers={'X-Cache': 'HIT'})
+
+        facets = self.get_facets()
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 304:
+            return response
+
+        if facets:
+            # same filter + search backends as the page, so counts match the results
+            response.data['facets'] = facet_counts(self.filter_queryset(self.get_queryset()), facets)
+
+        if cache_key:
+            cache.set(cache_key, {'data': response.data, 'etag': self.etag}, settings.JOB_LIST_CACHE_TIMEOUT)
+            response['X-Cache'] = 'MISS'
+
+        return response
+
+
+class JobListCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats(JOB_LIST_NAMESPACE))
+
+
+class JobDetailAPIView(ConditionalGetMixin, generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = JobSerializer
     lookup_field = 'id'
@@ -36,19 +92,14 @@ class JobDetailAPIView(generics.RetrieveAPIView):
     def get_queryset(self):
         user = self.request.user
 
-        qs = (
-            Job.objects
-            .select_related('company', 'created_by')
-            .annotate(
-                applicants_count=Count('applications', distinct=True),
-            )
-        )
+        qs = Job.objects.select_related('company', 'created_by')
 
-        if user.is_authenticated and hasattr(user, 'profile'):
+        profile_id = user_profile_id(user) if user.is_authenticated else None
+        if profile_id is not None:
             qs = qs.annotate(
                 has_applied=Exists(
                     Application.objects.filter(
-                        applicant=user.profile,
+                        applicant_id=profile_id,
                         job=OuterRef('pk')
                     )
                 ),
@@ -66,3 +117,16 @@ class JobDetailAPIView(generics.RetrieveAPIView):
             )
 
         return qs
+
+    def get_validators(self, instance=None):
+        last_modified = max(instance.updated_at, instance.company.updated_at)
+        return [instance.pk, last_modified, instance.has_applied, instance.is_saved], last_modified
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        not_modified = self.not_modified_response(instance)
+        if not_modified is not None:
+            return not_modified
+
+        return Response(self.get_serializer(instance).data)
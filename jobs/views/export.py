@@ -1,50 +1,80 @@
-from rest_framework.decorators import api_view, permission_classes
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from django.http import HttpResponse
-import openpyxl
-from django.utils.timezone import localtime
-from jobs.models import Application
-
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def export_applicants(request):
-    job_id = request.GET.get("job_id")
-    status = request.GET.get("status")
-
-    qs = Application.objects.select_related("applicant", "job")
-
-    if job_id:
-        qs = qs.filter(job_id=job_id)
-
-    if status and status.lower() != "all":
-        qs = qs.filter(status=status)
-
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Applicants"
-
-    ws.append([
-        "Applicant Name",
-        "Email",
-        "Phone",
-        "Job Title",
-        "Status",
-        "Applied On",
-    ])
-
-    for app in qs:
-        ws.append([
-            app.applicant.name,
-            app.applicant.user.email,
-            app.applicant.phone,
-            app.job.title,
-            app.status,
-            localtime(app.applied_at).strftime("%d %b %Y"),
-        ])
-
-    response = HttpResponse(
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
-    response["Content-Disposition"] = 'attachment; filename="applicants.xlsx"'
-    wb.save(response)
-    return response
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from jobs.background_exports import request_export
+from jobs.exports import (
+    APPLICANTS_EXPORT,
+    EXPORT_FORMATS,
+    EXPORTS,
+    ExportNegotiation,
+    export_response,
+    validate_export_format,
+)
+from jobs.models import ExportJob
+from jobs.permissions import IsRecruiter
+from jobs.serializers.recruiter_serializers import ExportJobSerializer
+
+
+class ExportApplicantsView(APIView):
+    """?job_id=&status=&format=xlsx|csv|ndjson"""
+    permission_classes = [IsAuthenticated, IsRecruiter]
+    content_negotiation_class = ExportNegotiation
+
+    def get(self, request):
+        return export_response(request, APPLICANTS_EXPORT)
+
+
+class ExportJobCreateView(APIView):
+    """
+    Queue a background export: {"kind": "applicants"|"jobs", "format": ..., <filters>}.
+    Identical requests get the queued, running or still fresh export back.
+    """
+    permission_classes = [IsAuthenticated, IsRecruiter]
+
+    def post(self, request):
+        spec = EXPORTS.get(request.data.get("kind"))
+        if spec is None:
+            raise ValidationError({"kind": f"Choose one of: {', '.join(EXPORTS)}."})
+
+        export_format = validate_export_format(request.data.get("format"))
+        params = spec.clean_params(request.data)
+        # reject bad filters now rather than in the worker
+        spec.build_queryset(request.user, params)
+
+        export_job, created = request_export(request.user, spec.name, export_format, params)
+        return Response(
+            ExportJobSerializer(export_job, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+        )
+
+
+class ExportJobDetailView(APIView):
+    permission_classes = [IsAuthenticated, IsRecruiter]
+
+    def get(self, request, pk):
+        export_job = get_object_or_404(ExportJob, pk=pk, owner=request.user)
+        return Response(ExportJobSerializer(export_job, context={"request": request}).data)
+
+
+class ExportJobDownloadView(APIView):
+    permission_classes = [IsAuthenticated, IsRecruiter]
+
+    def get(self, request, pk):
+        export_job = get_object_or_404(ExportJob, pk=pk, owner=request.user)
+
+        # Done past expires_at counts too: the worker purges on its own schedule
+        if export_job.is_expired:
+            return Response({"message": "This export has expired."}, status=status.HTTP_410_GONE)
+        if export_job.status != ExportJob.Status.DONE:
+            return Response({"message": "Export is not ready."}, status=status.HTTP_409_CONFLICT)
+
+        return FileResponse(
+            export_job.file.open("rb"),
+            as_attachment=True,
+            filename=f"{export_job.kind}.{export_job.export_format}",
+            content_type=EXPORT_FORMATS[export_job.export_format],
+        )
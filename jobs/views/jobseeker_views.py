@@ -1,18 +1,23 @@
 from django.shortcuts import get_object_or_404
-from django.db.models import Count
+from django.db import transaction
 from django.utils.timezone import localdate
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework import generics,status
+from rest_framework import generics,status, viewsets
+from rest_framework.exceptions import ValidationError
 
 # local imports
-from jobs.models import Job, Application, SavedJob
-from jobs.serializers.jobseeker_serializers import AppliedJobSerializer
+from jobs.models import Job, Application, SavedJob, SavedSearch
+from jobs.serializers.jobseeker_serializers import AppliedJobSerializer, RecommendedJobSerializer, SavedSearchSerializer
 from jobs.serializers.common_serializers import JobBasicSerializer
 from jobs.permissions import IsJobSeeker
-from jobs.pagination import StandardPagination
+from jobs.pagination import OptionalKeysetPagination
+from jobs.facets import get_filter_options
+from jobs.conditional import ConditionalListMixin
+from jobs.recommendations import DEFAULT_LIMIT, recommend_jobs
+from accounts.tokens import user_profile, user_profile_id
 
 
 
@@ -20,9 +25,10 @@ class ApplyToJobView(APIView):
     permission_classes = [IsAuthenticated, IsJobSeeker]
 
     def post(self, request, id):
-        job = get_object_or_404(Job.objects.only('id', 'deadline'), id=id)
+        # skills / requirements feed the applicant's fit score (jobs.fit)
+        job = get_object_or_404(Job.objects.only('id', 'deadline', 'skills', 'requirements'), id=id)
 
-        profile = request.user.profile
+        profile = user_profile(request.user)
 
         if job.deadline < localdate():
             return Response({"message": "This job has expired."}, status=status.HTTP_400_BAD_REQUEST)
@@ -30,7 +36,9 @@ class ApplyToJobView(APIView):
         if not profile.resume:
             return Response({"message": "Please upload your resume before applying."}, status=status.HTTP_400_BAD_REQUEST)
 
-        _, created = Application.objects.get_or_create(applicant=profile, job=job)
+        # the counter update from jobs.signals commits together with the row
+        with transaction.atomic():
+            _, created = Application.objects.get_or_create(applicant=profile, job=job)
 
         if created:
             return Response({"message": "Applied successfully."}, status=status.HTTP_201_CREATED)
@@ -38,13 +46,15 @@ class ApplyToJobView(APIView):
         return Response({"message": "Already applied."}, status=status.HTTP_409_CONFLICT)
 
 
-class AppliedJobsView(generics.ListAPIView):
+class AppliedJobsView(ConditionalListMixin, generics.ListAPIView):
     serializer_class = AppliedJobSerializer
     permission_classes = [IsAuthenticated, IsJobSeeker]
-    pagination_class = StandardPagination
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ('-applied_at', '-id')
+    fingerprint_timestamps = ('updated_at', 'job__updated_at', 'job__company__updated_at')
 
     def get_queryset(self):
-        return (Application.objects.filter(applicant=self.request.user.profile).select_related('job'))
+        return (Application.objects.filter(applicant_id=user_profile_id(self.request.user)).select_related('job__company'))
 
 
 class SaveJobView(APIView):
@@ -82,28 +92,80 @@ class SaveJobView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class SavedJobsView(generics.ListAPIView):
+class SavedJobsView(ConditionalListMixin, generics.ListAPIView):
     serializer_class = JobBasicSerializer
     permission_classes = [IsAuthenticated, IsJobSeeker]
-    pagination_class = StandardPagination
-
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    fingerprint_timestamps = ('updated_at', 'company__updated_at')
 
     def get_queryset(self):
         return (
             Job.objects
             .filter(saved_by__user=self.request.user, deadline__gte=localdate())
             .select_related('company')
-            .annotate(applicant_count=Count('applications', distinct=True))
             .order_by('-created_at')
         )
 
 
+class SavedSearchViewSet(viewsets.ModelViewSet):
+    """Saved JobFilter queries; jobs.alerts emails a daily digest of new matches."""
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated, IsJobSeeker]
+    max_saved_searches = 20
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        if self.get_queryset().count() >= self.max_saved_searches:
+            raise ValidationError({"message": f"You can save up to {self.max_saved_searches} searches."})
+        serializer.save(user=self.request.user)
+
+
+class RecommendedJobsView(APIView):
+    permission_classes = [IsAuthenticated, IsJobSeeker]
+    max_limit = 50
+
+    def get_limit(self):
+        limit = self.request.query_params.get('limit', DEFAULT_LIMIT)
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        return min(max(limit, 1), self.max_limit)
+
+    def get(self, request):
+        ranked = recommend_jobs(user_profile(request.user), limit=self.get_limit())
+        serializer = RecommendedJobSerializer(
+            [{"job": job, "score": score, "matched_skills": matched} for job, score, matched in ranked],
+            many=True,
+        )
+        return Response({"results": serializer.data})
+
+
 class JobFilterOptionsView(APIView):
+    max_limit = 500
+
+    def get_limit(self):
+        limit = self.request.query_params.get('limit')
+        if limit is None:
+            return None
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        return min(max(limit, 1), self.max_limit)
 
     def get(self, request):
-        active_jobs = Job.objects.filter(deadline__gte=localdate())
+        limit = self.get_limit()
+        options = {field: values[:limit] for field, values in get_filter_options().items()}
 
         return Response({
-            "locations": sorted(active_jobs.values_list('location', flat=True).distinct()),
-            "profiles": sorted(active_jobs.values_list('title', flat=True).distinct()),
+            "locations": sorted(value for value, _ in options['location']),
+            "profiles": sorted(value for value, _ in options['title']),
+            "facets": {
+                field: [{"value": value, "count": count} for value, count in values]
+                for field, values in options.items()
+            },
         })
@@ -1,26 +1,32 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from rest_framework import generics, viewsets,status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.decorators import action
 
 # local import
 from jobs.models import Job, Application, Company
 from jobs.serializers.recruiter_serializers import ApplicationSerializer, BasicApplicationSerializer
 from jobs.serializers.common_serializers import JobSerializer, JobBasicSerializer, CompanySerializer
 from jobs.permissions import IsRecruiter, IsJobOwner
-from jobs.pagination import StandardPagination
+from jobs.pagination import OptionalKeysetPagination
+from jobs.counters import bulk_change_application_status, change_application_status
+from jobs.notifications import queue_status_notifications
+from jobs.filters import AliasOrderingFilter
+from jobs.exports import JOBS_EXPORT, ExportNegotiation, export_response
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count
 
 
 
 class RecruiterJobViewSet(viewsets.ModelViewSet):
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated, IsRecruiter]
-    pagination_class = StandardPagination
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ('-created_at', '-id')
     filter_backends = [SearchFilter, OrderingFilter]
 
     search_fields = ['title', 'company__name', 'location']
@@ -28,7 +34,7 @@ class RecruiterJobViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
     def get_queryset(self):
-        return Job.objects.filter(created_by=self.request.user).annotate(applicant_count=Count("applications")).select_related("company").order_by('-created_at')
+        return Job.objects.filter(created_by=self.request.user).select_related("company").order_by('-created_at')
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -43,19 +49,27 @@ class RecruiterJobViewSet(viewsets.ModelViewSet):
 
         serializer.save(created_by=user, company=user.company)
 
+    @action(detail=False, methods=['get'], content_negotiation_class=ExportNegotiation)
+    def export(self, request):
+        # ?search= / ?ordering= / ?format=, unpaginated (see jobs.exports)
+        return export_response(request, JOBS_EXPORT)
+
 
 class JobApplicantsView(generics.ListAPIView):
     serializer_class = BasicApplicationSerializer
     permission_classes = [IsAuthenticated, IsRecruiter, IsJobOwner]
-    pagination_class = StandardPagination
-    filter_backends = [SearchFilter, OrderingFilter]
+    pagination_class = OptionalKeysetPagination
+    filter_backends = [SearchFilter, AliasOrderingFilter]
     search_fields = [
     'applicant__user__first_name',
     'applicant__user__last_name',
     'applicant__user__email',
     ]
-    ordering_fields = ['applied_at', 'status']
+    ordering_fields = ['applied_at', 'status', 'fit_score', 'id']
+    ordering_aliases = {'fit': ('-fit_score', '-id'), '-fit': ('fit_score', 'id')}
     ordering = ['-applied_at']
+    # ?cursor= pages follow ?ordering= (KeysetPagination seeks on the active ordering)
+    keyset_ordering = ('-applied_at', '-id')
 
 
     def get_job(self):
@@ -85,12 +99,39 @@ class UpdateApplicationStatusView(generics.UpdateAPIView):
         if status_value not in Application.Status.values:
             return Response({"error": "Invalid status value"}, status=status.HTTP_400_BAD_REQUEST)
 
-        application.status = status_value
-        application.save()
+        with transaction.atomic():
+            if change_application_status(application, status_value):
+                queue_status_notifications([application])
 
         return Response(self.get_serializer(application).data, status=status.HTTP_200_OK)
 
 
+class BulkUpdateApplicationStatusView(generics.GenericAPIView):
+    """{"ids": [...], "status": "Rejected"} for applications to the recruiter's own jobs."""
+    permission_classes = [IsAuthenticated, IsRecruiter]
+    max_ids = 1000
+
+    def post(self, request):
+        ids = request.data.get("ids")
+        status_value = request.data.get("status")
+
+        if status_value not in Application.Status.values:
+            return Response({"error": "Invalid status value"}, status=status.HTTP_400_BAD_REQUEST)
+        if (
+            not isinstance(ids, list) or not 0 < len(ids) <= self.max_ids
+            # bool is an int subclass: true / false are not ids
+            or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids)
+        ):
+            raise ValidationError({"ids": f"Provide a list of 1 to {self.max_ids} application ids."})
+
+        applications = Application.objects.filter(pk__in=ids, job__created_by=request.user)
+        with transaction.atomic():
+            changed = bulk_change_application_status(applications, status_value)
+            queue_status_notifications(changed)
+
+        return Response({"updated": len(changed)}, status=status.HTTP_200_OK)
+
+
 class CompanyAPIView(generics.RetrieveUpdateAPIView):
     serializer_class = CompanySerializer
     permission_classes = [IsAuthenticated, IsRecruiter]